@@ -1,5 +1,6 @@
+from .async_collector_center_api import AsyncCollectorCenterAPI
 from .collector_center_api import CollectorCenterAPI
 
-__all__ = ["CollectorCenterAPI"]
+__all__ = ["AsyncCollectorCenterAPI", "CollectorCenterAPI"]
 
 
@@ -1,4 +1,18 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+from ._collector_center_cache import _ConditionalCache
+from ._collector_center_cassette import CASSETTE_MODES, _CassetteRecorder, _CassetteReplayer
+from ._collector_center_decoding import _make_json_decoder
+from ._collector_center_resilience import _CircuitBreaker, _LatencyTracker
+from ._collector_center_scheduler import _RequestScheduler
+from ._collector_center_transport import (
+    _ACCEPT_ENCODING,
+    _UNDECODED,
+    _AsyncPooledTransport,
+    _PooledTransport,
+    _TransferCounters,
+    _TransportResponse,
+)
 
 
 class _CollectorCenterBase:
@@ -10,6 +24,22 @@ class _CollectorCenterBase:
         timeout_seconds: Optional[float] = 10.0,
         api_key: Optional[str] = None,
         reports_limit_default: Optional[int] = 25,
+        pool_size: Optional[int] = 16,
+        keep_alive: bool = True,
+        max_concurrency: Optional[int] = 16,
+        reports_batch_size: Optional[int] = 0,
+        ids_chunk_size: Optional[int] = None,
+        ids_max_concurrency: Optional[int] = None,
+        json_decoder: Optional[str] = None,
+        adaptive_timeout: bool = True,
+        breaker_threshold: Optional[int] = 5,
+        breaker_cooldown: Optional[float] = 30.0,
+        rate_limit: Optional[float] = None,
+        rate_burst: Optional[float] = None,
+        transport: Optional[Any] = None,
+        cassette_mode: Optional[str] = None,
+        cassette_path: Optional[str] = None,
+        cassette_latency_scale: Optional[float] = 0.0,
     ) -> None:
         if not base_url or not str(base_url).strip():
             raise ValueError("Collector base_url is required. Provide it via --collector.url")
@@ -22,8 +52,167 @@ class _CollectorCenterBase:
         self.api_key = str(api_key).strip()
         self.reports_limit_default = int(reports_limit_default) if reports_limit_default is not None else 25
 
+        self.pool_size = max(1, int(pool_size)) if pool_size is not None else 16
+        self.keep_alive = bool(keep_alive)
+        # An injected transport (e.g. ``fake_collector.FakeCollectorTransport``)
+        # replaces the pooled HTTP transport for benchmarks and local runs.
+        self._transport = transport or _PooledTransport(
+            pool_size=self.pool_size, keep_alive=self.keep_alive
+        )
+        self.cassette_mode = str(cassette_mode or "off").lower()
+        if self.cassette_mode not in CASSETTE_MODES:
+            raise ValueError(
+                f"Unknown collector cassette mode '{cassette_mode}' (expected one of {', '.join(CASSETTE_MODES)})"
+            )
+        if self.cassette_mode != "off" and not cassette_path:
+            raise ValueError("Collector cassette_path is required when cassette_mode is set")
+        if self.cassette_mode == "record":
+            async_transport = (
+                self._transport
+                if hasattr(self._transport, "request_async")
+                else _AsyncPooledTransport(pool_size=self.pool_size, keep_alive=self.keep_alive)
+            )
+            self._transport = _CassetteRecorder(cassette_path, self._transport, async_transport)
+        elif self.cassette_mode == "replay":
+            self._transport.close()
+            self._transport = _CassetteReplayer(
+                cassette_path,
+                latency_scale=cassette_latency_scale if cassette_latency_scale is not None else 0.0,
+            )
+            # Replays run as fast as the cassette allows; pacing came from the recording.
+            rate_limit = 0.0
+
+        self.max_concurrency = max(1, int(max_concurrency)) if max_concurrency is not None else 16
+        # Off by default: the batch reports route is not served by every collector yet.
+        self.reports_batch_size = int(reports_batch_size) if reports_batch_size is not None else 0
+        self._reports_batch_unsupported_at: float = 0.0
+        # ``None`` keeps the default split of hotkeys into at most five chunks.
+        self.ids_chunk_size = max(1, int(ids_chunk_size)) if ids_chunk_size else None
+        self.ids_max_concurrency = (
+            max(1, int(ids_max_concurrency)) if ids_max_concurrency else self.max_concurrency
+        )
+        self._conditional_cache = _ConditionalCache()
+        self._json_decoder = _make_json_decoder(json_decoder)
+        self._transfer_counters = _TransferCounters()
+        self._latency = _LatencyTracker(enabled=adaptive_timeout)
+        self._breaker = _CircuitBreaker(
+            threshold=breaker_threshold if breaker_threshold is not None else 5,
+            cooldown=breaker_cooldown if breaker_cooldown is not None else 30.0,
+        )
+        # Client-side scheduling is opt-in: the collector's own limits usually
+        # allow more than a fixed budget would, e.g. during report fallbacks.
+        self._scheduler = _RequestScheduler(rate=rate_limit or 0.0, burst=rate_burst)
+
     def default_headers(self) -> Dict[str, str]:
         return {
             "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING,
             "Authorization": f"Bearer {self.api_key}",
         }
+
+    def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout_seconds: Optional[float] = None,
+        conditional: bool = False,
+        revalidate: bool = True,
+        resource: Optional[str] = None,
+    ) -> _TransportResponse:
+        """Send a request through the shared pooled transport.
+
+        ``endpoint`` is a short label for the call site (``reports``, ``vote`` ...).
+        ``conditional`` enables ETag / Last-Modified revalidation for idempotent reads;
+        a 304 for a response no longer cached is fetched again without validators.
+        Without an explicit ``timeout_seconds`` the endpoint's adaptive timeout is used.
+        Raises :class:`CollectorCircuitOpenError` while the endpoint's breaker is open;
+        ``resource`` names the server or hotkey a per-resource call is about, so its
+        error responses count toward the breaker once per resource.
+        Requests wait for the shared scheduler's rate budget before being sent.
+        """
+        request_headers = self._prepare_request(endpoint, url, headers, conditional and revalidate)
+        self._scheduler.acquire(endpoint)
+        timeout = self._request_timeout(endpoint, timeout_seconds)
+        try:
+            response = self._transport.request(
+                method, url, headers=request_headers, data=data, timeout=timeout
+            )
+        except Exception:
+            self._breaker.record_failure(endpoint)
+            raise
+        completed = self._complete_request(endpoint, url, response, conditional, resource)
+        if completed is None and revalidate:
+            return self._request(
+                endpoint,
+                method,
+                url,
+                headers=headers,
+                data=data,
+                timeout_seconds=timeout_seconds,
+                conditional=True,
+                revalidate=False,
+                resource=resource,
+            )
+        return completed if completed is not None else response
+
+    def _prepare_request(
+        self, endpoint: str, url: str, headers: Dict[str, str], conditional: bool
+    ) -> Dict[str, str]:
+        self._breaker.before_request(endpoint)
+        if not conditional:
+            return headers
+        return {**headers, **self._conditional_cache.validators(url)}
+
+    def _request_timeout(self, endpoint: str, timeout_seconds: Optional[float]) -> float:
+        if timeout_seconds is not None:
+            return timeout_seconds
+        return self._latency.timeout_for(endpoint, self.timeout_seconds)
+
+    def _complete_request(
+        self,
+        endpoint: str,
+        url: str,
+        response: _TransportResponse,
+        conditional: bool,
+        resource: Optional[str] = None,
+    ) -> Optional[_TransportResponse]:
+        """Record ``response``; ``None`` asks for the request to be sent again unconditionally."""
+        response.endpoint = endpoint
+        self._transfer_counters.record(endpoint, response)
+        if response.status >= 500 or response.status == 429:
+            self._breaker.record_failure(endpoint, resource)
+        else:
+            self._breaker.record_success(endpoint)
+            self._latency.record(endpoint, response.elapsed)
+        if conditional:
+            return self._conditional_cache.resolve(endpoint, url, response, self._response_json)
+        return response
+
+    def _response_json(self, response: _TransportResponse) -> Any:
+        """Decode (once) and return the JSON body; raises ``ValueError`` when invalid."""
+        if response.data is _UNDECODED:
+            response.data = self._json_decoder.decode(response.body, response.endpoint)
+        return response.data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Client-side counters for status reporting."""
+        stats = {
+            "conditional": self._conditional_cache.stats(),
+            "decode": self._json_decoder.stats(),
+            "transfer": self._transfer_counters.stats(),
+            "timeouts": self._latency.stats(self.timeout_seconds),
+            "breakers": self._breaker.stats(),
+            "scheduler": self._scheduler.stats(),
+        }
+        if self.cassette_mode != "off":
+            stats["cassette"] = {"mode": self.cassette_mode, **self._transport.stats()}
+        return stats
+
+    def close(self) -> None:
+        """Release pooled connections and stop the request scheduler."""
+        self._scheduler.close()
+        self._transport.close()
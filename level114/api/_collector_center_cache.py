@@ -0,0 +1,125 @@
+"""Conditional GET cache shared by the Collector Center clients."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from ._collector_center_transport import _TransportResponse
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the containers of a decoded JSON value; leaves are immutable."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+@dataclass
+class _CachedResponse:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    status: int
+    body: bytes
+    data: Any
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class _ConditionalCache:
+    """Remembers validators and decoded bodies per URL for conditional GETs.
+
+    ``validators`` returns the ``If-None-Match`` / ``If-Modified-Since`` headers for a
+    URL; ``resolve`` turns a ``304 Not Modified`` back into the cached response,
+    including the already-decoded body, so neither transfer nor JSON decoding is repeated.
+    Each hit gets its own copy of the decoded body, so callers may modify it in place.
+    A 304 for a URL no longer cached resolves to ``None``; the caller then repeats
+    the request without validators.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def validators(self, url: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            return {}
+        headers: Dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(
+        self,
+        endpoint: str,
+        url: str,
+        response: _TransportResponse,
+        decode: Callable[[_TransportResponse], Any],
+    ) -> Optional[_TransportResponse]:
+        if response.status == 304:
+            with self._lock:
+                entry = self._entries.get(url)
+                if entry is not None:
+                    self._entries.move_to_end(url)
+            if entry is None:
+                # Evicted after its validators were sent; nothing to serve.
+                self._count(endpoint, "refetches", 0)
+                return None
+            self._count(endpoint, "hits", len(entry.body))
+            return _TransportResponse(
+                status=entry.status,
+                body=entry.body,
+                headers=dict(entry.headers),
+                reason="Not Modified",
+                elapsed=response.elapsed,
+                data=_copy_json(entry.data),
+                endpoint=endpoint,
+            )
+
+        self._count(endpoint, "misses", 0)
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not (200 <= response.status < 300) or not (etag or last_modified):
+            return response
+
+        try:
+            data = decode(response)
+        except ValueError:
+            return response
+
+        with self._lock:
+            self._entries[url] = _CachedResponse(
+                etag=etag,
+                last_modified=last_modified,
+                status=response.status,
+                body=response.body,
+                # The caller keeps ``data``; the cache holds its own copy.
+                data=_copy_json(data),
+                headers=dict(response.headers),
+            )
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def _count(self, endpoint: str, key: str, saved_bytes: int) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                endpoint, {"hits": 0, "misses": 0, "refetches": 0, "bytes_saved": 0}
+            )
+            counters[key] += 1
+            counters["bytes_saved"] += saved_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "endpoints": {name: dict(values) for name, values in self._counters.items()},
+            }
@@ -0,0 +1,261 @@
+"""Record and replay Collector Center traffic for offline profiling."""
+
+import asyncio
+import base64
+import gzip
+import json
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from ._collector_center_transport import _TransportResponse
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode for a request the cassette never recorded."""
+
+
+def _cassette_key(method: str, url: str) -> Tuple[str, str]:
+    # Keyed by path and query so a cassette replays against any --collector.url.
+    parts = urlsplit(url)
+    return method.upper(), f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return str(entry.get("body", "")).encode("utf-8")
+
+
+class _CassetteRecorder:
+    """Transport wrapper appending every exchange to a gzip-compressed JSONL file.
+
+    Each line holds the method, URL, status, headers, decoded body, latency and
+    transfer sizes of one request, or the error it raised. The file is one gzip
+    stream sync-flushed after every line, so a validator that stops without
+    closing the recorder still leaves every complete line readable. Sync
+    requests go to ``transport``; async requests to ``async_transport``, so a
+    single recorder captures both clients of a validator.
+    """
+
+    def __init__(self, path: str, transport: Any, async_transport: Any) -> None:
+        self.path = path
+        self._transport = transport
+        self._async_transport = async_transport
+        self._lock = threading.Lock()
+        self._file = gzip.GzipFile(path, "ab")
+        self.recorded = 0
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write((line + "\n").encode("utf-8"))
+            self._file.flush(zlib.Z_SYNC_FLUSH)
+            self.recorded += 1
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        response: Optional[_TransportResponse],
+        error: Optional[BaseException],
+        elapsed: float,
+    ) -> None:
+        entry: Dict[str, Any] = {"method": method, "url": url, "elapsed": round(elapsed, 6)}
+        if response is not None:
+            entry.update(
+                status=response.status,
+                reason=response.reason,
+                headers=response.headers,
+                wire_bytes=response.wire_bytes,
+                content_encoding=response.content_encoding,
+                **_encode_body(response.body),
+            )
+        else:
+            timed_out = isinstance(error, (TimeoutError, asyncio.TimeoutError))
+            entry["error"] = "timeout" if timed_out else "error"
+            entry["message"] = str(error)
+        self._write(entry)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        start = time.perf_counter()
+        try:
+            response = self._transport.request(
+                method, url, headers=headers, data=data, timeout=timeout
+            )
+        except Exception as e:
+            self._record(method, url, None, e, time.perf_counter() - start)
+            raise
+        self._record(method, url, response, None, response.elapsed)
+        return response
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        start = time.perf_counter()
+        try:
+            response = await self._async_transport.request_async(
+                method, url, headers=headers, data=data, timeout=timeout
+            )
+        except Exception as e:
+            self._record(method, url, None, e, time.perf_counter() - start)
+            raise
+        self._record(method, url, response, None, response.elapsed)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"path": self.path, "recorded": self.recorded}
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self._transport.close()
+
+    async def close_async(self) -> None:
+        if self._async_transport is not self._transport:
+            await self._async_transport.close()
+
+
+class _CassetteReplayer:
+    """Transport serving responses from a recorded cassette.
+
+    Requests are matched by method, path and query in recorded order; once the
+    recordings for a key are used up the last one keeps being served and counted
+    in ``over_reads``, so a replay that asked for more than was recorded shows
+    in the stats instead of passing as deterministic. Recorded
+    latency is slept scaled by ``latency_scale`` (``0`` replays as fast as the
+    CPU allows, ``1`` in real time).
+    """
+
+    def __init__(self, path: str, latency_scale: float = 0.0) -> None:
+        self.path = path
+        self.latency_scale = max(0.0, float(latency_scale))
+        self._entries: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._last: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.replayed = 0
+        self.misses = 0
+        self.over_reads = 0
+        self.truncated = False
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            try:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    key = _cassette_key(entry["method"], entry["url"])
+                    self._entries.setdefault(key, deque()).append(entry)
+            except (EOFError, OSError, zlib.error):
+                # A recording interrupted before close ends without the gzip
+                # trailer; keep every line flushed before it.
+                self.truncated = True
+
+    def _next(self, method: str, url: str) -> Dict[str, Any]:
+        key = _cassette_key(method, url)
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                entry = self._last[key] = queue.popleft()
+            else:
+                entry = self._last.get(key)
+                if entry is not None:
+                    self.over_reads += 1
+            if entry is None:
+                self.misses += 1
+                raise CassetteMissError(f"no recorded response for {method} {key[1]}")
+            self.replayed += 1
+        return entry
+
+    @staticmethod
+    def _response(entry: Dict[str, Any]) -> _TransportResponse:
+        if "error" in entry:
+            message = entry.get("message") or "recorded collector failure"
+            if entry["error"] == "timeout":
+                raise TimeoutError(message)
+            raise ConnectionError(message)
+        return _TransportResponse(
+            status=int(entry["status"]),
+            body=_decode_body(entry),
+            headers=dict(entry.get("headers") or {}),
+            reason=entry.get("reason", ""),
+            elapsed=float(entry.get("elapsed", 0.0)),
+            wire_bytes=int(entry.get("wire_bytes", 0)),
+            content_encoding=entry.get("content_encoding", "identity"),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        entry = self._next(method, url)
+        delay = float(entry.get("elapsed", 0.0)) * self.latency_scale
+        if delay:
+            time.sleep(delay)
+        return self._response(entry)
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        entry = self._next(method, url)
+        delay = float(entry.get("elapsed", 0.0)) * self.latency_scale
+        if delay:
+            await asyncio.sleep(delay)
+        return self._response(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": self.path,
+                "replayed": self.replayed,
+                "misses": self.misses,
+                "over_reads": self.over_reads,
+                "truncated": self.truncated,
+            }
+
+    def close(self) -> None:
+        return None
@@ -0,0 +1,55 @@
+"""JSON decoding layer for Collector Center responses."""
+
+import json
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+try:  # Optional speedup: pip install "level114-subnet[speedups]"
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class _JsonDecoder:
+    """Parses response bodies straight from ``bytes`` and times each decode per endpoint."""
+
+    def __init__(self, name: str, loads: Callable[[bytes], Any]) -> None:
+        self.name = name
+        self._loads = loads
+        self._counters: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def decode(self, body: bytes, endpoint: str = "") -> Any:
+        """Return the parsed body; raises ``ValueError`` when it is not valid JSON."""
+        start = perf_counter()
+        try:
+            return self._loads(body)
+        finally:
+            elapsed = perf_counter() - start
+            with self._lock:
+                counters = self._counters.setdefault(
+                    endpoint or "other", {"count": 0, "bytes": 0, "seconds": 0.0}
+                )
+                counters["count"] += 1
+                counters["bytes"] += len(body)
+                counters["seconds"] += elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "decoder": self.name,
+                "endpoints": {name: dict(values) for name, values in self._counters.items()},
+            }
+
+
+def _make_json_decoder(name: Optional[str] = None) -> _JsonDecoder:
+    """Build a decoder; ``name`` is ``"orjson"``, ``"json"`` or ``None`` for the fastest available."""
+    if name not in (None, "orjson", "json"):
+        raise ValueError(f"Unknown JSON decoder '{name}' (expected 'orjson' or 'json')")
+    if name == "orjson" and orjson is None:
+        raise ValueError("JSON decoder 'orjson' requested but orjson is not installed")
+    if name != "json" and orjson is not None:
+        # orjson.JSONDecodeError subclasses ValueError, like the stdlib error.
+        return _JsonDecoder("orjson", orjson.loads)
+    return _JsonDecoder("json", json.loads)
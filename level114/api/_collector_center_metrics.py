@@ -1,11 +1,10 @@
 from typing import Any, Optional, Tuple
-from urllib.error import HTTPError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-import json
 
 import bittensor as bt
 
+from ._collector_center_transport import _TransportResponse
+
 
 class _ServerMetricsMixin:
     """Server metrics endpoints."""
@@ -15,35 +14,48 @@ class _ServerMetricsMixin:
     ) -> Tuple[int, Any]:
         if not hotkey:
             return 400, None
-        query = urlencode({"hotkey": hotkey})
-        url = f"{self.base_url}/validators/tcl/metrics?{query}"
+        url = self._tcl_metrics_url(hotkey)
         headers = self.default_headers()
-        req = Request(url, headers=headers, method="GET")
-        timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                status = resp.getcode()
-                body = resp.read().decode("utf-8", errors="ignore")
-                try:
-                    data = json.loads(body)
-                    if status < 200 or status >= 300:
-                        bt.logging.error(
-                            f"collector tcl metrics status={status} hotkey={hotkey} body={body}"
-                        )
-                    return status, data
-                except json.JSONDecodeError:
-                    if status < 200 or status >= 300:
-                        bt.logging.error(
-                            f"collector tcl metrics status={status} hotkey={hotkey} body={body}"
-                        )
-                    return status, None
-        except HTTPError as e:
-            if e.code == 404:
-                return e.code, None
-            bt.logging.error(
-                f"collector tcl metrics HTTP error hotkey={hotkey}: {e.code} {e.reason}"
+            response = self._request(
+                "tcl_metrics",
+                "GET",
+                url,
+                headers=headers,
+                timeout_seconds=timeout_seconds,
+                conditional=True,
+                resource=hotkey,
             )
-            return e.code, None
         except Exception as e:  # noqa: BLE001
             bt.logging.error(f"collector tcl metrics error hotkey={hotkey}: {e}")
             return 599, None
+
+        return self._parse_tcl_metrics(hotkey, response)
+
+    def _tcl_metrics_url(self, hotkey: str) -> str:
+        query = urlencode({"hotkey": hotkey})
+        return f"{self.base_url}/validators/tcl/metrics?{query}"
+
+    def _parse_tcl_metrics(self, hotkey: str, response: _TransportResponse) -> Tuple[int, Any]:
+        status = response.status
+        if status >= 400:
+            if status == 404:
+                return status, None
+            bt.logging.error(
+                f"collector tcl metrics HTTP error hotkey={hotkey}: {status} {response.reason}"
+            )
+            return status, None
+
+        try:
+            data = self._response_json(response)
+            if status < 200 or status >= 300:
+                bt.logging.error(
+                    f"collector tcl metrics status={status} hotkey={hotkey} body={response.text()}"
+                )
+            return status, data
+        except ValueError:
+            if status < 200 or status >= 300:
+                bt.logging.error(
+                    f"collector tcl metrics status={status} hotkey={hotkey} body={response.text()}"
+                )
+            return status, None
@@ -1,10 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-import json
+import time
 
 import bittensor as bt
 
+from ._collector_center_transport import _TransportResponse
+
+# Statuses meaning the collector does not expose the multi-server reports route.
+_BATCH_UNSUPPORTED_STATUSES = frozenset({404, 405, 501})
+# How long to stay on single-server calls before probing the batch route again.
+_BATCH_REPROBE_SECONDS = 3600.0
+
 
 class _ServerReportsMixin:
     """Historical server reports endpoint."""
@@ -14,40 +21,207 @@ class _ServerReportsMixin:
         server_id: str,
         limit: Optional[int] = None,
         timeout_seconds: Optional[float] = None,
+        since_ms: Optional[int] = None,
     ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Fetch the latest reports for a server.
+
+        ``since_ms`` asks the collector for reports newer than that client timestamp
+        only; collectors that ignore it return the usual latest ``limit`` reports.
+        """
         if not server_id:
             return 400, []
 
+        url = self._server_reports_url(server_id, limit, since_ms)
+        try:
+            response = self._request(
+                "reports",
+                "GET",
+                url,
+                headers=self.default_headers(),
+                timeout_seconds=timeout_seconds,
+                resource=server_id,
+            )
+        except Exception as e:
+            bt.logging.error(f"collector reports error server_id={server_id}: {e}")
+            return 599, []
+
+        return self._parse_server_reports(server_id, response)
+
+    def get_server_reports_batch(
+        self,
+        server_ids: List[str],
+        limit: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        since_ms: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Fetch reports for many servers using as few round trips as possible.
+
+        Server IDs are grouped into chunks of ``reports_batch_size`` and requested via
+        ``GET /validators/servers/reports?server_ids=a,b,c``. When the collector does not
+        support that route, the affected servers are fetched with parallel single-server
+        calls instead. ``since_ms`` maps server IDs to their incremental sync cursor.
+        Returns ``{server_id: (status, reports)}`` for every requested ID.
+        """
+        cursors = since_ms or {}
+        unique_ids = [sid for sid in dict.fromkeys(server_ids) if sid]
+        results: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        if not unique_ids:
+            return results
+
+        fallback_ids: List[str] = []
+        chunks = self._plan_reports_batch_chunks(unique_ids)
+        if chunks:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as pool:
+                batches = list(
+                    pool.map(
+                        lambda chunk: self._fetch_server_reports_batch_chunk(
+                            chunk, limit, timeout_seconds, cursors
+                        ),
+                        chunks,
+                    )
+                )
+            for chunk, batch in zip(chunks, batches):
+                if batch is None:
+                    fallback_ids.extend(chunk)
+                else:
+                    results.update(batch)
+        else:
+            fallback_ids = unique_ids
+
+        if fallback_ids:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(fallback_ids))) as pool:
+                singles = list(
+                    pool.map(
+                        lambda sid: self.get_server_reports(
+                            sid, limit, timeout_seconds, cursors.get(sid)
+                        ),
+                        fallback_ids,
+                    )
+                )
+            results.update(zip(fallback_ids, singles))
+
+        return {sid: results.get(sid, (599, [])) for sid in unique_ids}
+
+    def _fetch_server_reports_batch_chunk(
+        self,
+        server_ids: List[str],
+        limit: Optional[int],
+        timeout_seconds: Optional[float],
+        since_ms: Dict[str, int],
+    ) -> Optional[Dict[str, Tuple[int, List[Dict[str, Any]]]]]:
+        url = self._server_reports_batch_url(server_ids, limit, since_ms)
+        try:
+            response = self._request(
+                "reports_batch",
+                "GET",
+                url,
+                headers=self.default_headers(),
+                timeout_seconds=timeout_seconds,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(f"collector reports batch error servers={len(server_ids)}: {e}")
+            return {sid: (599, []) for sid in server_ids}
+
+        return self._parse_server_reports_batch(server_ids, response)
+
+    def _server_reports_url(
+        self, server_id: str, limit: Optional[int], since_ms: Optional[int] = None
+    ) -> str:
+        effective_limit = int(limit) if limit is not None else self.reports_limit_default
+        params: Dict[str, Any] = {"limit": effective_limit}
+        if since_ms is not None:
+            params["since_ms"] = int(since_ms)
+        query = urlencode(params)
+        return f"{self.base_url}/validators/servers/{server_id}/reports?{query}"
+
+    def _server_reports_batch_url(
+        self,
+        server_ids: List[str],
+        limit: Optional[int],
+        since_ms: Optional[Dict[str, int]] = None,
+    ) -> str:
         effective_limit = int(limit) if limit is not None else self.reports_limit_default
-        query = urlencode({"limit": effective_limit})
-        url = f"{self.base_url}/validators/servers/{server_id}/reports?{query}"
-        req = Request(url, headers=self.default_headers(), method="GET")
-        timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
+        params: Dict[str, Any] = {"server_ids": ",".join(server_ids), "limit": effective_limit}
+        # A single cursor covers the whole chunk, so only send it when every server has one.
+        cursors = [since_ms.get(sid) for sid in server_ids] if since_ms else []
+        if cursors and all(cursor is not None for cursor in cursors):
+            params["since_ms"] = int(min(cursors))
+        query = urlencode(params)
+        return f"{self.base_url}/validators/servers/reports?{query}"
+
+    def _plan_reports_batch_chunks(self, server_ids: List[str]) -> List[List[str]]:
+        """Split IDs into batch-route chunks; empty when batching is off or unsupported."""
+        if self.reports_batch_size <= 1:
+            return []
+        unsupported_at = self._reports_batch_unsupported_at
+        if unsupported_at and time.time() - unsupported_at < _BATCH_REPROBE_SECONDS:
+            return []
+        size = self.reports_batch_size
+        return [server_ids[idx : idx + size] for idx in range(0, len(server_ids), size)]
+
+    def _parse_server_reports(
+        self, server_id: str, response: _TransportResponse
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        status = response.status
 
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                status = resp.getcode()
-                body = resp.read().decode("utf-8", errors="ignore")
-
-                try:
-                    data = json.loads(body)
-                except json.JSONDecodeError:
-                    if status < 200 or status >= 300:
-                        bt.logging.error(
-                            f"collector reports status={status} server_id={server_id} body={body}"
-                        )
-                    return status, []
-
-                items_raw = data.get("items", []) if isinstance(data, dict) else []
-                items = [item for item in items_raw if isinstance(item, dict)]
-
-                if status < 200 or status >= 300:
-                    bt.logging.error(
-                        f"collector reports status={status} server_id={server_id} body={body}"
-                    )
+            data = self._response_json(response)
+        except ValueError:
+            if status < 200 or status >= 300:
+                bt.logging.error(
+                    f"collector reports status={status} server_id={server_id} body={response.text()}"
+                )
+            return status, []
 
-                return status, items
+        items_raw = data.get("items", []) if isinstance(data, dict) else []
+        items = [item for item in items_raw if isinstance(item, dict)]
 
-        except Exception as e:
-            bt.logging.error(f"collector reports error server_id={server_id}: {e}")
-            return 599, []
+        if status < 200 or status >= 300:
+            bt.logging.error(
+                f"collector reports status={status} server_id={server_id} body={response.text()}"
+            )
+
+        return status, items
+
+    def _parse_server_reports_batch(
+        self, server_ids: List[str], response: _TransportResponse
+    ) -> Optional[Dict[str, Tuple[int, List[Dict[str, Any]]]]]:
+        """Parse a batch response; ``None`` means the route is unavailable."""
+        status = response.status
+        if status in _BATCH_UNSUPPORTED_STATUSES:
+            if not self._reports_batch_unsupported_at:
+                bt.logging.info(
+                    f"collector reports batch route unavailable (status={status}); "
+                    "falling back to single-server requests"
+                )
+            self._reports_batch_unsupported_at = time.time()
+            return None
+        self._reports_batch_unsupported_at = 0.0
+
+        if status < 200 or status >= 300:
+            bt.logging.error(
+                f"collector reports batch status={status} servers={len(server_ids)} body={response.text()}"
+            )
+            return {sid: (status, []) for sid in server_ids}
+
+        try:
+            data = self._response_json(response)
+        except ValueError:
+            return {sid: (status, []) for sid in server_ids}
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {sid: [] for sid in server_ids}
+        items_raw = data.get("items", []) if isinstance(data, dict) else []
+        if isinstance(items_raw, dict):
+            # {"items": {"<server_id>": [report, ...]}}
+            for sid, reports in items_raw.items():
+                if sid in grouped and isinstance(reports, list):
+                    grouped[sid] = [item for item in reports if isinstance(item, dict)]
+        elif isinstance(items_raw, list):
+            # {"items": [report, ...]} where every report carries its server_id
+            for item in items_raw:
+                if isinstance(item, dict) and str(item.get("server_id", "")) in grouped:
+                    grouped[str(item["server_id"])].append(item)
+
+        return {sid: (status, reports) for sid, reports in grouped.items()}
@@ -0,0 +1,189 @@
+"""Adaptive timeouts and circuit breaking for Collector Center endpoints."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class CollectorCircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while an endpoint's breaker is open."""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        super().__init__(
+            f"collector circuit open for '{endpoint}' (retry in {max(0.0, retry_in):.1f}s)"
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class _LatencyTracker:
+    """Ring buffer of successful latencies per endpoint, used to derive timeouts.
+
+    Once ``min_samples`` latencies are known the timeout becomes
+    ``p99 * factor`` clamped to ``[floor, ceiling]``; until then the ceiling
+    (the client's configured ``timeout_seconds``) is used.
+    """
+
+    def __init__(
+        self,
+        window: int = 200,
+        min_samples: int = 20,
+        factor: float = 3.0,
+        floor: float = 1.0,
+        enabled: bool = True,
+    ) -> None:
+        self.window = max(1, int(window))
+        self.min_samples = max(1, int(min_samples))
+        self.factor = float(factor)
+        self.floor = float(floor)
+        self.enabled = bool(enabled)
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def timeout_for(self, endpoint: str, ceiling: float) -> float:
+        if not self.enabled:
+            return ceiling
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return ceiling
+            p99 = _percentile(sorted(samples), 0.99)
+        return min(ceiling, max(self.floor, p99 * self.factor))
+
+    def stats(self, ceiling: float) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            snapshot = {name: sorted(values) for name, values in self._samples.items()}
+        result: Dict[str, Dict[str, Any]] = {}
+        for name, ordered in snapshot.items():
+            entry: Dict[str, Any] = {"samples": len(ordered)}
+            if ordered:
+                entry["p50_ms"] = round(_percentile(ordered, 0.50) * 1000.0, 1)
+                entry["p99_ms"] = round(_percentile(ordered, 0.99) * 1000.0, 1)
+            entry["timeout_s"] = round(self.timeout_for(name, ceiling), 3)
+            result[name] = entry
+        return result
+
+
+class _CircuitBreaker:
+    """Consecutive-failure circuit breaker per endpoint.
+
+    After ``threshold`` consecutive failures the endpoint is *open* and requests
+    fail fast for ``cooldown`` seconds. Then a single probe is let through
+    (*half-open*): success closes the breaker, failure re-opens it. A
+    ``threshold`` of 0 disables the breaker.
+
+    Error responses from per-resource calls (one server's reports, one hotkey's
+    metrics) name that ``resource`` and only count once per resource, so a few
+    servers whose lookups keep failing cannot open the breaker for everyone.
+    Transport errors and timeouts name none and always count: they say the
+    collector itself is unreachable.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.threshold = max(0, int(threshold))
+        self.cooldown = max(0.0, float(cooldown))
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, endpoint: str) -> Dict[str, Any]:
+        state = self._states.get(endpoint)
+        if state is None:
+            state = self._states[endpoint] = {
+                "state": "closed",
+                "consecutive_failures": 0,
+                "shared_failures": 0,
+                "failing_resources": set(),
+                "opened_at": 0.0,
+                "probe_started_at": 0.0,
+                "trips": 0,
+                "rejected": 0,
+            }
+        return state
+
+    def before_request(self, endpoint: str) -> None:
+        """Raise :class:`CollectorCircuitOpenError` when the call must fail fast."""
+        if not self.threshold:
+            return
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(endpoint)
+            if state["state"] == "closed":
+                return
+            if state["state"] == "open":
+                retry_in = state["opened_at"] + self.cooldown - now
+                if retry_in <= 0:
+                    state["state"] = "half_open"
+                    state["probe_started_at"] = now
+                    return
+            elif now - state["probe_started_at"] >= self.cooldown:
+                # The previous probe never reported back (e.g. it was cancelled).
+                state["probe_started_at"] = now
+                return
+            else:
+                retry_in = state["probe_started_at"] + self.cooldown - now
+            state["rejected"] += 1
+        raise CollectorCircuitOpenError(endpoint, retry_in)
+
+    def record_success(self, endpoint: str) -> None:
+        if not self.threshold:
+            return
+        with self._lock:
+            state = self._state(endpoint)
+            state["state"] = "closed"
+            self._reset_failures(state)
+
+    def record_failure(self, endpoint: str, resource: Optional[str] = None) -> None:
+        if not self.threshold:
+            return
+        with self._lock:
+            state = self._state(endpoint)
+            state["consecutive_failures"] += 1
+            if resource is None:
+                state["shared_failures"] += 1
+            else:
+                state["failing_resources"].add(resource)
+            spread = state["shared_failures"] + len(state["failing_resources"])
+            if state["state"] == "half_open" or (
+                state["state"] == "closed" and spread >= self.threshold
+            ):
+                state["state"] = "open"
+                state["opened_at"] = time.monotonic()
+                state["trips"] += 1
+
+    @staticmethod
+    def _reset_failures(state: Dict[str, Any]) -> None:
+        state["consecutive_failures"] = 0
+        state["shared_failures"] = 0
+        state["failing_resources"].clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for name, state in self._states.items():
+                entry = {
+                    "state": state["state"],
+                    "consecutive_failures": state["consecutive_failures"],
+                    "failing_resources": len(state["failing_resources"]),
+                    "trips": state["trips"],
+                    "rejected": state["rejected"],
+                }
+                if state["state"] == "open":
+                    entry["retry_in_s"] = round(
+                        max(0.0, state["opened_at"] + self.cooldown - now), 1
+                    )
+                result[name] = entry
+            return result
@@ -0,0 +1,197 @@
+"""Client-side request scheduler shared by every Collector Center call path."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from level114.utils.rate_limit import TokenBucket
+
+# Lower values are served first: mappings, then reads, then votes.
+_ENDPOINT_PRIORITY: Dict[str, int] = {
+    "ids": 0,
+    "servers": 1,
+    "reports": 1,
+    "reports_batch": 1,
+    "tcl_metrics": 1,
+    "vote": 2,
+}
+_DEFAULT_PRIORITY = 1
+
+
+class _Waiter:
+    __slots__ = ("event", "loop", "future", "enqueued_at")
+
+    def __init__(
+        self,
+        event: Optional[threading.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: Optional["asyncio.Future[None]"] = None,
+    ) -> None:
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+    def abandoned(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def grant(self) -> None:
+        if self.event is not None:
+            self.event.set()
+            return
+        try:
+            self.loop.call_soon_threadsafe(_resolve_future, self.future)
+        except RuntimeError:  # loop already closed
+            pass
+
+
+def _resolve_future(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _RequestScheduler:
+    """Global requests-per-second budget with priority classes and fair queuing.
+
+    Callers take one token per request. While tokens are available and nobody is
+    queued the call proceeds immediately; otherwise it waits in its endpoint's
+    queue. A dispatcher thread hands out tokens to the highest priority class
+    first and round-robins between endpoints of the same class, so a burst from
+    one call path cannot starve the others. Sync callers block on an event,
+    async callers await a future resolved on their own loop. A ``rate`` of 0
+    disables scheduling.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: Optional[float] = None) -> None:
+        self.rate = max(0.0, float(rate))
+        self._bucket = TokenBucket(
+            self.rate, burst=burst if burst is not None else max(1.0, self.rate * 2)
+        )
+        self._cond = threading.Condition()
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = {}
+        self._queued = 0
+        self._counters: Dict[str, Dict[str, float]] = {}
+        self._dispatcher: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 and not self._closed
+
+    def acquire(self, endpoint: str) -> None:
+        """Block the calling thread until ``endpoint`` may send a request."""
+        if not self.enabled:
+            return
+        waiter = self._enqueue_or_grant(endpoint, lambda: _Waiter(event=threading.Event()))
+        if waiter is not None:
+            waiter.event.wait()
+            self._record_wait(endpoint, waiter)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait on the running loop until ``endpoint`` may send a request."""
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        waiter = self._enqueue_or_grant(
+            endpoint, lambda: _Waiter(loop=loop, future=loop.create_future())
+        )
+        if waiter is not None:
+            await waiter.future
+            self._record_wait(endpoint, waiter)
+
+    def _enqueue_or_grant(self, endpoint: str, make_waiter: Any) -> Optional[_Waiter]:
+        with self._cond:
+            counters = self._endpoint_counters(endpoint)
+            if not self._queued and self._bucket.try_acquire():
+                counters["granted"] += 1
+                return None
+            waiter = make_waiter()
+            priority = _ENDPOINT_PRIORITY.get(endpoint, _DEFAULT_PRIORITY)
+            queues = self._queues.setdefault(priority, OrderedDict())
+            queues.setdefault(endpoint, deque()).append(waiter)
+            self._queued += 1
+            counters["delayed"] += 1
+            self._ensure_dispatcher()
+            self._cond.notify()
+            return waiter
+
+    def _record_wait(self, endpoint: str, waiter: _Waiter) -> None:
+        waited = time.monotonic() - waiter.enqueued_at
+        with self._cond:
+            counters = self._endpoint_counters(endpoint)
+            counters["granted"] += 1
+            counters["wait_seconds"] += waited
+
+    def _endpoint_counters(self, endpoint: str) -> Dict[str, float]:
+        counters = self._counters.get(endpoint)
+        if counters is None:
+            counters = self._counters[endpoint] = {"granted": 0, "delayed": 0, "wait_seconds": 0.0}
+        return counters
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="collector-request-scheduler", daemon=True
+            )
+            self._dispatcher.start()
+
+    def _next_waiter(self) -> Optional[Tuple["OrderedDict[str, Deque[_Waiter]]", str]]:
+        """Locate the next waiter to serve, discarding abandoned async waiters."""
+        for priority in sorted(self._queues):
+            queues = self._queues[priority]
+            for endpoint in list(queues):
+                pending = queues[endpoint]
+                while pending and pending[0].abandoned():
+                    pending.popleft()
+                    self._queued -= 1
+                if pending:
+                    return queues, endpoint
+                del queues[endpoint]
+        return None
+
+    def _dispatch(self) -> None:
+        with self._cond:
+            while not self._closed:
+                slot = self._next_waiter()
+                if slot is None:
+                    self._cond.wait()
+                    continue
+                if not self._bucket.try_acquire():
+                    self._cond.wait(timeout=max(0.001, self._bucket.wait_time()))
+                    continue
+                queues, endpoint = slot
+                waiter = queues[endpoint].popleft()
+                self._queued -= 1
+                # Round-robin: the endpoint just served goes to the back of its class.
+                queues.move_to_end(endpoint)
+                waiter.grant()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "rate": self.rate,
+                "burst": self._bucket.burst,
+                "queued": self._queued,
+                "endpoints": {
+                    name: {
+                        "granted": int(values["granted"]),
+                        "delayed": int(values["delayed"]),
+                        "wait_seconds": round(values["wait_seconds"], 3),
+                    }
+                    for name, values in self._counters.items()
+                },
+            }
+
+    def close(self) -> None:
+        """Stop the dispatcher and release everyone still waiting."""
+        with self._cond:
+            self._closed = True
+            for queues in self._queues.values():
+                for pending in queues.values():
+                    while pending:
+                        pending.popleft().grant()
+            self._queues.clear()
+            self._queued = 0
+            self._cond.notify_all()
@@ -1,10 +1,10 @@
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
 import json
 
 import bittensor as bt
 
+from ._collector_center_transport import _TransportResponse
+
 
 class _ServerCatalogMixin:
     """Server catalog endpoints."""
@@ -19,68 +19,89 @@ class _ServerCatalogMixin:
         information that can be used by the validator-side scanner.
         """
         url = f"{self.base_url}/servers"
-        headers = self.default_headers()
-        headers.pop("Authorization", None)
-        req = Request(url, headers=headers, method="GET")
-        timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
-
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                status = resp.getcode()
-                body = resp.read().decode("utf-8", errors="ignore")
-                try:
-                    data = json.loads(body)
-                except json.JSONDecodeError:
-                    if status < 200 or status >= 300:
-                        bt.logging.error(f"collector servers status={status} body={body}")
-                    return status, []
-
-                items_raw = data.get("items", []) if isinstance(data, dict) else []
-                items: List[Dict[str, Any]] = [
-                    item for item in items_raw if isinstance(item, dict) and item.get("id")
-                ]
-
-                if status < 200 or status >= 300:
-                    bt.logging.error(f"collector servers status={status} body={body}")
-
-                return status, items
+            response = self._request(
+                "servers",
+                "GET",
+                url,
+                headers=self._active_servers_headers(),
+                timeout_seconds=timeout_seconds,
+                conditional=True,
+            )
         except Exception as e:  # noqa: BLE001
             bt.logging.error(f"collector servers error: {e}")
             return 599, []
 
+        return self._parse_active_servers(response)
+
+    def _active_servers_headers(self) -> Dict[str, str]:
+        headers = self.default_headers()
+        headers.pop("Authorization", None)
+        return headers
+
+    def _parse_active_servers(
+        self, response: _TransportResponse
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        status = response.status
+        try:
+            data = self._response_json(response)
+        except ValueError:
+            if status < 200 or status >= 300:
+                bt.logging.error(f"collector servers status={status} body={response.text()}")
+            return status, []
+
+        items_raw = data.get("items", []) if isinstance(data, dict) else []
+        items: List[Dict[str, Any]] = [
+            item for item in items_raw if isinstance(item, dict) and item.get("id")
+        ]
+
+        if status < 200 or status >= 300:
+            bt.logging.error(f"collector servers status={status} body={response.text()}")
+
+        return status, items
+
     def post_server_vote(
         self,
         server_id: str,
         payload: Dict[str, Any],
         timeout_seconds: Optional[float] = None,
+        idempotency_key: Optional[str] = None,
     ) -> int:
         if not server_id:
             return 400
 
         url = f"{self.base_url}/validators/servers/{server_id}/vote"
-        headers = self.default_headers()
         body = json.dumps(payload).encode("utf-8")
-        req = Request(url, data=body, headers=headers, method="POST")
-        timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
-
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                status = resp.getcode()
-                if status < 200 or status >= 300:
-                    bt.logging.error(
-                        f"collector vote status={status} server_id={server_id} body={resp.read().decode('utf-8', errors='ignore')}"
-                    )
-                return status
-        except HTTPError as e:
-            body = ""
-            try:
-                body = e.read().decode("utf-8", errors="ignore")
-            except Exception:  # noqa: BLE001
-                body = ""
-            bt.logging.error(
-                f"collector vote HTTP error server_id={server_id}: {e.code} {e.reason} body={body}"
+            response = self._request(
+                "vote",
+                "POST",
+                url,
+                headers=self._vote_headers(idempotency_key),
+                data=body,
+                timeout_seconds=timeout_seconds,
+                resource=server_id,
             )
-            return e.code
         except Exception as e:  # noqa: BLE001
             bt.logging.error(f"collector vote error server_id={server_id}: {e}")
             return 599
+
+        return self._parse_server_vote(server_id, response)
+
+    def _vote_headers(self, idempotency_key: Optional[str]) -> Dict[str, str]:
+        headers = self.default_headers()
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        return headers
+
+    def _parse_server_vote(self, server_id: str, response: _TransportResponse) -> int:
+        status = response.status
+        if status >= 400:
+            bt.logging.error(
+                f"collector vote HTTP error server_id={server_id}: {status} {response.reason} body={response.text()}"
+            )
+        elif status < 200 or status >= 300:
+            bt.logging.error(
+                f"collector vote status={status} server_id={server_id} body={response.text()}"
+            )
+        return status
@@ -0,0 +1,264 @@
+"""HTTP transport shared by Collector Center API mixins."""
+
+import asyncio
+import threading
+import zlib
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional codec
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional codec
+    zstandard = None
+
+
+# Marks a response whose body has not been JSON-decoded yet.
+_UNDECODED: Any = object()
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+_ACCEPT_ENCODING = ", ".join(
+    ["gzip", "deflate"]
+    + (["br"] if brotli is not None else [])
+    + (["zstd"] if zstandard is not None else [])
+)
+
+
+class _Decompressor:
+    """Incremental decoder for one ``Content-Encoding`` chain (e.g. ``gzip``)."""
+
+    def __init__(self, content_encoding: str) -> None:
+        self.encoding = content_encoding.strip().lower() or "identity"
+        codings = [
+            coding.strip()
+            for coding in self.encoding.split(",")
+            if coding.strip() and coding.strip() != "identity"
+        ]
+        # Codings are listed in the order they were applied, so undo them in reverse.
+        self._stages = [self._make_stage(coding) for coding in reversed(codings)]
+
+    @staticmethod
+    def _make_stage(coding: str) -> Any:
+        if coding in ("gzip", "x-gzip"):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if coding == "deflate":
+            return zlib.decompressobj()
+        if coding == "br" and brotli is not None:
+            return brotli.Decompressor()
+        if coding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompressobj()
+        raise ValueError(f"Unsupported Content-Encoding '{coding}'")
+
+    def decompress(self, chunk: bytes) -> bytes:
+        for stage in self._stages:
+            if not chunk:
+                break
+            chunk = stage.process(chunk) if hasattr(stage, "process") else stage.decompress(chunk)
+        return chunk
+
+    def flush(self) -> bytes:
+        tail = b""
+        for stage in self._stages:
+            if tail:
+                tail = stage.process(tail) if hasattr(stage, "process") else stage.decompress(tail)
+            if hasattr(stage, "flush"):
+                tail += stage.flush()
+        return tail
+
+
+class _TransferCounters:
+    """Per-endpoint wire (compressed) vs. decoded body byte counters."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, response: "_TransportResponse") -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                endpoint,
+                {"responses": 0, "wire_bytes": 0, "body_bytes": 0, "encodings": {}},
+            )
+            counters["responses"] += 1
+            counters["wire_bytes"] += response.wire_bytes
+            counters["body_bytes"] += len(response.body)
+            encodings = counters["encodings"]
+            encodings[response.content_encoding] = encodings.get(response.content_encoding, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "accept_encoding": _ACCEPT_ENCODING,
+                "endpoints": {
+                    name: {**values, "encodings": dict(values["encodings"])}
+                    for name, values in self._counters.items()
+                },
+            }
+
+
+@dataclass
+class _TransportResponse:
+    """Fully-read collector response handed back to the mixins."""
+
+    status: int
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    reason: str = ""
+    elapsed: float = 0.0
+    data: Any = _UNDECODED
+    endpoint: str = ""
+    wire_bytes: int = 0
+    content_encoding: str = "identity"
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="ignore")
+
+
+class _PooledTransport:
+    """Thread-safe keep-alive connection pool used for every collector call.
+
+    A single ``requests`` session is shared across threads; its adapter keeps up to
+    ``pool_size`` idle connections per host so repeated calls skip the TCP/TLS handshake.
+    Bodies are read raw and decompressed here in chunks so the wire size stays visible.
+    Non-2xx responses are returned rather than raised; only network failures raise.
+    """
+
+    def __init__(self, pool_size: int = 16, keep_alive: bool = True) -> None:
+        self.pool_size = max(1, int(pool_size))
+        self.keep_alive = bool(keep_alive)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.pool_size,
+            max_retries=0,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        request_headers = dict(headers)
+        request_headers.setdefault("Accept-Encoding", _ACCEPT_ENCODING)
+        if not self.keep_alive:
+            request_headers["Connection"] = "close"
+
+        start = perf_counter()
+        response = self._session.request(
+            method,
+            url,
+            headers=request_headers,
+            data=data,
+            timeout=timeout,
+            stream=True,
+        )
+        try:
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            decompressor = _Decompressor(response_headers.get("content-encoding", ""))
+            parts: List[bytes] = []
+            wire_bytes = 0
+            for chunk in response.raw.stream(_READ_CHUNK_BYTES, decode_content=False):
+                wire_bytes += len(chunk)
+                parts.append(decompressor.decompress(chunk))
+            parts.append(decompressor.flush())
+        finally:
+            response.close()
+
+        return _TransportResponse(
+            status=response.status_code,
+            body=b"".join(parts),
+            headers=response_headers,
+            reason=response.reason or "",
+            elapsed=perf_counter() - start,
+            wire_bytes=wire_bytes,
+            content_encoding=decompressor.encoding,
+        )
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class _AsyncPooledTransport:
+    """Non-blocking counterpart of :class:`_PooledTransport` built on ``aiohttp``.
+
+    The client session is created lazily on first use so it binds to the loop that
+    actually runs the mechanisms; it is recreated if that loop changes.
+    """
+
+    def __init__(self, pool_size: int = 16, keep_alive: bool = True) -> None:
+        self.pool_size = max(1, int(pool_size))
+        self.keep_alive = bool(keep_alive)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                force_close=not self.keep_alive,
+            )
+            # Decompression happens in ``request_async`` so wire bytes can be counted.
+            self._session = aiohttp.ClientSession(connector=connector, auto_decompress=False)
+            self._loop = loop
+        return self._session
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        session = self._get_session()
+        request_headers = dict(headers)
+        request_headers.setdefault("Accept-Encoding", _ACCEPT_ENCODING)
+        start = perf_counter()
+        async with session.request(
+            method,
+            url,
+            headers=request_headers,
+            data=data,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            decompressor = _Decompressor(response_headers.get("content-encoding", ""))
+            parts: List[bytes] = []
+            wire_bytes = 0
+            async for chunk in response.content.iter_chunked(_READ_CHUNK_BYTES):
+                wire_bytes += len(chunk)
+                parts.append(decompressor.decompress(chunk))
+            parts.append(decompressor.flush())
+            return _TransportResponse(
+                status=response.status,
+                body=b"".join(parts),
+                headers=response_headers,
+                reason=response.reason or "",
+                elapsed=perf_counter() - start,
+                wire_bytes=wire_bytes,
+                content_encoding=decompressor.encoding,
+            )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
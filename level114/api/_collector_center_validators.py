@@ -1,13 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Tuple
-from urllib.error import HTTPError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-import json
 
 import bittensor as bt
 
 from level114.types import ValidatorServer
 
+from ._collector_center_transport import _TransportResponse
+
 
 class _ValidatorEndpointsMixin:
     """Validator and server lookup helpers."""
@@ -15,86 +15,96 @@ class _ValidatorEndpointsMixin:
     def _fetch_validator_server_ids_chunk(
         self,
         hotkeys_chunk: List[str],
-        timeout: float,
+        timeout: Optional[float],
         chunk_index: int,
         total_chunks: int,
     ) -> Tuple[int, List[ValidatorServer]]:
         if not hotkeys_chunk:
             return 400, []
 
-        query = urlencode({"hotkeys": ",".join(hotkeys_chunk)})
-        url = f"{self.base_url}/validators/servers/ids?{query}"
-        req = Request(url, headers=self.default_headers(), method="GET")
-
+        url = self._validator_server_ids_url(hotkeys_chunk)
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                status = resp.getcode()
-                body = resp.read().decode("utf-8", errors="ignore")
-                try:
-                    data = json.loads(body)
-                except json.JSONDecodeError:
-                    if status < 200 or status >= 300:
-                        bt.logging.error(
-                            f"collector ids chunk={chunk_index}/{total_chunks} status={status} body={body}"
-                        )
-                    return status, []
-
-                items_raw = data.get("items", []) if isinstance(data, dict) else []
-                items: List[ValidatorServer] = []
-                for item in items_raw:
-                    if isinstance(item, dict):
-                        vid = str(item.get("id", ""))
-                        hk = str(item.get("hotkey", ""))
-                        reg = item.get("registered_at")
-                        if vid and hk:
-                            items.append(ValidatorServer(id=vid, hotkey=hk, registered_at=reg))
-
-                if status < 200 or status >= 300:
-                    bt.logging.error(
-                        f"collector ids chunk={chunk_index}/{total_chunks} status={status} body={body}"
-                    )
-                return status, items
-        except HTTPError as e:
-            bt.logging.error(
-                f"collector ids chunk={chunk_index}/{total_chunks} error: HTTP {e.code} - {e.reason}"
+            response = self._request(
+                "ids",
+                "GET",
+                url,
+                headers=self.default_headers(),
+                timeout_seconds=timeout,
+                conditional=True,
             )
-            return e.code, []
         except Exception as e:  # noqa: BLE001
             bt.logging.error(
                 f"collector ids chunk={chunk_index}/{total_chunks} error: {e}"
             )
             return 599, []
 
-    def get_validator_server_ids(
-        self, hotkeys: List[str], timeout_seconds: Optional[float] = None
-    ) -> Tuple[int, List[ValidatorServer]]:
-        if not hotkeys:
-            return 400, []
+        return self._parse_validator_server_ids(response, chunk_index, total_chunks)
 
-        unique_hotkeys = list(dict.fromkeys(hotkeys))
+    def _validator_server_ids_url(self, hotkeys_chunk: List[str]) -> str:
+        query = urlencode({"hotkeys": ",".join(hotkeys_chunk)})
+        return f"{self.base_url}/validators/servers/ids?{query}"
 
-        timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
+    def _parse_validator_server_ids(
+        self,
+        response: _TransportResponse,
+        chunk_index: int,
+        total_chunks: int,
+    ) -> Tuple[int, List[ValidatorServer]]:
+        status = response.status
+        if status >= 400:
+            bt.logging.error(
+                f"collector ids chunk={chunk_index}/{total_chunks} error: HTTP {status} - {response.reason}"
+            )
+            return status, []
+
+        try:
+            data = self._response_json(response)
+        except ValueError:
+            if status < 200 or status >= 300:
+                bt.logging.error(
+                    f"collector ids chunk={chunk_index}/{total_chunks} status={status} body={response.text()}"
+                )
+            return status, []
+
+        items_raw = data.get("items", []) if isinstance(data, dict) else []
+        items: List[ValidatorServer] = []
+        for item in items_raw:
+            if isinstance(item, dict):
+                vid = str(item.get("id", ""))
+                hk = str(item.get("hotkey", ""))
+                reg = item.get("registered_at")
+                if vid and hk:
+                    items.append(ValidatorServer(id=vid, hotkey=hk, registered_at=reg))
+
+        if status < 200 or status >= 300:
+            bt.logging.error(
+                f"collector ids chunk={chunk_index}/{total_chunks} status={status} body={response.text()}"
+            )
+        return status, items
 
-        max_chunks = 5
-        chunk_count = min(max_chunks, len(unique_hotkeys)) or 1
-        chunk_size = max(1, (len(unique_hotkeys) + chunk_count - 1) // chunk_count)
-        total_chunks = (len(unique_hotkeys) + chunk_size - 1) // chunk_size
+    def _plan_validator_server_id_chunks(self, hotkeys: List[str]) -> List[List[str]]:
+        unique_hotkeys = list(dict.fromkeys(hotkeys))
 
+        chunk_size = self.ids_chunk_size
+        if chunk_size is None:
+            max_chunks = 5
+            chunk_count = min(max_chunks, len(unique_hotkeys)) or 1
+            chunk_size = max(1, (len(unique_hotkeys) + chunk_count - 1) // chunk_count)
+        return [
+            unique_hotkeys[idx : idx + chunk_size]
+            for idx in range(0, len(unique_hotkeys), chunk_size)
+        ]
+
+    @staticmethod
+    def _merge_validator_server_id_chunks(
+        chunk_results: List[Tuple[int, List[ValidatorServer]]],
+    ) -> Tuple[int, List[ValidatorServer]]:
         aggregated: List[ValidatorServer] = []
         seen_pairs: Set[Tuple[str, str]] = set()
         first_error_status: Optional[int] = None
         any_success = False
 
-        for idx in range(0, len(unique_hotkeys), chunk_size):
-            chunk_index = (idx // chunk_size) + 1
-            chunk_hotkeys = unique_hotkeys[idx : idx + chunk_size]
-            status, items = self._fetch_validator_server_ids_chunk(
-                chunk_hotkeys,
-                timeout,
-                chunk_index,
-                total_chunks,
-            )
-
+        for status, items in chunk_results:
             if first_error_status is None and (status < 200 or status >= 300):
                 first_error_status = status
             if 200 <= status < 300:
@@ -112,19 +122,55 @@ class _ValidatorEndpointsMixin:
 
         return (first_error_status or 599), []
 
+    def get_validator_server_ids(
+        self, hotkeys: List[str], timeout_seconds: Optional[float] = None
+    ) -> Tuple[int, List[ValidatorServer]]:
+        if not hotkeys:
+            return 400, []
+
+        chunks = self._plan_validator_server_id_chunks(hotkeys)
+        total_chunks = len(chunks)
+        # ``pool.map`` yields in submission order, so the merge stays in chunk order.
+        with ThreadPoolExecutor(max_workers=min(self.ids_max_concurrency, total_chunks)) as pool:
+            chunk_results: List[Tuple[int, List[ValidatorServer]]] = list(
+                pool.map(
+                    lambda indexed: self._fetch_validator_server_ids_chunk(
+                        indexed[1],
+                        timeout_seconds,
+                        indexed[0],
+                        total_chunks,
+                    ),
+                    enumerate(chunks, 1),
+                )
+            )
+
+        return self._merge_validator_server_id_chunks(chunk_results)
+
     def get_validator_server_ids_map(
         self, hotkeys: List[str], timeout_seconds: Optional[float] = None
     ) -> Tuple[int, Dict[str, List[ValidatorServer]]]:
         status, items = self.get_validator_server_ids(hotkeys, timeout_seconds)
-        mapping: Dict[str, List[ValidatorServer]] = {}
-        for item in items:
-            mapping.setdefault(item.hotkey, []).append(item)
-        return status, mapping
+        return status, self._group_validator_servers(items)
 
     def get_server_mappings(
         self, hotkeys: List[str], timeout_seconds: Optional[float] = None
     ) -> Tuple[int, Dict[str, List[Dict[str, Any]]]]:
         status, mapping = self.get_validator_server_ids_map(hotkeys, timeout_seconds)
+        return status, self._server_mappings_payload(mapping)
+
+    @staticmethod
+    def _group_validator_servers(
+        items: List[ValidatorServer],
+    ) -> Dict[str, List[ValidatorServer]]:
+        mapping: Dict[str, List[ValidatorServer]] = {}
+        for item in items:
+            mapping.setdefault(item.hotkey, []).append(item)
+        return mapping
+
+    @staticmethod
+    def _server_mappings_payload(
+        mapping: Dict[str, List[ValidatorServer]],
+    ) -> Dict[str, List[Dict[str, Any]]]:
         result: Dict[str, List[Dict[str, Any]]] = {}
         for hotkey, validator_servers in mapping.items():
             if not isinstance(validator_servers, list):
@@ -140,4 +186,4 @@ class _ValidatorEndpointsMixin:
                 )
             if servers_payload:
                 result[hotkey] = servers_payload
-        return status, result
+        return result
@@ -0,0 +1,322 @@
+"""Asyncio Collector Center API client."""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+import bittensor as bt
+
+from level114.types import ValidatorServer
+
+from ._collector_center_transport import _AsyncPooledTransport, _TransportResponse
+from .collector_center_api import CollectorCenterAPI
+
+__all__ = ["AsyncCollectorCenterAPI"]
+
+
+class AsyncCollectorCenterAPI:
+    """Non-blocking client mirroring :class:`CollectorCenterAPI`.
+
+    Wraps a synchronous client and reuses its configuration, URL builders and
+    response parsers, so both clients always agree on request and result shapes.
+    Only the I/O differs: requests go through a shared ``aiohttp`` session.
+    """
+
+    def __init__(
+        self,
+        client: CollectorCenterAPI,
+        max_connections: Optional[int] = None,
+        transport: Optional[Any] = None,
+    ) -> None:
+        self.client = client
+        self.base_url = client.base_url
+        if transport is None and hasattr(client._transport, "request_async"):
+            # In-process transports serve both clients.
+            transport = client._transport
+        if transport is None:
+            pool_size = max_connections if max_connections is not None else client.pool_size
+            transport = _AsyncPooledTransport(pool_size=pool_size, keep_alive=client.keep_alive)
+        self._transport = transport
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout_seconds: Optional[float] = None,
+        conditional: bool = False,
+        revalidate: bool = True,
+        resource: Optional[str] = None,
+    ) -> _TransportResponse:
+        request_headers = self.client._prepare_request(
+            endpoint, url, headers, conditional and revalidate
+        )
+        await self.client._scheduler.acquire_async(endpoint)
+        timeout = self.client._request_timeout(endpoint, timeout_seconds)
+        try:
+            response = await self._transport.request_async(
+                method, url, headers=request_headers, data=data, timeout=timeout
+            )
+        except Exception:
+            self.client._breaker.record_failure(endpoint)
+            raise
+        completed = self.client._complete_request(
+            endpoint, url, response, conditional, resource
+        )
+        if completed is None and revalidate:
+            return await self._request(
+                endpoint,
+                method,
+                url,
+                headers=headers,
+                data=data,
+                timeout_seconds=timeout_seconds,
+                conditional=True,
+                revalidate=False,
+                resource=resource,
+            )
+        return completed if completed is not None else response
+
+    async def get_server_reports(
+        self,
+        server_id: str,
+        limit: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        since_ms: Optional[int] = None,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        if not server_id:
+            return 400, []
+
+        url = self.client._server_reports_url(server_id, limit, since_ms)
+        try:
+            response = await self._request(
+                "reports",
+                "GET",
+                url,
+                headers=self.client.default_headers(),
+                timeout_seconds=timeout_seconds,
+                resource=server_id,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(f"collector reports error server_id={server_id}: {e!r}")
+            return 599, []
+
+        return self.client._parse_server_reports(server_id, response)
+
+    async def get_server_reports_batch(
+        self,
+        server_ids: List[str],
+        limit: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        since_ms: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Tuple[int, List[Dict[str, Any]]]]:
+        """Async variant of :meth:`CollectorCenterAPI.get_server_reports_batch`."""
+        cursors = since_ms or {}
+        unique_ids = [sid for sid in dict.fromkeys(server_ids) if sid]
+        results: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        if not unique_ids:
+            return results
+
+        semaphore = asyncio.Semaphore(self.client.max_concurrency)
+
+        async def _bounded(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        fallback_ids: List[str] = []
+        chunks = self.client._plan_reports_batch_chunks(unique_ids)
+        if chunks:
+            batches = await asyncio.gather(
+                *(
+                    _bounded(
+                        self._fetch_server_reports_batch_chunk(chunk, limit, timeout_seconds, cursors)
+                    )
+                    for chunk in chunks
+                )
+            )
+            for chunk, batch in zip(chunks, batches):
+                if batch is None:
+                    fallback_ids.extend(chunk)
+                else:
+                    results.update(batch)
+        else:
+            fallback_ids = unique_ids
+
+        if fallback_ids:
+            singles = await asyncio.gather(
+                *(
+                    _bounded(self.get_server_reports(sid, limit, timeout_seconds, cursors.get(sid)))
+                    for sid in fallback_ids
+                )
+            )
+            results.update(zip(fallback_ids, singles))
+
+        return {sid: results.get(sid, (599, [])) for sid in unique_ids}
+
+    async def _fetch_server_reports_batch_chunk(
+        self,
+        server_ids: List[str],
+        limit: Optional[int],
+        timeout_seconds: Optional[float],
+        since_ms: Dict[str, int],
+    ) -> Optional[Dict[str, Tuple[int, List[Dict[str, Any]]]]]:
+        url = self.client._server_reports_batch_url(server_ids, limit, since_ms)
+        try:
+            response = await self._request(
+                "reports_batch",
+                "GET",
+                url,
+                headers=self.client.default_headers(),
+                timeout_seconds=timeout_seconds,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(f"collector reports batch error servers={len(server_ids)}: {e!r}")
+            return {sid: (599, []) for sid in server_ids}
+
+        return self.client._parse_server_reports_batch(server_ids, response)
+
+    async def get_active_servers(
+        self, timeout_seconds: Optional[float] = None
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        url = f"{self.base_url}/servers"
+        try:
+            response = await self._request(
+                "servers",
+                "GET",
+                url,
+                headers=self.client._active_servers_headers(),
+                timeout_seconds=timeout_seconds,
+                conditional=True,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(f"collector servers error: {e!r}")
+            return 599, []
+
+        return self.client._parse_active_servers(response)
+
+    async def get_tcl_metrics(
+        self, hotkey: str, timeout_seconds: Optional[float] = None
+    ) -> Tuple[int, Any]:
+        if not hotkey:
+            return 400, None
+
+        url = self.client._tcl_metrics_url(hotkey)
+        try:
+            response = await self._request(
+                "tcl_metrics",
+                "GET",
+                url,
+                headers=self.client.default_headers(),
+                timeout_seconds=timeout_seconds,
+                conditional=True,
+                resource=hotkey,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(f"collector tcl metrics error hotkey={hotkey}: {e!r}")
+            return 599, None
+
+        return self.client._parse_tcl_metrics(hotkey, response)
+
+    async def post_server_vote(
+        self,
+        server_id: str,
+        payload: Dict[str, Any],
+        timeout_seconds: Optional[float] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> int:
+        if not server_id:
+            return 400
+
+        url = f"{self.base_url}/validators/servers/{server_id}/vote"
+        body = json.dumps(payload).encode("utf-8")
+        try:
+            response = await self._request(
+                "vote",
+                "POST",
+                url,
+                headers=self.client._vote_headers(idempotency_key),
+                data=body,
+                timeout_seconds=timeout_seconds,
+                resource=server_id,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(f"collector vote error server_id={server_id}: {e!r}")
+            return 599
+
+        return self.client._parse_server_vote(server_id, response)
+
+    async def _fetch_validator_server_ids_chunk(
+        self,
+        hotkeys_chunk: List[str],
+        timeout: Optional[float],
+        chunk_index: int,
+        total_chunks: int,
+    ) -> Tuple[int, List[ValidatorServer]]:
+        if not hotkeys_chunk:
+            return 400, []
+
+        url = self.client._validator_server_ids_url(hotkeys_chunk)
+        try:
+            response = await self._request(
+                "ids",
+                "GET",
+                url,
+                headers=self.client.default_headers(),
+                timeout_seconds=timeout,
+                conditional=True,
+            )
+        except Exception as e:  # noqa: BLE001
+            bt.logging.error(
+                f"collector ids chunk={chunk_index}/{total_chunks} error: {e!r}"
+            )
+            return 599, []
+
+        return self.client._parse_validator_server_ids(response, chunk_index, total_chunks)
+
+    async def get_validator_server_ids(
+        self, hotkeys: List[str], timeout_seconds: Optional[float] = None
+    ) -> Tuple[int, List[ValidatorServer]]:
+        if not hotkeys:
+            return 400, []
+
+        chunks = self.client._plan_validator_server_id_chunks(hotkeys)
+        total_chunks = len(chunks)
+        semaphore = asyncio.Semaphore(self.client.ids_max_concurrency)
+
+        async def _bounded(index: int, chunk: List[str]) -> Tuple[int, List[ValidatorServer]]:
+            async with semaphore:
+                return await self._fetch_validator_server_ids_chunk(
+                    chunk, timeout_seconds, index, total_chunks
+                )
+
+        chunk_results = await asyncio.gather(
+            *(_bounded(index, chunk) for index, chunk in enumerate(chunks, 1))
+        )
+        return self.client._merge_validator_server_id_chunks(list(chunk_results))
+
+    async def get_validator_server_ids_map(
+        self, hotkeys: List[str], timeout_seconds: Optional[float] = None
+    ) -> Tuple[int, Dict[str, List[ValidatorServer]]]:
+        status, items = await self.get_validator_server_ids(hotkeys, timeout_seconds)
+        return status, self.client._group_validator_servers(items)
+
+    async def get_server_mappings(
+        self, hotkeys: List[str], timeout_seconds: Optional[float] = None
+    ) -> Tuple[int, Dict[str, List[Dict[str, Any]]]]:
+        status, mapping = await self.get_validator_server_ids_map(hotkeys, timeout_seconds)
+        return status, self.client._server_mappings_payload(mapping)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self.client.get_stats()
+
+    async def close(self) -> None:
+        """Close the shared ``aiohttp`` session."""
+        if self._transport is not self.client._transport:
+            await self._transport.close()
+            return
+        close_async = getattr(self._transport, "close_async", None)
+        if close_async is not None:
+            await close_async()
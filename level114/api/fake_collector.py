@@ -0,0 +1,572 @@
+"""Self-contained stand-in for the Collector Center used for local benchmarking.
+
+The fake serves the endpoints the validator uses, with synthetic but
+deterministic data derived from a seed:
+
+* ``GET  /validators/servers/ids?hotkeys=...``
+* ``GET  /validators/servers/{id}/reports?limit=&since_ms=``
+* ``GET  /validators/servers/reports?server_ids=&limit=&since_ms=`` (batch)
+* ``GET  /servers``
+* ``GET  /validators/tcl/metrics?hotkey=...``
+* ``POST /validators/servers/{id}/vote``
+
+It can run in-process (:class:`FakeCollectorTransport`, passed to
+``CollectorCenterAPI(transport=...)``) or as a local HTTP server
+(:class:`FakeCollectorServer`, or ``python -m level114.api.fake_collector``)
+that a validator reaches through ``--collector.url``. Latency, 5xx errors and
+429 throttling can be injected to benchmark behaviour under a degraded collector.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from ._collector_center_transport import _TransportResponse
+
+__all__ = [
+    "FakeCollector",
+    "FakeCollectorConfig",
+    "FakeCollectorServer",
+    "FakeCollectorTransport",
+]
+
+_REQUIRED_PLUGINS = ["Level114", "LuckPerms", "CraftingStore", "PlayerPoints"]
+_OPTIONAL_PLUGINS = ["ViaVersion", "ViaBackwards", "EssentialsX", "WorldEdit"]
+
+
+@dataclass
+class FakeCollectorConfig:
+    """Shape of the synthetic fleet and the faults to inject."""
+
+    servers: int = 100
+    servers_per_hotkey: int = 1
+    hotkeys: Optional[List[str]] = None
+    seed: int = 114
+    reports_per_server: int = 50
+    report_interval_ms: int = 60_000
+    compliance_rate: float = 0.9
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: int = 1
+    batch_route: bool = True
+    etags: bool = True
+
+
+@dataclass
+class _FakeResponse:
+    status: int
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+def _stable_int(*parts: Any) -> int:
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big")
+
+
+def _uuid_for(*parts: Any) -> str:
+    raw = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f"{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:32]}"
+
+
+class FakeCollector:
+    """Request handler core shared by the HTTP server and in-process transport.
+
+    Every response is a pure function of the seed, the request and the time it
+    is served, except for injected faults, which are drawn from their own seeded
+    generator. Each server files a report every ``report_interval_ms``, starting
+    ``reports_per_server`` reports before the fake was created, so a long run
+    keeps seeing fresh reports and incremental syncs keep finding new ones.
+    """
+
+    def __init__(self, config: Optional[FakeCollectorConfig] = None) -> None:
+        self.config = config or FakeCollectorConfig()
+        self.started_ms = int(time.time() * 1000)
+        self._fault_rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.request_counts: Dict[str, int] = {}
+        self.votes: Dict[str, Dict[str, Any]] = {}
+        self._idempotency_keys: set = set()
+
+        per_hotkey = max(1, int(self.config.servers_per_hotkey))
+        self.server_ids: List[str] = [f"srv-{index:05d}" for index in range(self.config.servers)]
+        self.server_hotkeys: Dict[str, str] = {}
+        self.hotkey_servers: Dict[str, List[str]] = {}
+        for index, server_id in enumerate(self.server_ids):
+            slot = index // per_hotkey
+            if self.config.hotkeys:
+                hotkey = self.config.hotkeys[slot % len(self.config.hotkeys)]
+            else:
+                hotkey = f"hk-{slot:05d}"
+            self.server_hotkeys[server_id] = hotkey
+            self.hotkey_servers.setdefault(hotkey, []).append(server_id)
+        self._servers_body: Optional[bytes] = None
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def hotkeys(self) -> List[str]:
+        return list(self.hotkey_servers)
+
+    # ------------------------------------------------------------------ data
+
+    def _profile(self, server_id: str) -> Dict[str, Any]:
+        profile = self._profiles.get(server_id)
+        if profile is None:
+            profile = self._profiles[server_id] = self._make_profile(server_id)
+        return profile
+
+    def _make_profile(self, server_id: str) -> Dict[str, Any]:
+        rng = random.Random(_stable_int(self.config.seed, server_id))
+        plugins = list(_REQUIRED_PLUGINS)
+        if rng.random() >= self.config.compliance_rate:
+            plugins.remove(rng.choice(_REQUIRED_PLUGINS))
+        plugins += rng.sample(_OPTIONAL_PLUGINS, rng.randint(0, len(_OPTIONAL_PLUGINS)))
+        max_players = rng.choice([20, 50, 100, 200])
+        return {
+            "max_players": max_players,
+            "base_players": rng.randint(0, max_players // 2),
+            "tps_millis": rng.randint(17_000, 20_000),
+            "plugins": plugins,
+            "total_memory": rng.choice([4, 8, 16]) * 1024 ** 3,
+            "uptime_ms": rng.randint(1, 30) * 86_400_000,
+        }
+
+    def _latest_counter(self, now_ms: int) -> int:
+        elapsed = max(0, now_ms - self.started_ms)
+        return self.config.reports_per_server + elapsed // self.config.report_interval_ms
+
+    def _timestamp(self, counter: int) -> int:
+        return self.started_ms + (counter - self.config.reports_per_server) * self.config.report_interval_ms
+
+    def report(self, server_id: str, age_index: int, now_ms: Optional[int] = None) -> Dict[str, Any]:
+        """The ``age_index``-th newest report of ``server_id`` at ``now_ms`` (0 = latest)."""
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        profile = self._profile(server_id)
+        counter = self._latest_counter(now_ms) - age_index
+        rng = random.Random(_stable_int(self.config.seed, server_id, counter))
+        players = max(0, min(profile["max_players"], profile["base_players"] + rng.randint(-3, 3)))
+        used_memory = int(profile["total_memory"] * rng.uniform(0.3, 0.8))
+        timestamp = self._timestamp(counter)
+        payload = {
+            "active_players": [
+                {
+                    "name": f"{server_id}-player{player}",
+                    "uuid": _uuid_for(server_id, player),
+                    "power": round(rng.uniform(0.0, 10.0), 2),
+                }
+                for player in range(players)
+            ],
+            "max_players": profile["max_players"],
+            "memory_ram_info": {
+                "free_memory_bytes": profile["total_memory"] - used_memory,
+                "used_memory_bytes": used_memory,
+                "total_memory_bytes": profile["total_memory"],
+            },
+            "plugins": profile["plugins"],
+            "system_info": {
+                "cpu_cores": 4,
+                "cpu_threads": 8,
+                "cpu_model": "Fake CPU",
+                "java_version": "21",
+                "os_name": "Linux",
+                "os_version": "6.1",
+                "os_arch": "amd64",
+                "uptime_ms": profile["uptime_ms"] + counter * self.config.report_interval_ms,
+            },
+            "tps_millis": max(0, profile["tps_millis"] - rng.randint(0, 500)),
+            "uptime_ms": profile["uptime_ms"] + counter * self.config.report_interval_ms,
+        }
+        return {
+            "id": f"{server_id}-{counter}",
+            "server_id": server_id,
+            "counter": counter,
+            "client_timestamp_ms": timestamp,
+            "nonce": f"{_stable_int(server_id, counter):016x}",
+            "plugin_hash": f"{_stable_int(profile['plugins']):016x}",
+            "payload_hash": f"{_stable_int(server_id, counter, 'payload'):016x}",
+            "payload": payload,
+            "signature": "fake",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp / 1000)),
+        }
+
+    def reports(self, server_id: str, limit: int, since_ms: Optional[int]) -> List[Dict[str, Any]]:
+        now_ms = int(time.time() * 1000)
+        latest = self._latest_counter(now_ms)
+        items: List[Dict[str, Any]] = []
+        for age_index in range(min(limit, self.config.reports_per_server)):
+            if since_ms is not None and self._timestamp(latest - age_index) <= since_ms:
+                break
+            items.append(self.report(server_id, age_index, now_ms))
+        return items
+
+    def tcl_metrics(self, hotkey: str) -> Dict[str, Any]:
+        rng = random.Random(_stable_int(self.config.seed, "tcl", hotkey))
+        players = rng.randint(0, 60)
+        return {
+            "online_players_count": players,
+            "online_players": [
+                {"name": f"player{index}", "playtime": rng.randint(60, 36_000)}
+                for index in range(players)
+            ],
+            "daily_unique_logins": rng.randint(0, 500),
+            "monthly_new_users": rng.randint(0, 2_000),
+        }
+
+    def _servers_payload(self) -> bytes:
+        if self._servers_body is None:
+            items = []
+            for index, server_id in enumerate(self.server_ids):
+                profile = self._profile(server_id)
+                items.append(
+                    {
+                        "id": server_id,
+                        "hotkey": self.server_hotkeys[server_id],
+                        "ip": f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}",
+                        "port": 25565,
+                        "active_players": profile["base_players"],
+                        "max_players": profile["max_players"],
+                    }
+                )
+            self._servers_body = _json_bytes({"items": items})
+        return self._servers_body
+
+    # -------------------------------------------------------------- routing
+
+    def handle(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[bytes] = None
+    ) -> _FakeResponse:
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/")
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        lowered = {key.lower(): value for key, value in (headers or {}).items()}
+        segments = [segment for segment in path.split("/") if segment]
+
+        route = self._route_name(method, segments)
+        with self._lock:
+            self.request_counts[route] = self.request_counts.get(route, 0) + 1
+            delay = max(
+                0.0,
+                self.config.latency_ms
+                + self._fault_rng.uniform(-1.0, 1.0) * self.config.latency_jitter_ms,
+            ) / 1000.0
+            roll = self._fault_rng.random()
+
+        if route != "servers" and not lowered.get("authorization", "").startswith("Bearer "):
+            return _FakeResponse(401, _json_bytes({"error": "unauthorized"}), delay=delay)
+        if roll < self.config.throttle_rate:
+            return _FakeResponse(
+                429,
+                _json_bytes({"error": "rate limited"}),
+                {"retry-after": str(self.config.retry_after_seconds)},
+                delay,
+            )
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            return _FakeResponse(503, _json_bytes({"error": "injected failure"}), delay=delay)
+
+        response = self._dispatch(route, segments, query, lowered, body)
+        response.delay = delay
+        if self.config.etags and method == "GET" and response.status == 200:
+            etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+            response.headers["etag"] = etag
+            if lowered.get("if-none-match") == etag:
+                return _FakeResponse(304, b"", {"etag": etag}, delay)
+        return response
+
+    @staticmethod
+    def _route_name(method: str, segments: List[str]) -> str:
+        if method == "POST" and len(segments) == 4 and segments[-1] == "vote":
+            return "vote"
+        if method != "GET":
+            return "unknown"
+        if segments == ["servers"]:
+            return "servers"
+        if segments == ["validators", "servers", "ids"]:
+            return "ids"
+        if segments == ["validators", "servers", "reports"]:
+            return "reports_batch"
+        if len(segments) == 4 and segments[:2] == ["validators", "servers"] and segments[3] == "reports":
+            return "reports"
+        if segments == ["validators", "tcl", "metrics"]:
+            return "tcl_metrics"
+        return "unknown"
+
+    def _dispatch(
+        self,
+        route: str,
+        segments: List[str],
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        body: Optional[bytes],
+    ) -> _FakeResponse:
+        limit = _int_param(query.get("limit"), 25)
+        since_ms = _int_param(query.get("since_ms"), None)
+
+        if route == "servers":
+            return _FakeResponse(200, self._servers_payload(), {"content-type": "application/json"})
+
+        if route == "ids":
+            items = [
+                {"id": server_id, "hotkey": hotkey, "registered_at": None}
+                for hotkey in (query.get("hotkeys") or "").split(",")
+                for server_id in self.hotkey_servers.get(hotkey, [])
+            ]
+            return _FakeResponse(200, _json_bytes({"items": items}))
+
+        if route == "reports":
+            server_id = segments[2]
+            if server_id not in self.server_hotkeys:
+                return _FakeResponse(404, _json_bytes({"error": "server not found"}))
+            return _FakeResponse(200, _json_bytes({"items": self.reports(server_id, limit, since_ms)}))
+
+        if route == "reports_batch":
+            if not self.config.batch_route:
+                return _FakeResponse(404, _json_bytes({"error": "not found"}))
+            server_ids = [sid for sid in (query.get("server_ids") or "").split(",") if sid]
+            items = {
+                sid: self.reports(sid, limit, since_ms)
+                for sid in server_ids
+                if sid in self.server_hotkeys
+            }
+            return _FakeResponse(200, _json_bytes({"items": items}))
+
+        if route == "tcl_metrics":
+            hotkey = query.get("hotkey") or ""
+            if hotkey not in self.hotkey_servers:
+                return _FakeResponse(404, _json_bytes({"error": "hotkey not found"}))
+            return _FakeResponse(200, _json_bytes(self.tcl_metrics(hotkey)))
+
+        if route == "vote":
+            server_id = segments[2]
+            try:
+                vote = json.loads(body or b"{}")
+            except ValueError:
+                return _FakeResponse(400, _json_bytes({"error": "invalid json"}))
+            key = headers.get("idempotency-key")
+            with self._lock:
+                if key and key in self._idempotency_keys:
+                    return _FakeResponse(200, _json_bytes({"ok": True, "replayed": True}))
+                if key:
+                    self._idempotency_keys.add(key)
+                self.votes[server_id] = vote
+            return _FakeResponse(201, _json_bytes({"ok": True}))
+
+        return _FakeResponse(404, _json_bytes({"error": "not found"}))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"requests": dict(self.request_counts), "votes": len(self.votes)}
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _int_param(value: Optional[str], default: Optional[int]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+class FakeCollectorTransport:
+    """In-process transport for ``CollectorCenterAPI(transport=...)``.
+
+    Serves both the sync and async clients straight from a :class:`FakeCollector`
+    without sockets; injected latency is slept (``time.sleep`` / ``asyncio.sleep``)
+    and requests slower than their timeout raise ``TimeoutError``.
+    """
+
+    def __init__(self, collector: FakeCollector) -> None:
+        self.collector = collector
+
+    def _to_response(self, fake: _FakeResponse, elapsed: float) -> _TransportResponse:
+        return _TransportResponse(
+            status=fake.status,
+            body=fake.body,
+            headers=dict(fake.headers),
+            reason="",
+            elapsed=elapsed,
+            wire_bytes=len(fake.body),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        start = time.perf_counter()
+        fake = self.collector.handle(method, url, headers, data)
+        if fake.delay > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"fake collector timed out after {timeout:.2f}s")
+        if fake.delay:
+            time.sleep(fake.delay)
+        return self._to_response(fake, time.perf_counter() - start)
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[bytes] = None,
+        timeout: float,
+    ) -> _TransportResponse:
+        start = time.perf_counter()
+        fake = self.collector.handle(method, url, headers, data)
+        if fake.delay > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError(f"fake collector timed out after {timeout:.2f}s")
+        if fake.delay:
+            await asyncio.sleep(fake.delay)
+        return self._to_response(fake, time.perf_counter() - start)
+
+    def close(self) -> None:
+        return None
+
+
+class FakeCollectorServer:
+    """Serve a :class:`FakeCollector` over HTTP on a background thread."""
+
+    def __init__(self, collector: FakeCollector, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.collector = collector
+        handler = _make_handler(collector)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-collector", daemon=True
+        )
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeCollectorServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def _make_handler(collector: FakeCollector) -> type:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return None
+
+        def _serve(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else None
+            fake = collector.handle(method, self.path, dict(self.headers.items()), body)
+            if fake.delay:
+                time.sleep(fake.delay)
+            payload = fake.body
+            headers = dict(fake.headers)
+            if len(payload) > 1024 and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                payload = gzip.compress(payload, compresslevel=5)
+                headers["content-encoding"] = "gzip"
+            self.send_response(fake.status)
+            headers.setdefault("content-type", "application/json")
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            if payload:
+                self.wfile.write(payload)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._serve("GET")
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._serve("POST")
+
+    return _Handler
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a local fake Collector Center")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8114)
+    parser.add_argument("--servers", type=int, default=100)
+    parser.add_argument("--servers-per-hotkey", type=int, default=1)
+    parser.add_argument(
+        "--hotkeys-file",
+        help="File with one hotkey per line to own the synthetic servers (e.g. a metagraph dump)",
+    )
+    parser.add_argument("--seed", type=int, default=114)
+    parser.add_argument("--reports-per-server", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--no-batch-route", action="store_true")
+    parser.add_argument("--no-etags", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    hotkeys = None
+    if args.hotkeys_file:
+        with open(args.hotkeys_file, "r", encoding="utf-8") as handle:
+            hotkeys = [line.strip() for line in handle if line.strip()]
+    collector = FakeCollector(
+        FakeCollectorConfig(
+            servers=args.servers,
+            servers_per_hotkey=args.servers_per_hotkey,
+            hotkeys=hotkeys,
+            seed=args.seed,
+            reports_per_server=args.reports_per_server,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            batch_route=not args.no_batch_route,
+            etags=not args.no_etags,
+        )
+    )
+    server = FakeCollectorServer(collector, host=args.host, port=args.port)
+    print(f"Fake collector serving {args.servers} servers at {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(json.dumps(collector.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
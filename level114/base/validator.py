@@ -71,6 +71,20 @@ class BaseValidatorNeuron(BaseNeuron):
             timeout_seconds=collector_cfg.timeout,
             api_key=collector_cfg.api_key,
             reports_limit_default=collector_cfg.reports_limit,
+            pool_size=getattr(collector_cfg, 'pool_size', 16),
+            keep_alive=not getattr(collector_cfg, 'disable_keep_alive', False),
+            max_concurrency=getattr(collector_cfg, 'max_concurrency', 16),
+            reports_batch_size=getattr(collector_cfg, 'reports_batch_size', 0),
+            ids_chunk_size=getattr(collector_cfg, 'ids_chunk_size', None),
+            ids_max_concurrency=getattr(collector_cfg, 'ids_max_concurrency', None),
+            adaptive_timeout=not getattr(collector_cfg, 'disable_adaptive_timeout', False),
+            breaker_threshold=getattr(collector_cfg, 'breaker_threshold', 5),
+            breaker_cooldown=getattr(collector_cfg, 'breaker_cooldown', 30.0),
+            rate_limit=getattr(collector_cfg, 'rate_limit', 0.0),
+            rate_burst=getattr(collector_cfg, 'rate_burst', None),
+            cassette_mode=getattr(collector_cfg, 'cassette_mode', 'off'),
+            cassette_path=getattr(collector_cfg, 'cassette_path', None),
+            cassette_latency_scale=getattr(collector_cfg, 'cassette_latency_scale', 0.0),
         )
 
         # Init sync with the network. Updates the metagraph.
@@ -138,6 +152,19 @@ class BaseValidatorNeuron(BaseNeuron):
         except Exception as e:
             bt.logging.error(traceback.format_exc())
 
+        finally:
+            try:
+                self.loop.run_until_complete(self.shutdown())
+            except Exception:
+                bt.logging.error(traceback.format_exc())
+
+    async def shutdown(self):
+        """
+        Releases resources held by the validator. Called once when the main loop in `run` ends.
+        Closing the collector client also flushes and closes a cassette being recorded.
+        """
+        self.collector_api.close()
+
     def run_in_background_thread(self):
         """
         Starts the validator's operations in a separate background thread.
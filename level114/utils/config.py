@@ -60,6 +60,36 @@ def check_config(cls, config: "bt.Config"):
         config.collector.api_key = None
     if not hasattr(config.collector, 'reports_limit'):
         config.collector.reports_limit = 25
+    if not hasattr(config.collector, 'pool_size'):
+        config.collector.pool_size = 16
+    if not hasattr(config.collector, 'disable_keep_alive'):
+        config.collector.disable_keep_alive = False
+    if not hasattr(config.collector, 'max_concurrency'):
+        config.collector.max_concurrency = 16
+    if not hasattr(config.collector, 'reports_batch_size'):
+        config.collector.reports_batch_size = 0
+    if not hasattr(config.collector, 'ids_chunk_size'):
+        config.collector.ids_chunk_size = None
+    if not hasattr(config.collector, 'ids_max_concurrency'):
+        config.collector.ids_max_concurrency = None
+    if not hasattr(config.collector, 'disable_adaptive_timeout'):
+        config.collector.disable_adaptive_timeout = False
+    if not hasattr(config.collector, 'breaker_threshold'):
+        config.collector.breaker_threshold = 5
+    if not hasattr(config.collector, 'breaker_cooldown'):
+        config.collector.breaker_cooldown = 30.0
+    if not hasattr(config.collector, 'rate_limit'):
+        config.collector.rate_limit = 0.0
+    if not hasattr(config.collector, 'rate_burst'):
+        config.collector.rate_burst = None
+    if not hasattr(config.collector, 'cassette_mode'):
+        config.collector.cassette_mode = "off"
+    if not getattr(config.collector, 'cassette_path', None):
+        config.collector.cassette_path = os.path.join(
+            config.neuron.full_path, "collector_cassette.jsonl.gz"
+        )
+    if not hasattr(config.collector, 'cassette_latency_scale'):
+        config.collector.cassette_latency_scale = 0.0
 
 
 def add_args(cls, parser):
@@ -129,6 +159,91 @@ def add_collector_args(parser: argparse.ArgumentParser):
     collector_group.add_argument("--collector.timeout", type=float, help="Collector timeout seconds", default=10.0)
     collector_group.add_argument("--collector.api_key", type=str, help="Collector API key (Bearer)", default=None)
     collector_group.add_argument("--collector.reports_limit", type=int, help="Default reports limit", default=25)
+    collector_group.add_argument(
+        "--collector.pool_size",
+        type=int,
+        help="Maximum pooled keep-alive connections to the collector",
+        default=16,
+    )
+    collector_group.add_argument(
+        "--collector.disable_keep_alive",
+        action="store_true",
+        help="Close collector connections after every request instead of reusing them",
+        default=False,
+    )
+    collector_group.add_argument(
+        "--collector.max_concurrency",
+        type=int,
+        help="Maximum in-flight collector requests per mechanism fan-out",
+        default=16,
+    )
+    collector_group.add_argument(
+        "--collector.reports_batch_size",
+        type=int,
+        help="Servers per multi-server reports request; opt-in, for collectors that serve the batch route (0 or 1 disables batching)",
+        default=0,
+    )
+    collector_group.add_argument(
+        "--collector.ids_chunk_size",
+        type=int,
+        help="Hotkeys per validator server-id request (default: split into at most 5 chunks)",
+        default=None,
+    )
+    collector_group.add_argument(
+        "--collector.ids_max_concurrency",
+        type=int,
+        help="In-flight validator server-id chunk requests (default: --collector.max_concurrency)",
+        default=None,
+    )
+    collector_group.add_argument(
+        "--collector.disable_adaptive_timeout",
+        action="store_true",
+        help="Always use --collector.timeout instead of per-endpoint timeouts derived from observed p99 latency",
+        default=False,
+    )
+    collector_group.add_argument(
+        "--collector.breaker_threshold",
+        type=int,
+        help="Consecutive failures before a collector endpoint fails fast (0 disables the breaker)",
+        default=5,
+    )
+    collector_group.add_argument(
+        "--collector.breaker_cooldown",
+        type=float,
+        help="Seconds a tripped collector endpoint fails fast before a probe request is allowed",
+        default=30.0,
+    )
+    collector_group.add_argument(
+        "--collector.rate_limit",
+        type=float,
+        help="Requests per second shared by all collector calls (default 0: no client-side scheduling)",
+        default=0.0,
+    )
+    collector_group.add_argument(
+        "--collector.rate_burst",
+        type=float,
+        help="Collector requests allowed in a burst above the rate limit (default: 2x rate)",
+        default=None,
+    )
+    collector_group.add_argument(
+        "--collector.cassette_mode",
+        type=str,
+        choices=["off", "record", "replay"],
+        help="Record collector traffic to a cassette, or replay a recorded cassette instead of the network",
+        default="off",
+    )
+    collector_group.add_argument(
+        "--collector.cassette_path",
+        type=str,
+        help="Cassette file (gzip JSONL) for --collector.cassette_mode (default: <neuron dir>/collector_cassette.jsonl.gz)",
+        default=None,
+    )
+    collector_group.add_argument(
+        "--collector.cassette_latency_scale",
+        type=float,
+        help="Fraction of recorded latency slept during replay (0 = as fast as possible, 1 = real time)",
+        default=0.0,
+    )
 
 
 def add_validator_args(cls, parser):
@@ -165,6 +280,130 @@ def add_validator_args(cls, parser):
         default=24 * 60,
     )
 
+    validator_group.add_argument(
+        "--validator.vote_concurrency",
+        type=int,
+        help="Maximum server votes submitted to the collector at the same time",
+        default=8,
+    )
+
+    validator_group.add_argument(
+        "--validator.vote_rate_limit",
+        type=float,
+        help="Maximum server votes per second sent to the collector (0 disables the limit)",
+        default=10.0,
+    )
+
+    validator_group.add_argument(
+        "--validator.disable_vote_outbox",
+        action="store_true",
+        help="Post votes directly during the cycle instead of queueing them in the on-disk outbox",
+        default=False,
+    )
+
+    validator_group.add_argument(
+        "--validator.vote_heartbeat_seconds",
+        type=float,
+        help="Re-send an unchanged server vote only after this many seconds (0 re-sends every cycle)",
+        default=3600.0,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_max_concurrency",
+        type=int,
+        help="Maximum in-flight server status lookups across all scanner providers",
+        default=64,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_provider_concurrency",
+        type=int,
+        help="Maximum in-flight server status lookups per scanner provider",
+        default=8,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_slp_concurrency",
+        type=int,
+        help="Maximum in-flight direct Server List Ping lookups",
+        default=8,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_selection",
+        type=str,
+        choices=["adaptive", "round_robin"],
+        help="Assign servers to scanner providers by expected completion time, or in fixed rotation",
+        default="adaptive",
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_exploration",
+        type=float,
+        help="Share of adaptive scanner picks made at random to keep estimates for every provider fresh",
+        default=0.05,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_provider_rate",
+        type=float,
+        help="Requests per second sent to each third-party scanner provider; slowed down on HTTP 429 (0 = unpaced)",
+        default=5.0,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_provider_rates",
+        type=str,
+        help="Per-provider overrides of --validator.scanner_provider_rate, e.g. 'mcsrvstat=2,mcstatus=10'",
+        default=None,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_ttl_jitter",
+        type=float,
+        help="Random +/- fraction applied to each server's scan expiry so rescans spread over the interval",
+        default=0.2,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_mode",
+        type=str,
+        choices=["inline", "trickle", "revalidate"],
+        help=(
+            "Scan due servers inside the scoring cycle, continuously in the background between cycles, "
+            "or in the background while the cycle scores the previous results"
+        ),
+        default="inline",
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_max_staleness",
+        type=float,
+        help="In revalidate mode, block on a rescan once scan results are older than this many seconds (0 = twice the scan interval)",
+        default=0.0,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_quorum_size",
+        type=int,
+        help="Cross-check scan results that would zero a score with this many providers in total (0 = off)",
+        default=0,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_quorum_budget",
+        type=int,
+        help="Maximum extra provider lookups spent on quorum cross-checks per scan",
+        default=200,
+    )
+
+    validator_group.add_argument(
+        "--validator.scanner_hedge_quantile",
+        type=float,
+        help="Race a second scanner provider when a lookup outlasts this quantile of its provider's recent latency (0 = off)",
+        default=0.9,
+    )
+
 
 def config(cls):
     """
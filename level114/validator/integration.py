@@ -21,6 +21,20 @@ async def integrate_scoring_system(validator_instance):
         base_url=collector_config.url,
         api_key=collector_config.api_key,
         timeout_seconds=getattr(collector_config, "timeout", 30.0),
+        pool_size=getattr(collector_config, "pool_size", 16),
+        keep_alive=not getattr(collector_config, "disable_keep_alive", False),
+        max_concurrency=getattr(collector_config, "max_concurrency", 16),
+        reports_batch_size=getattr(collector_config, "reports_batch_size", 0),
+        ids_chunk_size=getattr(collector_config, "ids_chunk_size", None),
+        ids_max_concurrency=getattr(collector_config, "ids_max_concurrency", None),
+        adaptive_timeout=not getattr(collector_config, "disable_adaptive_timeout", False),
+        breaker_threshold=getattr(collector_config, "breaker_threshold", 5),
+        breaker_cooldown=getattr(collector_config, "breaker_cooldown", 30.0),
+        rate_limit=getattr(collector_config, "rate_limit", 0.0),
+        rate_burst=getattr(collector_config, "rate_burst", None),
+        cassette_mode=getattr(collector_config, "cassette_mode", "off"),
+        cassette_path=getattr(collector_config, "cassette_path", None),
+        cassette_latency_scale=getattr(collector_config, "cassette_latency_scale", 0.0),
     )
 
     runner = Level114ValidatorRunner(
@@ -77,3 +91,6 @@ async def enhanced_validator_loop(validator_instance):
     except Exception as exc:  # noqa: BLE001
         bt.logging.error(f"Fatal error in validator: {exc}")
         raise
+    finally:
+        await runner.close()
+        runner.collector_api.close()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -15,6 +16,25 @@ class MechanismContext:
     metagraph: Any
     wallet: Any
     collector_api: Any
+    async_collector_api: Any = None
+
+
+async def call_collector(
+    collector_api: Any,
+    async_collector_api: Any,
+    method: str,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Await a collector call without blocking the event loop.
+
+    Uses the asyncio client when it provides ``method`` and otherwise runs the
+    blocking client in a worker thread.
+    """
+    async_method = getattr(async_collector_api, method, None) if async_collector_api else None
+    if async_method is not None:
+        return await async_method(*args, **kwargs)
+    return await asyncio.to_thread(getattr(collector_api, method), *args, **kwargs)
 
 
 class ValidatorMechanism:
@@ -39,6 +59,26 @@ class ValidatorMechanism:
             "mechanism_name": self.mechanism_name,
         }
 
+    async def _collector_call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a collector endpoint through :func:`call_collector`."""
+        return await call_collector(
+            self.context.collector_api,
+            self.context.async_collector_api,
+            method,
+            *args,
+            **kwargs,
+        )
+
+    def _collector_stats(self) -> Dict[str, Any]:
+        """Client-side collector counters, when the client exposes them."""
+        get_stats = getattr(self.context.collector_api, "get_stats", None)
+        if not callable(get_stats):
+            return {}
+        try:
+            return get_stats()
+        except Exception:  # noqa: BLE001
+            return {}
+
     def get_server_id_for_hotkey(self, hotkey: str) -> Optional[str]:
         """Optional helper for cached server id lookup."""
         return None
@@ -50,3 +90,7 @@ class ValidatorMechanism:
     async def apply_weights(self, cycle_stats: Dict[str, Any]) -> bool:
         """Apply weights for the given cycle if needed."""
         return False
+
+    async def close(self) -> None:
+        """Stop background tasks and release resources held by the mechanism."""
+        return None
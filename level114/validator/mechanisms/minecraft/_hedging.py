@@ -0,0 +1,72 @@
+"""Per-provider latency quantiles deciding when a scanner lookup is hedged."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+DEFAULT_HEDGE_QUANTILE = 0.9
+DEFAULT_WINDOW = 64
+# Quantiles from fewer samples are too noisy to hedge on.
+MIN_SAMPLES = 10
+MIN_HEDGE_DELAY_SECONDS = 0.05
+
+
+class HedgePolicy:
+    """Hedge a lookup once its provider is slower than its recent ``quantile`` latency.
+
+    Keeps the last ``window`` lookup durations per provider (timeouts included)
+    and, once a provider has ``MIN_SAMPLES`` of them, reports the quantile as the
+    delay after which the scan races a second provider. The mean of samples at
+    or above that delay estimates how long a lookup still pending would take,
+    which is what a winning hedge saves.
+
+    Instances live on the scanner, so windows carry over between cycles.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[str],
+        *,
+        quantile: float = DEFAULT_HEDGE_QUANTILE,
+        window: int = DEFAULT_WINDOW,
+    ) -> None:
+        self.quantile = min(0.99, max(0.5, float(quantile)))
+        self._samples: Dict[str, Deque[float]] = {
+            name: deque(maxlen=max(MIN_SAMPLES, int(window))) for name in providers
+        }
+
+    def record(self, name: str, elapsed: float) -> None:
+        samples = self._samples.get(name)
+        if samples is not None:
+            samples.append(float(elapsed))
+
+    def delay(self, name: str) -> Optional[float]:
+        """Seconds to wait on ``name`` before hedging; None while it has too few samples."""
+        samples = self._samples.get(name)
+        if not samples or len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return max(MIN_HEDGE_DELAY_SECONDS, ordered[index])
+
+    def tail_mean(self, name: str) -> Optional[float]:
+        """Mean duration of ``name``'s lookups that outlasted the hedge delay."""
+        threshold = self.delay(name)
+        if threshold is None:
+            return None
+        tail = [sample for sample in self._samples[name] if sample >= threshold]
+        return sum(tail) / len(tail) if tail else threshold
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot: Dict[str, Any] = {}
+        for name, samples in self._samples.items():
+            delay = self.delay(name)
+            snapshot[name] = {
+                "samples": len(samples),
+                "delay_s": round(delay, 4) if delay is not None else None,
+            }
+        return snapshot
+
+
+__all__ = ["HedgePolicy"]
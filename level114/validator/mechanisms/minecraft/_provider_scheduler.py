@@ -0,0 +1,138 @@
+"""Adaptive choice of scanner provider from live latency and failure statistics."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+DEFAULT_DECAY = 0.2
+DEFAULT_EXPLORATION = 0.05
+# Optimistic prior so providers without samples get tried early.
+PRIOR_LATENCY_SECONDS = 0.5
+MIN_SUCCESS_PROBABILITY = 0.05
+
+
+class _ProviderStats:
+    __slots__ = ("latency", "error_rate", "throttle_rate", "samples", "in_flight")
+
+    def __init__(self) -> None:
+        self.latency = PRIOR_LATENCY_SECONDS
+        self.error_rate = 0.0
+        self.throttle_rate = 0.0
+        self.samples = 0
+        self.in_flight = 0
+
+
+class ProviderScheduler:
+    """Route each lookup to the provider with the best expected completion time.
+
+    Per provider it keeps exponentially decayed (weight ``decay`` per sample)
+    latency, error rate and 429 rate. The expected completion time of a new
+    lookup is any pacing delay (``delay_for``) plus the latency stretched by the
+    lookups already queued on that provider (``in_flight / slots``), divided by
+    the probability the lookup succeeds. ``exploration`` is the share of picks
+    made uniformly at random so a provider that recovers is noticed again.
+
+    Instances live on the scanner, so estimates carry over between cycles.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[str],
+        *,
+        decay: float = DEFAULT_DECAY,
+        exploration: float = DEFAULT_EXPLORATION,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.providers: List[str] = list(providers)
+        self.decay = min(1.0, max(0.0, float(decay)))
+        self.exploration = min(1.0, max(0.0, float(exploration)))
+        self._rng = rng or random.Random()
+        self._stats: Dict[str, _ProviderStats] = {name: _ProviderStats() for name in self.providers}
+        self._slots: Dict[str, int] = {name: 1 for name in self.providers}
+        self.picks: Dict[str, int] = {name: 0 for name in self.providers}
+        self.explored = 0
+
+    def set_slots(self, slots: Dict[str, int]) -> None:
+        """Concurrency available per provider, used to estimate queueing delay."""
+        for name, count in slots.items():
+            self._slots[name] = max(1, int(count))
+
+    def expected_seconds(self, name: str, delay: float = 0.0) -> float:
+        """Expected completion time, including ``delay`` before the lookup can start."""
+        stats = self._stats[name]
+        queued = stats.in_flight / self._slots.get(name, 1)
+        success = (1.0 - stats.error_rate) * (1.0 - stats.throttle_rate)
+        return (delay + stats.latency * (1.0 + queued)) / max(MIN_SUCCESS_PROBABILITY, success)
+
+    def _cost(self, delay_for: Optional[Callable[[str], float]]) -> Callable[[str], float]:
+        if delay_for is None:
+            return self.expected_seconds
+        return lambda name: self.expected_seconds(name, delay_for(name))
+
+    def rank(
+        self, candidates: Iterable[str], delay_for: Optional[Callable[[str], float]] = None
+    ) -> List[str]:
+        """``candidates`` ordered from best to worst expected completion time."""
+        return sorted(candidates, key=self._cost(delay_for))
+
+    def pick(
+        self,
+        disabled: Set[str],
+        exclude: Iterable[str] = (),
+        delay_for: Optional[Callable[[str], float]] = None,
+    ) -> Optional[str]:
+        skip = set(exclude)
+        candidates = [name for name in self.providers if name not in disabled and name not in skip]
+        if not candidates:
+            return None
+        if len(candidates) > 1 and self._rng.random() < self.exploration:
+            choice = self._rng.choice(candidates)
+            self.explored += 1
+        else:
+            choice = min(candidates, key=self._cost(delay_for))
+        self.picks[choice] += 1
+        return choice
+
+    def begin(self, name: str) -> None:
+        self._stats[name].in_flight += 1
+
+    def end(
+        self,
+        name: str,
+        elapsed: Optional[float] = None,
+        *,
+        ok: bool = False,
+        throttled: bool = False,
+    ) -> None:
+        """Finish a lookup started with :meth:`begin`; ``elapsed=None`` means it never ran."""
+        stats = self._stats[name]
+        stats.in_flight = max(0, stats.in_flight - 1)
+        if elapsed is None:
+            return
+        weight = self.decay if stats.samples else 1.0
+        stats.samples += 1
+        stats.latency += weight * (elapsed - stats.latency)
+        failed = 0.0 if ok or throttled else 1.0
+        stats.error_rate += weight * (failed - stats.error_rate)
+        stats.throttle_rate += weight * ((1.0 if throttled else 0.0) - stats.throttle_rate)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "exploration": self.exploration,
+            "explored": self.explored,
+            "providers": {
+                name: {
+                    "latency_s": round(stats.latency, 4),
+                    "error_rate": round(stats.error_rate, 4),
+                    "throttle_rate": round(stats.throttle_rate, 4),
+                    "samples": stats.samples,
+                    "picks": self.picks[name],
+                    "expected_s": round(self.expected_seconds(name), 4),
+                }
+                for name, stats in self._stats.items()
+            },
+        }
+
+
+__all__ = ["ProviderScheduler"]
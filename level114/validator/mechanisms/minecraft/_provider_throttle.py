@@ -0,0 +1,165 @@
+"""Per-provider request pacing for the scanner, adapting to HTTP 429 responses."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+from level114.utils.rate_limit import TokenBucket
+
+DEFAULT_PROVIDER_RATE = 5.0
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_RECOVERY_FRACTION = 0.05
+DEFAULT_MAX_STRIKES = 3
+MIN_RATE = 0.1
+# Pause applied on a 429 without Retry-After, doubled per consecutive strike.
+BASE_PAUSE_SECONDS = 1.0
+MAX_PAUSE_SECONDS = 60.0
+
+
+def parse_rate_overrides(spec: Optional[str]) -> Dict[str, float]:
+    """Parse ``"name=rate,name=rate"`` into a mapping, ignoring malformed entries."""
+    overrides: Dict[str, float] = {}
+    for part in (spec or "").split(","):
+        name, sep, value = part.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            overrides[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return overrides
+
+
+class _ProviderPace:
+    __slots__ = ("ceiling", "bucket", "paused_until", "backed_off_at", "strikes", "throttled")
+
+    def __init__(self, rate: float) -> None:
+        self.ceiling = float(rate)
+        # No burst: provider quotas are usually short windows, so pace evenly.
+        self.bucket = TokenBucket(rate, burst=1.0)
+        self.paused_until = 0.0
+        self.backed_off_at = 0.0
+        self.strikes = 0
+        self.throttled = 0
+
+
+class ProviderThrottle:
+    """Token bucket per provider whose rate backs off on 429 and recovers on success.
+
+    A 429 multiplies the provider's rate by ``backoff_factor`` (down to
+    ``MIN_RATE``) and pauses it for the response's ``Retry-After`` or, without
+    one, an exponential pause. 429s for lookups sent before the last back-off
+    belong to the same episode and only extend the pause. Each success adds
+    ``recovery_fraction`` of the configured rate back, up to that rate. Only
+    ``max_strikes`` consecutive back-offs tell the scan to disable the provider
+    for the rest of the cycle; strikes are kept across scans until
+    :meth:`start_cycle`, so a cycle split into several scans still adds them up.
+
+    A rate of 0 leaves a provider unpaced until it first answers 429; it is then
+    paced from ``DEFAULT_PROVIDER_RATE`` downwards.
+    """
+
+    def __init__(
+        self,
+        providers: Iterable[str],
+        *,
+        default_rate: float = DEFAULT_PROVIDER_RATE,
+        rates: Optional[Dict[str, float]] = None,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        recovery_fraction: float = DEFAULT_RECOVERY_FRACTION,
+        max_strikes: int = DEFAULT_MAX_STRIKES,
+    ) -> None:
+        overrides = rates or {}
+        self.backoff_factor = min(1.0, max(0.01, float(backoff_factor)))
+        self.recovery_fraction = max(0.0, float(recovery_fraction))
+        self.max_strikes = max(1, int(max_strikes))
+        self._paces: Dict[str, _ProviderPace] = {
+            name: _ProviderPace(float(overrides.get(name, default_rate))) for name in providers
+        }
+
+    def start_cycle(self) -> None:
+        """Forget consecutive strikes at the start of a scoring cycle; learned rates carry over."""
+        for pace in self._paces.values():
+            pace.strikes = 0
+
+    def exhausted(self) -> Set[str]:
+        """Providers that reached ``max_strikes`` since the last :meth:`start_cycle`."""
+        return {name for name, pace in self._paces.items() if pace.strikes >= self.max_strikes}
+
+    def delay_for(self, name: str) -> float:
+        """Seconds a lookup sent to ``name`` now would wait before going out."""
+        pace = self._paces.get(name)
+        if pace is None:
+            return 0.0
+        paused = max(0.0, pace.paused_until - time.monotonic())
+        return max(paused, pace.bucket.wait_time())
+
+    async def wait(self, name: str) -> float:
+        """Wait for ``name``'s next slot; returns the send time to pass to :meth:`on_throttled`."""
+        pace = self._paces.get(name)
+        if pace is None:
+            return time.monotonic()
+        # Poll rather than reserve ahead, so a back-off that lands while waiting
+        # applies to lookups already queued for this provider.
+        while True:
+            paused = pace.paused_until - time.monotonic()
+            if paused > 0:
+                await asyncio.sleep(paused)
+                continue
+            if pace.bucket.try_acquire():
+                return time.monotonic()
+            await asyncio.sleep(max(0.001, pace.bucket.wait_time()))
+
+    def on_success(self, name: str) -> None:
+        pace = self._paces.get(name)
+        if pace is None:
+            return
+        pace.strikes = 0
+        if pace.bucket.unlimited:
+            return
+        target = pace.ceiling if pace.ceiling > 0 else DEFAULT_PROVIDER_RATE
+        recovered = pace.bucket.rate + target * self.recovery_fraction
+        if recovered >= target:
+            # Back at the configured pace (unpaced again for a rate of 0).
+            pace.bucket.rate = pace.ceiling
+        else:
+            pace.bucket.rate = recovered
+
+    def on_throttled(self, name: str, retry_after: Optional[float], sent_at: float = 0.0) -> bool:
+        """Back off ``name`` after a 429 for a lookup sent at ``sent_at``.
+
+        Returns True once the provider should be disabled for the cycle.
+        """
+        pace = self._paces.get(name)
+        if pace is None:
+            return True
+        now = time.monotonic()
+        pace.throttled += 1
+        new_episode = sent_at >= pace.backed_off_at
+        if new_episode:
+            pace.strikes += 1
+            pace.backed_off_at = now
+            current = pace.bucket.rate if pace.bucket.rate > 0 else DEFAULT_PROVIDER_RATE
+            pace.bucket.rate = max(MIN_RATE, current * self.backoff_factor)
+        if retry_after is None or retry_after <= 0:
+            retry_after = min(MAX_PAUSE_SECONDS, BASE_PAUSE_SECONDS * 2 ** (max(1, pace.strikes) - 1))
+        pace.paused_until = max(pace.paused_until, now + retry_after)
+        return pace.strikes >= self.max_strikes
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            name: {
+                "rate": round(pace.bucket.rate, 3),
+                "configured_rate": pace.ceiling,
+                "strikes": pace.strikes,
+                "throttled": pace.throttled,
+                "paused_s": round(max(0.0, pace.paused_until - now), 2),
+            }
+            for name, pace in self._paces.items()
+        }
+
+
+__all__ = ["ProviderThrottle", "parse_rate_overrides"]
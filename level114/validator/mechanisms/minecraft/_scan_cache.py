@@ -0,0 +1,98 @@
+"""Per-address cache of scanner results with individually jittered expiry."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_JITTER_FRACTION = 0.2
+# Failed lookups (no provider answered) are retried sooner than good results.
+FAILURE_TTL_FRACTION = 0.25
+
+
+class ScanCache:
+    """Scan results keyed by ``host:port``, each expiring on its own schedule.
+
+    A result expires ``ttl_seconds`` after it was stored, scaled by a random
+    factor in ``[1 - jitter, 1 + jitter]`` so entries scanned together drift
+    apart and rescans spread evenly over time. Results no provider produced
+    (``scanner`` is ``None``) live for ``FAILURE_TTL_FRACTION`` of the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        jitter_fraction: float = DEFAULT_JITTER_FRACTION,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.ttl_seconds = max(1.0, float(ttl_seconds))
+        self.jitter_fraction = min(0.9, max(0.0, float(jitter_fraction)))
+        self._rng = rng or random.Random()
+        self._entries: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _lifetime(self, entry: Dict[str, Any]) -> float:
+        ttl = self.ttl_seconds
+        if entry.get("scanner") is None:
+            ttl *= FAILURE_TTL_FRACTION
+        jitter = self._rng.uniform(-self.jitter_fraction, self.jitter_fraction)
+        return ttl * (1.0 + jitter)
+
+    def get(self, address: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """The cached result for ``address`` if it has not expired."""
+        now = time.time() if now is None else now
+        cached = self._entries.get(address)
+        if cached is None or cached[1] <= now:
+            return None
+        return cached[0]
+
+    def put(self, address: str, entry: Dict[str, Any], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self._entries[address] = (entry, now + self._lifetime(entry))
+
+    def split(
+        self, addresses: Iterable[str], now: Optional[float] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Partition ``addresses`` into fresh cached results and those due a scan."""
+        now = time.time() if now is None else now
+        fresh: Dict[str, Dict[str, Any]] = {}
+        due: List[str] = []
+        for address in addresses:
+            entry = self.get(address, now)
+            if entry is None:
+                due.append(address)
+            else:
+                fresh[address] = entry
+        self.hits += len(fresh)
+        self.misses += len(due)
+        return fresh, due
+
+    def expires_at(self, address: str) -> Optional[float]:
+        cached = self._entries.get(address)
+        return cached[1] if cached else None
+
+    def retain(self, addresses: Iterable[str]) -> None:
+        """Drop entries for addresses no longer in the catalog."""
+        keep = set(addresses)
+        for address in [address for address in self._entries if address not in keep]:
+            del self._entries[address]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, Any]:
+        now = time.time() if now is None else now
+        expiries = [expires for _entry, expires in self._entries.values()]
+        upcoming = [expires - now for expires in expiries if expires > now]
+        return {
+            "entries": len(self._entries),
+            "expired": len(expiries) - len(upcoming),
+            "hits": self.hits,
+            "misses": self.misses,
+            "next_expiry_s": round(min(upcoming), 1) if upcoming else None,
+        }
+
+
+__all__ = ["ScanCache"]
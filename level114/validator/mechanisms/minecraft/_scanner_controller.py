@@ -3,13 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import time
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import bittensor as bt
 
+from level114.validator.mechanisms.base import call_collector
+from level114.validator.mechanisms.minecraft._hedging import HedgePolicy
+from level114.validator.mechanisms.minecraft._provider_scheduler import ProviderScheduler
+from level114.validator.mechanisms.minecraft._provider_throttle import (
+    DEFAULT_PROVIDER_RATE,
+    ProviderThrottle,
+)
+from level114.validator.mechanisms.minecraft._scan_cache import ScanCache
 from level114.validator.mechanisms.minecraft._scanner_runner import perform_scan
 from level114.validator.mechanisms.minecraft._scanner_logger import _BTScannerLogger
+from level114.validator.mechanisms.minecraft.server_scanner import (
+    DIRECT_SCANNERS,
+    SCANNER_MAX_CONCURRENCY,
+    SCANNER_PROVIDER_CONCURRENCY,
+    SCANNER_SLP_CONCURRENCY,
+    SCANNERS,
+)
+
+SCANNER_MODES = ("inline", "trickle", "revalidate")
+# The trickle scheduler wakes this many times per scan interval, but never
+# more often than every ``MIN_TRICKLE_TICK_SECONDS``.
+TRICKLE_TICKS_PER_INTERVAL = 60
+MIN_TRICKLE_TICK_SECONDS = 5.0
+# Servers with a nonzero score are rescanned twice per interval.
+PRIORITY_INTERVAL_FRACTION = 0.5
 
 
 class MinecraftScanner:
@@ -20,10 +44,41 @@ class MinecraftScanner:
         collector_api: Any,
         logger: _BTScannerLogger,
         interval_seconds: float,
+        max_concurrency: int = SCANNER_MAX_CONCURRENCY,
+        provider_concurrency: int = SCANNER_PROVIDER_CONCURRENCY,
+        slp_concurrency: int = SCANNER_SLP_CONCURRENCY,
+        adaptive_selection: bool = True,
+        exploration: float = 0.05,
+        provider_rate: float = DEFAULT_PROVIDER_RATE,
+        provider_rates: Optional[Dict[str, float]] = None,
+        ttl_jitter: float = 0.2,
+        mode: str = "inline",
+        max_staleness_seconds: float = 0.0,
+        quorum_size: int = 0,
+        quorum_budget: int = 200,
+        hedge_quantile: float = 0.9,
+        async_collector_api: Any = None,
     ) -> None:
         self.collector_api = collector_api
+        self.async_collector_api = async_collector_api
         self.logger = logger
         self.interval_seconds = interval_seconds
+        self.max_concurrency = max_concurrency
+        self.provider_concurrency = provider_concurrency
+        self.slp_concurrency = slp_concurrency
+        # Kept across refreshes so provider estimates carry over between cycles.
+        self.provider_scheduler: Optional[ProviderScheduler] = (
+            ProviderScheduler(SCANNERS, exploration=exploration) if adaptive_selection else None
+        )
+        # Direct providers have no third-party quota, so they start unpaced.
+        rates = {name: 0.0 for name in DIRECT_SCANNERS}
+        rates.update(provider_rates or {})
+        self.provider_throttle = ProviderThrottle(
+            SCANNERS, default_rate=provider_rate, rates=rates
+        )
+        # Each address is rescanned once its own (jittered) TTL of one scan
+        # interval runs out, rather than the whole catalog at once.
+        self.scan_cache = ScanCache(interval_seconds, jitter_fraction=ttl_jitter)
         self.last_scan_time: float = 0.0
         self.results: Dict[str, Optional[Dict[str, Any]]] = {}
         self.last_metrics: Dict[str, Any] = {}
@@ -32,77 +87,382 @@ class MinecraftScanner:
         self.last_status: str = "never"
         self.last_error: Optional[str] = None
         self.disabled_scanners: Set[str] = set()
+        # In ``trickle`` mode a background task rescans a slice of the catalog
+        # every tick and ``refresh`` only reads the latest results.
+        self.mode = mode if mode in SCANNER_MODES else "inline"
+        self.trickle_tick_seconds = max(
+            MIN_TRICKLE_TICK_SECONDS, interval_seconds / TRICKLE_TICKS_PER_INTERVAL
+        )
+        self._tracked_ids: Set[str] = set()
+        self._priority_ids: Set[str] = set()
+        self._scanned_at: Dict[str, float] = {}
+        self._trickle: Optional[asyncio.Task] = None
+        self._trickle_counters = {"ticks": 0, "scanned": 0, "errors": 0, "feed_fetches": 0}
+        # Trickle ticks share one ``/servers`` feed, fetched at most once per
+        # interval, instead of each tick fetching its own.
+        self._feed: Optional[Tuple[int, Any]] = None
+        self._feed_fetched_at: float = 0.0
+        # Report-derived player counts from the latest refresh, for quorum checks.
+        self._expectations: Dict[str, Dict[str, Any]] = {}
+        # In ``revalidate`` mode a due refresh returns the previous results and
+        # rescans in the background, unless they are older than this.
+        self.max_staleness_seconds = (
+            float(max_staleness_seconds) if max_staleness_seconds and max_staleness_seconds > 0
+            else 2.0 * interval_seconds
+        )
+        self._revalidation: Optional[asyncio.Task] = None
+        # Results that would zero a score are cross-checked with this many
+        # providers, spending at most ``quorum_budget`` extra lookups per scan.
+        self.quorum_size = max(0, int(quorum_size))
+        self.quorum_budget = max(0, int(quorum_budget))
+        # A quantile of 0 turns hedging off.
+        self.hedge_policy: Optional[HedgePolicy] = (
+            HedgePolicy(SCANNERS, quantile=hedge_quantile) if hedge_quantile and hedge_quantile > 0 else None
+        )
 
-    async def refresh(self, server_ids: List[str]) -> Dict[str, Any]:
-        relevant_ids: Set[str] = {sid for sid in server_ids if sid}
-        if not relevant_ids:
-            return {"status": "no_servers"}
+    def _due_ids(self, relevant_ids: Set[str], now: float, interval_ready: bool) -> Set[str]:
+        """Servers that are new or whose cached scan expired.
 
-        now = time.time()
-        missing_ids = {sid for sid in relevant_ids if sid not in self.results}
-        interval_elapsed = now - self.last_scan_time if self.last_scan_time else None
-        interval_ready = interval_elapsed is None or interval_elapsed >= self.interval_seconds
+        Servers absent from the collector feed last time have no address to
+        cache under; they are retried once per scan interval.
+        """
+        due: Set[str] = set()
+        for server_id in relevant_ids:
+            if server_id not in self.results:
+                due.add(server_id)
+                continue
+            entry = self.results[server_id]
+            if entry is None:
+                if interval_ready:
+                    due.add(server_id)
+            elif self.scan_cache.get(str(entry.get("address") or ""), now) is None:
+                due.add(server_id)
+        return due
 
-        if not interval_ready and not missing_ids:
-            return {
-                "status": "cached",
-                "last_run": self.last_scan_time if self.last_scan_time else None,
-                "interval_seconds": self.interval_seconds,
-                "missing": list(self.missing_ids),
-                "attempted": list(self.last_attempt_ids),
-                "metrics": self.last_metrics,
-            }
+    async def _run_scan(
+        self,
+        server_ids: Set[str],
+        cache: Optional[ScanCache],
+        feed: Optional[Tuple[int, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Scan ``server_ids``; returns None after recording a failure.
 
+        A collector failure (``/servers`` erroring or its breaker open) is a
+        failure too: it says nothing about the servers, so callers keep their
+        previous results instead of replacing them with empty ones.
+        """
         try:
-            payload = await asyncio.to_thread(
-                perform_scan,
+            payload = await perform_scan(
                 self.collector_api,
                 self.logger,
-                relevant_ids,
+                server_ids,
+                max_concurrency=self.max_concurrency,
+                provider_concurrency=self.provider_concurrency,
+                slp_concurrency=self.slp_concurrency,
+                scheduler=self.provider_scheduler,
+                throttle=self.provider_throttle,
+                cache=cache,
+                quorum_size=self.quorum_size,
+                quorum_budget=self.quorum_budget,
+                hedge=self.hedge_policy,
+                feed=feed,
+                expectations=self._expectations,
+                async_collector_api=self.async_collector_api,
             )
         except Exception as exc:  # noqa: BLE001
             bt.logging.error(f"[Minecraft] Scanner execution failed: {exc}")
             self.last_error = str(exc)
             self.last_status = "error"
-            return {
-                "status": "error",
-                "error": str(exc),
-                "last_run": self.last_scan_time if self.last_scan_time else None,
-                "interval_seconds": self.interval_seconds,
-            }
+            return None
+        if payload is None or payload.get("error"):
+            self.last_error = payload.get("error") if payload else "scanner_failed"
+            self.last_status = "error"
+            bt.logging.warning(
+                f"[Minecraft] Scan skipped ({self.last_error}); keeping previous scanner results"
+            )
+            return None
+        return payload
+
+    async def refresh(
+        self,
+        server_ids: List[str],
+        priority_ids: Optional[Iterable[str]] = None,
+        expectations: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Bring scan results for ``server_ids`` up to date.
 
+        ``priority_ids`` are servers currently scoring above zero; the trickle
+        scheduler rescans them more often. ``expectations`` are the player
+        counts from each server's latest report, which decide whether a result
+        would zero a score and so needs a quorum; background scans keep using
+        the last ones given.
+        """
+        if expectations is not None:
+            self._expectations = dict(expectations)
+        # One scoring cycle may span many scans (trickle slices, revalidation),
+        # so 429 strikes are reset here rather than per scan.
+        self.provider_throttle.start_cycle()
+        relevant_ids: Set[str] = {sid for sid in server_ids if sid}
+        if not relevant_ids:
+            return {"status": "no_servers"}
+        if self.mode == "trickle":
+            return await self._refresh_trickle(relevant_ids, set(priority_ids or ()))
+
+        now = time.time()
+        interval_elapsed = now - self.last_scan_time if self.last_scan_time else None
+        interval_ready = interval_elapsed is None or interval_elapsed >= self.interval_seconds
+        due_ids = self._due_ids(relevant_ids, now, interval_ready)
+
+        if not due_ids:
+            return self._cached_status()
+
+        if self.mode == "revalidate":
+            age = self._snapshot_age(relevant_ids, now)
+            if age is not None and age <= self.max_staleness_seconds:
+                return self._serve_stale(relevant_ids, age)
+            if await self._join_revalidation():
+                # The background rescan may already have covered what was due.
+                now = time.time()
+                interval_ready = now - self.last_scan_time >= self.interval_seconds
+                if not self._due_ids(relevant_ids, now, interval_ready):
+                    return self._cached_status()
+
+        payload = await self._run_scan(relevant_ids, self.scan_cache)
         if payload is None:
-            self.last_error = "scanner_failed"
-            self.last_status = "error"
             return {
                 "status": "error",
-                "error": "scanner_failed",
+                "error": self.last_error,
                 "last_run": self.last_scan_time if self.last_scan_time else None,
                 "interval_seconds": self.interval_seconds,
             }
+        self._apply(payload, relevant_ids)
 
+        return {
+            "status": "performed" if payload.get("attempted") else "no_attempt",
+            "last_run": self.last_scan_time,
+            "interval_seconds": self.interval_seconds,
+            "missing": list(payload["missing"]),
+            "attempted": list(payload["attempted"]),
+            "updated": len(
+                [sid for sid, entry in payload["results"].items() if entry is not None]
+            ),
+            "metrics": payload["metrics"],
+            "error": payload.get("error"),
+            "disabled_scanners": sorted(self.disabled_scanners),
+        }
+
+    def _cached_status(self) -> Dict[str, Any]:
+        return {
+            "status": "cached",
+            "last_run": self.last_scan_time if self.last_scan_time else None,
+            "interval_seconds": self.interval_seconds,
+            "missing": list(self.missing_ids),
+            "attempted": list(self.last_attempt_ids),
+            "metrics": self.last_metrics,
+        }
+
+    def _apply(self, payload: Dict[str, Any], relevant_ids: Set[str]) -> None:
+        results = dict(self.results)
+        for server_id in relevant_ids:
+            results[server_id] = payload["results"].get(server_id)
+        # Swapped in one assignment so readers never see a half-applied scan.
+        self.results = results
         self.last_scan_time = payload["timestamp"]
         self.last_metrics = payload["metrics"]
         self.last_attempt_ids = payload["attempted"]
         self.missing_ids = payload["missing"]
         self.last_status = "performed"
         self.last_error = payload.get("error")
+        self.disabled_scanners = set(payload.get("disabled_scanners") or [])
 
+    def _snapshot_age(self, relevant_ids: Set[str], now: float) -> Optional[float]:
+        """Age of the oldest result for ``relevant_ids``; None if any was never scanned."""
+        if not self.last_scan_time or not relevant_ids <= self.results.keys():
+            return None
+        oldest = self.last_scan_time
         for server_id in relevant_ids:
-            self.results[server_id] = payload["results"].get(server_id)
-
-        self.disabled_scanners = set(payload.get("disabled_scanners") or [])
+            entry = self.results[server_id]
+            if entry is not None:
+                oldest = min(oldest, float(entry.get("scan_timestamp") or oldest))
+        return max(0.0, now - oldest)
 
+    def _serve_stale(self, relevant_ids: Set[str], age: float) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        task = self._revalidation
+        started = task is None or task.done() or task.get_loop() is not loop
+        if started:
+            self._revalidation = loop.create_task(self._revalidate(relevant_ids))
         return {
-            "status": "performed" if payload.get("attempted") else "no_attempt",
+            "status": "stale",
+            "age_seconds": round(age, 1),
+            "max_staleness_seconds": self.max_staleness_seconds,
+            "revalidating": True,
+            "revalidation_started": started,
             "last_run": self.last_scan_time,
             "interval_seconds": self.interval_seconds,
-            "missing": list(payload["missing"]),
-            "attempted": list(payload["attempted"]),
-            "updated": len(
-                [sid for sid, entry in payload["results"].items() if entry is not None]
-            ),
-            "metrics": payload["metrics"],
-            "error": payload.get("error"),
+            "missing": list(self.missing_ids),
+            "attempted": list(self.last_attempt_ids),
+            "metrics": self.last_metrics,
+            "error": self.last_error,
             "disabled_scanners": sorted(self.disabled_scanners),
         }
+
+    async def _join_revalidation(self) -> bool:
+        """Wait for an in-flight background rescan; True if there was one.
+
+        A blocking refresh waits for it instead of scanning the same
+        addresses concurrently. The rescan is shielded so a cancelled
+        refresh leaves it running.
+        """
+        task = self._revalidation
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return False
+        await asyncio.shield(task)
+        return True
+
+    async def _revalidate(self, relevant_ids: Set[str]) -> None:
+        payload = await self._run_scan(relevant_ids, self.scan_cache)
+        if payload is not None:
+            self._apply(payload, relevant_ids)
+
+    async def _refresh_trickle(self, relevant_ids: Set[str], priority_ids: Set[str]) -> Dict[str, Any]:
+        # Servers never scanned are scanned before returning, so a new server is
+        # not scored as offline while it waits for its first trickle slice.
+        new_ids = relevant_ids - self.results.keys()
+        warmed = 0
+        if new_ids:
+            # New servers need their coordinates, so the feed is refetched.
+            feed = await self._trickle_feed(time.time(), force=True)
+            payload = await self._run_scan(new_ids, None, feed)
+            if payload is not None:
+                self._merge(payload, new_ids)
+                warmed = len(new_ids)
+        self._tracked_ids = relevant_ids
+        self._priority_ids = priority_ids & relevant_ids
+        self._ensure_trickle()
+        return {
+            "status": "warmup" if warmed else "snapshot",
+            "mode": self.mode,
+            "last_run": self.last_scan_time if self.last_scan_time else None,
+            "interval_seconds": self.interval_seconds,
+            "missing": list(self.missing_ids & relevant_ids),
+            "attempted": list(self.last_attempt_ids & relevant_ids),
+            "warmed": warmed,
+            "metrics": self.last_metrics,
+            "error": self.last_error,
+            "disabled_scanners": sorted(self.disabled_scanners),
+        }
+
+    def _merge(self, payload: Dict[str, Any], scanned_ids: Set[str]) -> None:
+        """Fold a partial scan into the snapshot, replacing ``results`` in one assignment."""
+        results = dict(self.results)
+        for server_id in scanned_ids:
+            results[server_id] = payload["results"].get(server_id)
+            self._scanned_at[server_id] = payload["timestamp"]
+        self.results = results
+        self.last_attempt_ids = (self.last_attempt_ids - scanned_ids) | set(payload["attempted"])
+        self.missing_ids = (self.missing_ids - scanned_ids) | set(payload["missing"])
+        self.last_scan_time = payload["timestamp"]
+        self.last_metrics = payload["metrics"]
+        self.last_status = "performed"
+        self.last_error = payload.get("error")
+        self.disabled_scanners = (
+            set(payload.get("disabled_scanners") or []) | self.provider_throttle.exhausted()
+        )
+
+    def _next_slice(self, now: float) -> List[str]:
+        """Servers to rescan this tick, most overdue first.
+
+        Every tick takes at least its share of one interval's work, so scans
+        spread evenly, plus anything whose deadline falls before the next tick.
+        """
+        tracked = self._tracked_ids
+        if not tracked:
+            return []
+        priority = self._priority_ids
+        deadlines: Dict[str, float] = {}
+        for server_id in tracked:
+            scanned_at = self._scanned_at.get(server_id)
+            if scanned_at is None:
+                deadlines[server_id] = 0.0
+                continue
+            fraction = PRIORITY_INTERVAL_FRACTION if server_id in priority else 1.0
+            deadlines[server_id] = scanned_at + self.interval_seconds * fraction
+        ordered = sorted(tracked, key=deadlines.__getitem__)
+        quota = math.ceil(
+            (len(tracked) + len(priority)) * self.trickle_tick_seconds / self.interval_seconds
+        )
+        horizon = now + self.trickle_tick_seconds
+        due = sum(1 for server_id in ordered if deadlines[server_id] <= horizon)
+        return ordered[: max(quota, due)]
+
+    async def _trickle_feed(self, now: float, *, force: bool = False) -> Tuple[int, Any]:
+        """The ``/servers`` feed for trickle scans, refetched once it is an interval old.
+
+        Only successful fetches are kept, so a failed one is retried next tick.
+        """
+        if (
+            not force
+            and self._feed is not None
+            and now - self._feed_fetched_at < self.interval_seconds
+        ):
+            return self._feed
+        feed = await call_collector(
+            self.collector_api, self.async_collector_api, "get_active_servers"
+        )
+        self._trickle_counters["feed_fetches"] += 1
+        if 200 <= feed[0] < 300:
+            self._feed = feed
+            self._feed_fetched_at = now
+        return feed
+
+    async def _trickle_tick(self) -> None:
+        now = time.time()
+        slice_ids = set(self._next_slice(now))
+        self._trickle_counters["ticks"] += 1
+        if not slice_ids:
+            return
+        payload = await self._run_scan(slice_ids, None, await self._trickle_feed(now))
+        if payload is None:
+            self._trickle_counters["errors"] += 1
+            return
+        self._merge(payload, slice_ids)
+        self._trickle_counters["scanned"] += len(slice_ids)
+        oldest = min((self._scanned_at.get(sid, 0.0) for sid in self._tracked_ids), default=now)
+        metrics = dict(payload["metrics"])
+        metrics["trickle"] = {
+            **self._trickle_counters,
+            "tracked": len(self._tracked_ids),
+            "priority": len(self._priority_ids),
+            "slice": len(slice_ids),
+            "tick_seconds": self.trickle_tick_seconds,
+            "oldest_scan_age_s": round(max(0.0, now - oldest), 1),
+        }
+        self.last_metrics = metrics
+
+    def _ensure_trickle(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._trickle is None or self._trickle.done() or self._trickle.get_loop() is not loop:
+            self._trickle = loop.create_task(self._trickle_loop())
+
+    async def _trickle_loop(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self._trickle_tick()
+            except Exception as exc:  # noqa: BLE001
+                bt.logging.error(f"[Minecraft] Trickle scan failed: {exc}")
+                self._trickle_counters["errors"] += 1
+            await asyncio.sleep(max(0.0, self.trickle_tick_seconds - (time.monotonic() - started)))
+
+    async def close(self) -> None:
+        """Stop the trickle scheduler and any background revalidation."""
+        tasks = [task for task in (self._trickle, self._revalidation) if task and not task.done()]
+        self._trickle = self._revalidation = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
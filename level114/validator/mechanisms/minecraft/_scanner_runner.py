@@ -3,21 +3,72 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Tuple
 
+from level114.validator.mechanisms.base import call_collector
 from level114.validator.mechanisms.minecraft.server_scanner import (
+    SCANNER_MAX_CONCURRENCY,
+    SCANNER_PROVIDER_CONCURRENCY,
+    SCANNER_SLP_CONCURRENCY,
     SCANNER_TIMEOUT,
-    scan_catalog,
+    scan_catalog_async,
 )
+from level114.validator.mechanisms.minecraft._hedging import HedgePolicy
+from level114.validator.mechanisms.minecraft._provider_scheduler import ProviderScheduler
+from level114.validator.mechanisms.minecraft._provider_throttle import ProviderThrottle
+from level114.validator.mechanisms.minecraft._scan_cache import ScanCache
 from level114.validator.mechanisms.minecraft._scanner_logger import _BTScannerLogger
 
 
-def perform_scan(
+def _with_feed(
+    entry: Dict[str, Any], server_id: str, feed_info: Dict[str, Any], scan_timestamp: float
+) -> Dict[str, Any]:
+    merged = dict(entry)
+    merged.update(
+        {
+            "server_id": server_id,
+            "scan_timestamp": scan_timestamp,
+            "feed_active_players": feed_info.get("active_players"),
+            "feed_max_players": feed_info.get("max_players"),
+            "hostname": feed_info.get("hostname") or feed_info.get("ip"),
+            "port": feed_info.get("port"),
+            "hotkey": feed_info.get("hotkey"),
+        }
+    )
+    return merged
+
+
+async def perform_scan(
     collector_api: Any,
     logger: _BTScannerLogger,
     server_ids: Set[str],
+    *,
+    max_concurrency: int = SCANNER_MAX_CONCURRENCY,
+    provider_concurrency: int = SCANNER_PROVIDER_CONCURRENCY,
+    slp_concurrency: int = SCANNER_SLP_CONCURRENCY,
+    scheduler: Optional[ProviderScheduler] = None,
+    throttle: Optional[ProviderThrottle] = None,
+    cache: Optional[ScanCache] = None,
+    quorum_size: int = 0,
+    quorum_budget: int = 0,
+    hedge: Optional[HedgePolicy] = None,
+    feed: Optional[Tuple[int, Any]] = None,
+    expectations: Optional[Dict[str, Dict[str, Any]]] = None,
+    async_collector_api: Any = None,
 ) -> Dict[str, Any]:
-    status, servers = collector_api.get_active_servers()
+    """Scan the collector's servers for ``server_ids``.
+
+    With a ``cache`` only addresses whose cached result expired (or that were
+    never scanned) are looked up; the rest are served from the cache. ``feed``
+    is a ``(status, servers)`` pair from an earlier ``get_active_servers`` call
+    to reuse instead of fetching ``/servers`` again. ``expectations`` maps
+    server ids to the ``players``/``max_players`` their latest report claims;
+    quorum checks compare scan results against them. ``/servers`` is fetched
+    through ``async_collector_api`` when given, as :func:`call_collector` does.
+    """
+    if feed is None:
+        feed = await call_collector(collector_api, async_collector_api, "get_active_servers")
+    status, servers = feed
     now = time.time()
     results: Dict[str, Optional[Dict[str, Any]]] = {sid: None for sid in server_ids}
     attempted: Set[str] = set()
@@ -60,6 +111,7 @@ def perform_scan(
         }
 
     catalog: Dict[str, Optional[int]] = {}
+    expected: Dict[str, Dict[str, Any]] = {}
     address_map: Dict[str, str] = {}
     duplicates: Set[str] = set()
 
@@ -84,6 +136,8 @@ def perform_scan(
 
         address_map[address] = server_id
         catalog[address] = feed_info.get("active_players")
+        if expectations and server_id in expectations:
+            expected[address] = expectations[server_id]
         results[server_id] = {
             "address": address,
             "online": False,
@@ -105,11 +159,33 @@ def perform_scan(
     disabled_scanners_cycle: Set[str] = set()
 
     if catalog:
-        scan_results, metrics, disabled_scanners_cycle = scan_catalog(
-            catalog,
-            logger,
-            timeout=SCANNER_TIMEOUT,
-        )
+        to_scan = catalog
+        if cache is not None:
+            cache.retain(catalog)
+            fresh, due = cache.split(catalog, now)
+            for address, entry in fresh.items():
+                server_id = address_map[address]
+                results[server_id] = _with_feed(
+                    entry, server_id, feed_map.get(server_id, {}), entry.get("scan_timestamp", now)
+                )
+            to_scan = {address: catalog[address] for address in due}
+        if to_scan:
+            scan_results, metrics, disabled_scanners_cycle = await scan_catalog_async(
+                to_scan,
+                logger,
+                timeout=SCANNER_TIMEOUT,
+                max_concurrency=max_concurrency,
+                provider_concurrency=provider_concurrency,
+                slp_concurrency=slp_concurrency,
+                scheduler=scheduler,
+                throttle=throttle,
+                quorum_size=quorum_size,
+                quorum_budget=quorum_budget,
+                expected=expected,
+                hedge=hedge,
+            )
+        else:
+            scan_results = []
         for entry in scan_results:
             address = entry.get("address")
             if not address:
@@ -117,20 +193,12 @@ def perform_scan(
             server_id = address_map.get(address)
             if not server_id:
                 continue
-            feed_info = feed_map.get(server_id, {})
-            merged = dict(entry)
-            merged.update(
-                {
-                    "server_id": server_id,
-                    "scan_timestamp": now,
-                    "feed_active_players": feed_info.get("active_players"),
-                    "feed_max_players": feed_info.get("max_players"),
-                    "hostname": feed_info.get("hostname") or feed_info.get("ip"),
-                    "port": feed_info.get("port"),
-                    "hotkey": feed_info.get("hotkey"),
-                }
-            )
+            merged = _with_feed(entry, server_id, feed_map.get(server_id, {}), now)
             results[server_id] = merged
+            if cache is not None:
+                cache.put(address, merged, now)
+        if cache is not None:
+            metrics["cache"] = {"scanned": len(to_scan), **cache.stats(now)}
 
     return {
         "results": results,
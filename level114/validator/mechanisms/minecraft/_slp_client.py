@@ -0,0 +1,151 @@
+"""Minimal Minecraft Java Edition Server List Ping client over asyncio TCP."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import json
+import socket
+import struct
+import time
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_PORT = 25565
+# -1 asks the server to answer with whatever protocol version it runs.
+STATUS_PROTOCOL_VERSION = -1
+MAX_PACKET_BYTES = 1 << 20
+
+
+def _pack_varint(value: int) -> bytes:
+    value &= 0xFFFFFFFF
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return _pack_varint(len(encoded)) + encoded
+
+
+def _packet(packet_id: int, payload: bytes = b"") -> bytes:
+    body = _pack_varint(packet_id) + payload
+    return _pack_varint(len(body)) + body
+
+
+async def _read_varint(reader: asyncio.StreamReader) -> int:
+    value = 0
+    for shift in range(0, 35, 7):
+        byte = (await reader.readexactly(1))[0]
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value - (1 << 32) if value & (1 << 31) else value
+    raise ValueError("VarInt is too long")
+
+
+def _unpack_varint(buffer: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    for shift in range(0, 35, 7):
+        if offset >= len(buffer):
+            raise ValueError("Truncated VarInt")
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+    raise ValueError("VarInt is too long")
+
+
+async def _read_packet(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    length = await _read_varint(reader)
+    if length <= 0 or length > MAX_PACKET_BYTES:
+        raise ValueError(f"Invalid SLP packet length {length}")
+    body = await reader.readexactly(length)
+    packet_id, offset = _unpack_varint(body, 0)
+    return packet_id, body[offset:]
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def _resolve_public(host: str, port: int) -> str:
+    """First globally routable address of ``host``.
+
+    Miners register the address themselves, so loopback, private, link-local
+    and metadata addresses are refused rather than dialled from the validator.
+    """
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    for _family, _type, _proto, _canonname, sockaddr in infos:
+        if _is_public(sockaddr[0]):
+            return sockaddr[0]
+    raise ValueError(f"Refusing to query non-public address {host!r}")
+
+
+async def _exchange(host: str, port: int, allow_private: bool) -> Dict[str, Any]:
+    # Connect to the address that passed the check, not a fresh lookup of ``host``.
+    target = host if allow_private else await _resolve_public(host, port)
+    reader, writer = await asyncio.open_connection(target, port)
+    try:
+        handshake = (
+            _pack_varint(STATUS_PROTOCOL_VERSION)
+            + _pack_string(host)
+            + struct.pack(">H", port)
+            + _pack_varint(1)
+        )
+        writer.write(_packet(0x00, handshake) + _packet(0x00))
+        await writer.drain()
+
+        packet_id, payload = await _read_packet(reader)
+        if packet_id != 0x00:
+            raise ValueError(f"Unexpected SLP status packet id {packet_id:#x}")
+        length, offset = _unpack_varint(payload, 0)
+        status = json.loads(payload[offset : offset + length].decode("utf-8"))
+        if not isinstance(status, dict):
+            raise ValueError(f"Unexpected SLP status payload type: {type(status)!r}")
+
+        token = time.monotonic_ns() & 0x7FFFFFFFFFFFFFFF
+        sent = time.perf_counter()
+        writer.write(_packet(0x01, struct.pack(">q", token)))
+        await writer.drain()
+        try:
+            packet_id, payload = await _read_packet(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # Some servers close after the status response; the data is still valid.
+            return status
+        if packet_id == 0x01 and payload[:8] == struct.pack(">q", token):
+            status["latency"] = round((time.perf_counter() - sent) * 1000.0, 3)
+        return status
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+async def query_status(
+    host: str, port: Optional[int], timeout: float, *, allow_private: bool = False
+) -> Dict[str, Any]:
+    """Return the server's status JSON, plus ``latency`` (ms) when ping/pong succeeds.
+
+    ``host`` must resolve to a public address unless ``allow_private`` is set;
+    otherwise ``ValueError`` is raised without connecting. ``_minecraft._tcp``
+    SRV records are not resolved and ``port`` defaults to 25565, so a server
+    reachable only through an SRV record reads as unreachable here.
+    """
+    return await asyncio.wait_for(
+        _exchange(host, port or DEFAULT_PORT, allow_private), timeout=timeout
+    )
+
+
+__all__ = ["DEFAULT_PORT", "query_status"]
@@ -0,0 +1,178 @@
+"""Durable on-disk outbox for Minecraft server votes."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+OUTBOX_FILENAME = "vote_outbox.sqlite3"
+DEFAULT_MAX_ROWS = 10_000
+DEFAULT_MAX_AGE_SECONDS = 6 * 3600
+
+
+@dataclass
+class OutboxVote:
+    server_id: str
+    idempotency_key: str
+    payload: Dict[str, Any]
+    created_at: float
+    attempts: int
+    fingerprint: Optional[str] = None
+
+
+class VoteOutbox:
+    """SQLite-backed queue of vote payloads awaiting delivery to the collector.
+
+    At most one vote is pending per server: enqueueing a different verdict
+    replaces the older one under a fresh idempotency key, while re-enqueueing the
+    same verdict (same fingerprint) leaves the pending row, its key and its
+    retry schedule untouched. Disk usage is bounded by
+    ``max_rows`` (oldest rows are evicted) and ``max_age_seconds`` (stale
+    verdicts are dropped rather than delivered late).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        self.path = path
+        self.max_rows = max(1, int(max_rows))
+        self.max_age_seconds = float(max_age_seconds)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS votes (
+                server_id TEXT PRIMARY KEY,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                fingerprint TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(votes)")}
+        if "fingerprint" not in columns:
+            self._conn.execute("ALTER TABLE votes ADD COLUMN fingerprint TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS votes_next_attempt ON votes (next_attempt_at)"
+        )
+
+    def enqueue(
+        self, server_id: str, payload: Dict[str, Any], fingerprint: Optional[str] = None
+    ) -> Optional[str]:
+        """Queue ``payload`` for ``server_id`` and return its idempotency key.
+
+        Returns ``None`` when a vote with the same ``fingerprint`` is already
+        pending for the server; that vote is kept as is.
+        """
+        key = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            if fingerprint is not None:
+                pending = self._conn.execute(
+                    "SELECT 1 FROM votes WHERE server_id = ? AND fingerprint = ?",
+                    (server_id, fingerprint),
+                ).fetchone()
+                if pending:
+                    return None
+            self._conn.execute(
+                "INSERT OR REPLACE INTO votes "
+                "(server_id, idempotency_key, payload, created_at, attempts, next_attempt_at, "
+                "fingerprint) VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (
+                    server_id,
+                    key,
+                    json.dumps(payload, separators=(",", ":")),
+                    now,
+                    now,
+                    fingerprint,
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM votes WHERE server_id IN ("
+                " SELECT server_id FROM votes ORDER BY created_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_rows,),
+            )
+        return key
+
+    def due(self, limit: int, now: Optional[float] = None) -> List[OutboxVote]:
+        """Return up to ``limit`` votes whose next attempt is due, oldest first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT server_id, idempotency_key, payload, created_at, attempts, fingerprint "
+                "FROM votes WHERE next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+                (now, max(1, int(limit))),
+            ).fetchall()
+        votes: List[OutboxVote] = []
+        for server_id, key, payload, created_at, attempts, fingerprint in rows:
+            try:
+                decoded = json.loads(payload)
+            except ValueError:
+                self.remove(key)
+                continue
+            votes.append(OutboxVote(server_id, key, decoded, created_at, attempts, fingerprint))
+        return votes
+
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest pending attempt, or ``None`` when empty."""
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_attempt_at) FROM votes").fetchone()
+        if not row or row[0] is None:
+            return None
+        return max(0.0, row[0] - now)
+
+    def remove(self, idempotency_key: str) -> None:
+        """Delete a delivered (or permanently rejected) vote.
+
+        Keyed by idempotency key so a newer verdict enqueued for the same server
+        while this one was in flight is kept.
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM votes WHERE idempotency_key = ?", (idempotency_key,)
+            )
+
+    def reschedule(self, idempotency_key: str, delay_seconds: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE votes SET attempts = attempts + 1, next_attempt_at = ? "
+                "WHERE idempotency_key = ?",
+                (time.time() + max(0.0, delay_seconds), idempotency_key),
+            )
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop votes older than ``max_age_seconds``; returns how many were removed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM votes WHERE created_at < ?", (now - self.max_age_seconds,)
+            )
+        return max(0, cursor.rowcount)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM votes").fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -3,23 +3,96 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import random
+import sqlite3
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 import bittensor as bt
 
+from level114.utils.rate_limit import TokenBucket
+from level114.validator.mechanisms.base import call_collector
+from level114.validator.mechanisms.minecraft._vote_outbox import OutboxVote, VoteOutbox
+
+# Statuses worth retrying from the outbox; other 4xx responses are final.
+_RETRYABLE_STATUSES = {408, 425, 429}
+
+
+def _latency_percentiles(latencies_ms: List[float]) -> Dict[str, float]:
+    if not latencies_ms:
+        return {}
+    ordered = sorted(latencies_ms)
+
+    def _pick(fraction: float) -> float:
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return round(ordered[index], 1)
+
+    return {"p50": _pick(0.50), "p90": _pick(0.90), "p99": _pick(0.99), "max": round(ordered[-1], 1)}
+
+
+def _empty_drain_counters() -> Dict[str, Any]:
+    return {
+        "delivered": 0,
+        "failed": 0,
+        "retrying": 0,
+        "expired": 0,
+        "status_counts": {},
+        "latencies_ms": [],
+    }
+
 
 class VoteClient:
-    """Handles vote payload construction and submission."""
+    """Handles vote payload construction and submission.
+
+    Votes are posted concurrently, at most ``concurrency`` at a time, and paced by
+    a token bucket allowing ``rate_limit`` votes per second (0 disables pacing).
 
-    def __init__(self, collector_api: Any, client_version: str) -> None:
+    With an ``outbox`` the scoring cycle only enqueues payloads; a background
+    task delivers them in batches with idempotency keys and retries transient
+    failures with jittered exponential backoff, across cycles and restarts.
+
+    A vote whose fingerprint (verdict, zero reason, expected and observed values)
+    matches the last accepted vote for the server is suppressed until
+    ``heartbeat_seconds`` have passed since that acceptance (0 always re-sends).
+    """
+
+    def __init__(
+        self,
+        collector_api: Any,
+        client_version: str,
+        async_collector_api: Any = None,
+        concurrency: int = 8,
+        rate_limit: float = 10.0,
+        outbox: Optional[VoteOutbox] = None,
+        drain_batch_size: int = 50,
+        retry_base_seconds: float = 5.0,
+        retry_max_seconds: float = 300.0,
+        heartbeat_seconds: float = 3600.0,
+    ) -> None:
         self.collector_api = collector_api
+        self.async_collector_api = async_collector_api
         self.client_version = client_version
+        self.concurrency = max(1, int(concurrency))
+        self.rate_limiter = TokenBucket(rate_limit, burst=self.concurrency)
+        self.outbox = outbox
+        self.drain_batch_size = max(1, int(drain_batch_size))
+        self.retry_base_seconds = max(0.1, float(retry_base_seconds))
+        self.retry_max_seconds = max(self.retry_base_seconds, float(retry_max_seconds))
+        self.drain_idle_seconds = 30.0
+        self._drainer: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._closing = False
+        self._drain_counters = _empty_drain_counters()
+        self.heartbeat_seconds = max(0.0, float(heartbeat_seconds))
+        self._accepted: Dict[str, Tuple[str, float]] = {}
 
     async def submit_votes(
         self, vote_entries: List[Tuple[str, Dict[str, Any]]]
-    ) -> Dict[str, int]:
-        summary = {"submitted": 0, "skipped": 0, "errors": 0}
+    ) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"submitted": 0, "skipped": 0, "errors": 0, "suppressed": 0}
         if not vote_entries:
             return summary
 
@@ -28,35 +101,231 @@ class VoteClient:
             summary["errors"] = len(vote_entries)
             return summary
 
+        now = time.time()
+        self._forget_expired_fingerprints(now)
+        pending: List[Tuple[str, Dict[str, Any], str]] = []
         for server_id, result in vote_entries:
             payload = self._build_vote_payload(server_id, result)
             if not payload:
                 summary["skipped"] += 1
                 continue
-
-            try:
-                status = await asyncio.to_thread(
-                    self.collector_api.post_server_vote,
-                    server_id,
-                    payload,
-                )
-            except Exception as exc:  # noqa: BLE001
-                bt.logging.error(
-                    f"[Minecraft] Failed to submit vote for {server_id}: {exc}"
-                )
-                summary["errors"] += 1
+            fingerprint = self._vote_fingerprint(result, payload)
+            accepted = self._accepted.get(server_id)
+            if accepted is not None and accepted[0] == fingerprint:
+                summary["suppressed"] += 1
                 continue
+            pending.append((server_id, payload, fingerprint))
 
-            if 200 <= status < 300:
+        if self.outbox is not None:
+            queued, already_pending, failed, pending_count = await asyncio.to_thread(
+                self._enqueue, pending
+            )
+            self._ensure_drainer()
+            # ``submitted``/``errors`` are this cycle's votes handed to the outbox.
+            # Deliveries arrive asynchronously, so what the drainer did since the
+            # previous cycle is reported under ``outbox_*``.
+            counters, self._drain_counters = self._drain_counters, _empty_drain_counters()
+            summary["submitted"] = queued + already_pending
+            summary["errors"] = failed
+            summary["queued"] = queued
+            summary["already_pending"] = already_pending
+            summary["pending"] = pending_count
+            summary["outbox_delivered"] = counters["delivered"]
+            summary["outbox_failed"] = counters["failed"]
+            summary["outbox_retrying"] = counters["retrying"]
+            summary["outbox_expired"] = counters["expired"]
+            summary["outbox_status_counts"] = counters["status_counts"]
+            summary["outbox_latency_ms"] = _latency_percentiles(counters["latencies_ms"])
+            return summary
+
+        outcomes = await self._post_votes([(sid, payload, None) for sid, payload, _ in pending])
+
+        status_counts: Dict[str, int] = {}
+        latencies_ms: List[float] = []
+        for (server_id, _, fingerprint), (status, latency_ms) in zip(pending, outcomes):
+            latencies_ms.append(latency_ms)
+            status_key = str(status) if status is not None else "exception"
+            status_counts[status_key] = status_counts.get(status_key, 0) + 1
+            if status is None:
+                summary["errors"] += 1
+            elif 200 <= status < 300:
                 summary["submitted"] += 1
+                self._accepted[server_id] = (fingerprint, time.time())
             else:
                 bt.logging.error(
                     f"[Minecraft] Vote rejected for {server_id}: status={status}"
                 )
                 summary["errors"] += 1
 
+        summary["status_counts"] = status_counts
+        summary["latency_ms"] = _latency_percentiles(latencies_ms)
         return summary
 
+    def _enqueue(
+        self, pending: List[Tuple[str, Dict[str, Any], str]]
+    ) -> Tuple[int, int, int, int]:
+        """Queue votes in the outbox (blocking).
+
+        Returns ``(queued, already_pending, failed, pending)``, the last being the
+        outbox's size afterwards.
+        """
+        assert self.outbox is not None
+        queued = already_pending = failed = 0
+        for server_id, payload, fingerprint in pending:
+            try:
+                key = self.outbox.enqueue(server_id, payload, fingerprint)
+            except sqlite3.Error as exc:
+                bt.logging.error(f"[Minecraft] Could not queue vote for {server_id}: {exc}")
+                failed += 1
+                continue
+            if key is None:
+                already_pending += 1
+            else:
+                queued += 1
+        return queued, already_pending, failed, len(self.outbox)
+
+    @staticmethod
+    def _vote_fingerprint(result: Dict[str, Any], payload: Dict[str, Any]) -> str:
+        material = json.dumps(
+            [
+                payload.get("verdict"),
+                result.get("zero_reason"),
+                payload.get("value_expected"),
+                payload.get("value_got"),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _forget_expired_fingerprints(self, now: float) -> None:
+        """Drop fingerprints past the heartbeat so those servers are re-sent."""
+        cutoff = now - self.heartbeat_seconds
+        for server_id in [sid for sid, (_, at) in self._accepted.items() if at <= cutoff]:
+            del self._accepted[server_id]
+
+    async def _post_votes(
+        self, items: List[Tuple[str, Dict[str, Any], Optional[str]]]
+    ) -> List[Tuple[Optional[int], float]]:
+        """Post votes concurrently; returns ``(status or None on exception, latency_ms)``."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _submit(
+            server_id: str, payload: Dict[str, Any], idempotency_key: Optional[str]
+        ) -> Tuple[Optional[int], float]:
+            async with semaphore:
+                await self.rate_limiter.acquire_async()
+                kwargs = {"idempotency_key": idempotency_key} if idempotency_key else {}
+                start = time.perf_counter()
+                try:
+                    status = await call_collector(
+                        self.collector_api,
+                        self.async_collector_api,
+                        "post_server_vote",
+                        server_id,
+                        payload,
+                        **kwargs,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    bt.logging.error(
+                        f"[Minecraft] Failed to submit vote for {server_id}: {exc}"
+                    )
+                    status = None
+                return status, (time.perf_counter() - start) * 1000.0
+
+        return list(await asyncio.gather(*(_submit(*item) for item in items)))
+
+    def _ensure_drainer(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._drainer is None or self._drainer.done() or self._drainer.get_loop() is not loop:
+            self._closing = False
+            self._wake = asyncio.Event()
+            self._drainer = loop.create_task(self._drain_loop())
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _drain_loop(self) -> None:
+        assert self.outbox is not None and self._wake is not None
+        # ``wait_for`` may swallow a cancellation that races with the wake event,
+        # so ``close`` also sets ``_closing``.
+        while not self._closing:
+            try:
+                self._wake.clear()
+                # SQLite calls run off the event loop.
+                self._drain_counters["expired"] += await asyncio.to_thread(self.outbox.expire)
+                batch = await asyncio.to_thread(self.outbox.due, self.drain_batch_size)
+                if batch:
+                    await self._drain_batch(batch)
+                    continue
+                next_due = await asyncio.to_thread(self.outbox.next_due_in)
+                timeout = (
+                    self.drain_idle_seconds
+                    if next_due is None
+                    else min(self.drain_idle_seconds, next_due)
+                )
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=max(0.05, timeout))
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                bt.logging.error(f"[Minecraft] Vote outbox drain error: {exc}")
+                await asyncio.sleep(self.drain_idle_seconds)
+
+    async def _drain_batch(self, batch: List[OutboxVote]) -> None:
+        assert self.outbox is not None
+        outcomes = await self._post_votes(
+            [(vote.server_id, vote.payload, vote.idempotency_key) for vote in batch]
+        )
+        counters = self._drain_counters
+        delivered: List[str] = []
+        retries: List[Tuple[str, float]] = []
+        for vote, (status, latency_ms) in zip(batch, outcomes):
+            counters["latencies_ms"].append(latency_ms)
+            status_key = str(status) if status is not None else "exception"
+            counters["status_counts"][status_key] = counters["status_counts"].get(status_key, 0) + 1
+
+            # 409: the collector already holds a vote under this idempotency key.
+            if status is not None and (200 <= status < 300 or status == 409):
+                delivered.append(vote.idempotency_key)
+                counters["delivered"] += 1
+                if vote.fingerprint:
+                    self._accepted[vote.server_id] = (vote.fingerprint, time.time())
+            elif status is None or status >= 500 or status in _RETRYABLE_STATUSES:
+                delay = min(self.retry_max_seconds, self.retry_base_seconds * (2 ** vote.attempts))
+                retries.append((vote.idempotency_key, delay * random.uniform(0.5, 1.5)))
+                counters["retrying"] += 1
+            else:
+                bt.logging.error(
+                    f"[Minecraft] Vote rejected for {vote.server_id}: status={status}"
+                )
+                delivered.append(vote.idempotency_key)
+                counters["failed"] += 1
+        await asyncio.to_thread(self._settle, delivered, retries)
+
+    def _settle(self, removed: List[str], retries: List[Tuple[str, float]]) -> None:
+        assert self.outbox is not None
+        for key in removed:
+            self.outbox.remove(key)
+        for key, delay in retries:
+            self.outbox.reschedule(key, delay)
+
+    async def close(self) -> None:
+        """Stop the background drainer and close the outbox; queued votes stay on
+        disk for the next run."""
+        self._closing = True
+        if self._drainer is not None and not self._drainer.done():
+            self._drainer.cancel()
+            try:
+                await self._drainer
+            except asyncio.CancelledError:
+                pass
+        self._drainer = None
+        if self.outbox is not None:
+            self.outbox.close()
+            self.outbox = None
+
     def _build_vote_payload(
         self, server_id: str, result: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
@@ -8,7 +8,7 @@ from typing import Dict, List
 import bittensor as bt
 
 
-def fetch_server_mappings(mechanism, hotkeys: List[str]) -> Dict[str, List[str]]:
+async def fetch_server_mappings(mechanism, hotkeys: List[str]) -> Dict[str, List[str]]:
     cached = mechanism.server_ids_last_fetch
     now = time.time()
 
@@ -16,7 +16,7 @@ def fetch_server_mappings(mechanism, hotkeys: List[str]) -> Dict[str, List[str]]
         return {hk: list(ids) for hk, ids in mechanism.hotkey_to_server_ids.items()}
 
     try:
-        status, mappings = mechanism.collector_api.get_server_mappings(hotkeys)
+        status, mappings = await mechanism._collector_call("get_server_mappings", hotkeys)
         if status != 200 or not isinstance(mappings, dict):
             bt.logging.debug(
                 f"[Minecraft] Failed to refresh server mappings (status={status});"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import sqlite3
 import time
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -9,13 +12,17 @@ import bittensor as bt
 
 from level114.validator.mechanisms.base import MechanismContext, ValidatorMechanism
 from level114.validator.mechanisms.minecraft._scanner_controller import MinecraftScanner
+from level114.validator.mechanisms.minecraft._provider_throttle import parse_rate_overrides
 from level114.validator.mechanisms.minecraft._scanner_logger import _BTScannerLogger
+from level114.validator.mechanisms.minecraft._vote_outbox import OUTBOX_FILENAME, VoteOutbox
 from level114.validator.mechanisms.minecraft._voting_client import VoteClient
 from level114.validator.mechanisms.minecraft.mappings import fetch_server_mappings
 from level114.validator.mechanisms.minecraft.report_schema import ServerReport
+from level114.validator.mechanisms.minecraft.report_sync import ReportSyncCache
 from level114.validator.mechanisms.minecraft.scoring import (
     PlayerPowerAggregator,
     filter_fresh_reports,
+    report_expectations,
     score_server,
 )
 from level114.validator.mechanisms.minecraft.types import ScoreCacheEntry
@@ -39,18 +46,16 @@ class MinecraftMechanism(ValidatorMechanism):
         self.server_id_to_hotkey: Dict[str, str] = {}
         self.server_ids_last_fetch: float = 0.0
         self.server_ids_min_refresh_interval: float = 12.5
-        self.report_fetch_limit: int = getattr(
-            getattr(self.config, "collector", None), "reports_limit", 25
+        collector_cfg = getattr(self.config, "collector", None)
+        self.report_fetch_limit: int = getattr(collector_cfg, "reports_limit", 25)
+        self.report_fetch_concurrency: int = max(
+            1, int(getattr(collector_cfg, "max_concurrency", 16) or 16)
         )
         self.latest_scores: Dict[str, Dict[str, Any]] = {}
+        self.report_sync = ReportSyncCache()
         self.last_cleanup = time.time()
 
-        validator_cfg = getattr(self.config, "validator", None)
-        configured_interval = (
-            getattr(validator_cfg, "scanner_interval_seconds", 24 * 60)
-            if validator_cfg
-            else 24 * 60
-        )
+        configured_interval = self._cfg("scanner_interval_seconds", 24 * 60)
         try:
             interval_value = float(configured_interval)
             if not interval_value or interval_value != interval_value:
@@ -60,17 +65,59 @@ class MinecraftMechanism(ValidatorMechanism):
         self.scan_interval = max(interval_value, 300.0)
 
         self._scanner_logger = _BTScannerLogger()
-        self.scanner = MinecraftScanner(self.collector_api, self._scanner_logger, self.scan_interval)
-
-        self.vote_client_version = (
-            getattr(validator_cfg, "client_version", None) if validator_cfg else None
+        self.scanner = MinecraftScanner(
+            self.collector_api,
+            self._scanner_logger,
+            self.scan_interval,
+            max_concurrency=self._cfg("scanner_max_concurrency", 64),
+            provider_concurrency=self._cfg("scanner_provider_concurrency", 8),
+            slp_concurrency=self._cfg("scanner_slp_concurrency", 8),
+            adaptive_selection=self._cfg("scanner_selection", "adaptive") != "round_robin",
+            exploration=self._cfg("scanner_exploration", 0.05),
+            provider_rate=self._cfg("scanner_provider_rate", 5.0),
+            provider_rates=parse_rate_overrides(self._cfg("scanner_provider_rates", None)),
+            ttl_jitter=self._cfg("scanner_ttl_jitter", 0.2),
+            mode=self._cfg("scanner_mode", "inline"),
+            max_staleness_seconds=self._cfg("scanner_max_staleness", 0.0),
+            quorum_size=self._cfg("scanner_quorum_size", 0),
+            quorum_budget=self._cfg("scanner_quorum_budget", 200),
+            hedge_quantile=self._cfg("scanner_hedge_quantile", 0.9),
+            async_collector_api=context.async_collector_api,
         )
+
+        self.vote_client_version = self._cfg("client_version", None)
         if not isinstance(self.vote_client_version, str) or not self.vote_client_version.strip():
             self.vote_client_version = "validator-agent/2.1.0"
-        self.vote_client = VoteClient(self.collector_api, self.vote_client_version)
+        self.vote_client = VoteClient(
+            self.collector_api,
+            self.vote_client_version,
+            async_collector_api=context.async_collector_api,
+            concurrency=self._cfg("vote_concurrency", 8),
+            rate_limit=self._cfg("vote_rate_limit", 10.0),
+            outbox=self._open_vote_outbox(),
+            heartbeat_seconds=self._cfg("vote_heartbeat_seconds", 3600.0),
+        )
 
         bt.logging.info("Minecraft mechanism initialized - collector scoring")
 
+    def _cfg(self, name: str, default: Any) -> Any:
+        """``config.validator.<name>``, or ``default`` when it is not set."""
+        validator_cfg = getattr(self.config, "validator", None)
+        return getattr(validator_cfg, name, default) if validator_cfg else default
+
+    def _open_vote_outbox(self) -> Optional[VoteOutbox]:
+        if self._cfg("disable_vote_outbox", False):
+            return None
+        neuron_cfg = getattr(self.config, "neuron", None)
+        full_path = getattr(neuron_cfg, "full_path", None) if neuron_cfg is not None else None
+        if not isinstance(full_path, str) or not full_path:
+            return None
+        try:
+            return VoteOutbox(os.path.join(full_path, OUTBOX_FILENAME))
+        except (sqlite3.Error, OSError) as exc:
+            bt.logging.warning(f"[Minecraft] Vote outbox unavailable, submitting directly: {exc}")
+            return None
+
     async def run_cycle(self) -> Dict[str, Any]:
         cycle_start = time.time()
         stats: Dict[str, Any] = {
@@ -89,7 +136,7 @@ class MinecraftMechanism(ValidatorMechanism):
         try:
             bt.logging.info(f"🔄 [Minecraft] Starting scoring cycle {self.cycle_count}")
             active_hotkeys = list(self.metagraph.hotkeys)
-            server_mappings = self._get_server_mappings(active_hotkeys)
+            server_mappings = await self._get_server_mappings(active_hotkeys)
             all_server_ids = sorted(
                 {
                     server_id
@@ -105,13 +152,21 @@ class MinecraftMechanism(ValidatorMechanism):
                 bt.logging.warning("[Minecraft] No server mappings found for active hotkeys")
                 return stats
 
-            stats["scanner"] = await self.scanner.refresh(all_server_ids)
+            # Reports are fetched first so the scan can check its results
+            # against the player counts the scorer will compare them with.
             (
                 parsed_reports_map,
                 player_power_scores,
                 player_power_totals,
                 missing_reports,
-            ) = self._prepare_reports_and_power(all_server_ids)
+                report_fetch_stats,
+            ) = await self._prepare_reports_and_power(all_server_ids)
+            stats["report_fetch"] = report_fetch_stats
+            stats["scanner"] = await self.scanner.refresh(
+                all_server_ids,
+                priority_ids=self._scored_server_ids(),
+                expectations=report_expectations(parsed_reports_map),
+            )
             stats["player_power_servers"] = len(player_power_scores)
 
             scoring_results: Dict[str, Dict[str, Any]] = {}
@@ -189,11 +244,27 @@ class MinecraftMechanism(ValidatorMechanism):
 
         return stats
 
+    async def close(self) -> None:
+        await self.scanner.close()
+        await self.vote_client.close()
+
     def get_latest_scores(self) -> Dict[str, Dict[str, Any]]:
         return self.latest_scores
 
-    def _get_server_mappings(self, hotkeys: List[str]) -> Dict[str, List[str]]:
-        return fetch_server_mappings(self, hotkeys)
+    def _scored_server_ids(self) -> Set[str]:
+        """Servers whose latest score is above zero."""
+        scored: Set[str] = set()
+        for entry in self.latest_scores.values():
+            for server_id, result in (entry.get("servers") or {}).items():
+                try:
+                    if float(result.get("score", 0) or 0.0) > 0.0:
+                        scored.add(server_id)
+                except (TypeError, ValueError):
+                    continue
+        return scored
+
+    async def _get_server_mappings(self, hotkeys: List[str]) -> Dict[str, List[str]]:
+        return await fetch_server_mappings(self, hotkeys)
 
     async def _score_server(
         self,
@@ -215,48 +286,113 @@ class MinecraftMechanism(ValidatorMechanism):
             reports_missing=reports_missing,
         )
 
-    def _prepare_reports_and_power(
+    async def _prepare_reports_and_power(
         self,
         server_ids: List[str],
-    ) -> Tuple[Dict[str, List[ServerReport]], Dict[str, float], Dict[str, float], Set[str]]:
+    ) -> Tuple[
+        Dict[str, List[ServerReport]],
+        Dict[str, float],
+        Dict[str, float],
+        Set[str],
+        Dict[str, Any],
+    ]:
+        """Fetch reports for every server with bounded concurrency.
+
+        Servers are grouped for the collector's multi-server reports route when the
+        client supports it. Only reports newer than each server's sync cursor are
+        requested, and only unseen reports are parsed; the rest come from
+        ``self.report_sync``. Results feed the player power aggregator as each
+        group completes, so the phase takes roughly as long as the slowest request.
+        """
+        self.report_sync.retain(server_ids)
         parsed_reports: Dict[str, List[ServerReport]] = {}
         aggregator = PlayerPowerAggregator()
         missing_reports: Set[str] = set()
-
-        for server_id in server_ids:
-            parsed_list: List[ServerReport] = []
-            reports: Optional[List[Dict[str, Any]]] = None
-            try:
-                status, reports = self.collector_api.get_server_reports(
-                    server_id,
-                    limit=self.report_fetch_limit,
-                )
-                report_count = len(reports) if reports else 0
-                if status != 200:
-                    bt.logging.debug(
-                        f"[Minecraft] Collector returned status {status} for server {server_id}; reports={report_count}"
-                    )
-                for report_dict in reports or []:
-                    try:
-                        parsed_list.append(ServerReport.from_dict(report_dict))
-                    except Exception as parse_err:  # noqa: BLE001
+        # One entry per collector request; a batched group shares one request.
+        request_timings: List[float] = []
+        semaphore = asyncio.Semaphore(self.report_fetch_concurrency)
+        phase_start = time.perf_counter()
+        reports_parsed = 0
+        reports_reused = 0
+
+        batch_size = int(getattr(self.collector_api, "reports_batch_size", 0) or 0)
+        use_batch = batch_size > 1 and hasattr(self.collector_api, "get_server_reports_batch")
+        if use_batch:
+            groups = [server_ids[idx : idx + batch_size] for idx in range(0, len(server_ids), batch_size)]
+        else:
+            groups = [[server_id] for server_id in server_ids]
+
+        async def _fetch(
+            group: List[str],
+        ) -> Tuple[List[str], Dict[str, Tuple[int, List[Dict[str, Any]]]], Optional[Exception], float]:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    if use_batch:
+                        results = await self._collector_call(
+                            "get_server_reports_batch",
+                            group,
+                            limit=self.report_fetch_limit,
+                            since_ms=self.report_sync.cursors(group),
+                        )
+                    else:
+                        status, reports = await self._collector_call(
+                            "get_server_reports",
+                            group[0],
+                            limit=self.report_fetch_limit,
+                            since_ms=self.report_sync.cursor(group[0]),
+                        )
+                        results = {group[0]: (status, reports)}
+                    return group, results, None, time.perf_counter() - start
+                except Exception as exc:  # noqa: BLE001
+                    return group, {}, exc, time.perf_counter() - start
+
+        tasks = [asyncio.ensure_future(_fetch(group)) for group in groups]
+        for completed in asyncio.as_completed(tasks):
+            group, results, error, elapsed = await completed
+            request_timings.append(elapsed)
+            for server_id in group:
+                parsed_list: List[ServerReport] = []
+                reports: Optional[List[Dict[str, Any]]] = None
+                if error is not None:
+                    bt.logging.error(f"[Minecraft] Error fetching reports for server {server_id}: {error}")
+                else:
+                    status, reports = results.get(server_id, (599, []))
+                    report_count = len(reports) if reports else 0
+                    if status != 200:
                         bt.logging.debug(
-                            f"[Minecraft] Failed to parse report for server {server_id}: {parse_err}"
+                            f"[Minecraft] Collector returned status {status} for server {server_id}; reports={report_count}"
                         )
-            except Exception as exc:  # noqa: BLE001
-                bt.logging.error(f"[Minecraft] Error fetching reports for server {server_id}: {exc}")
-                reports = None
-            if not reports:
-                missing_reports.add(server_id)
-            parsed_reports[server_id] = parsed_list
-
-            if parsed_list:
-                fresh_reports = filter_fresh_reports(parsed_list)
-                if fresh_reports:
-                    aggregator.ingest(server_id, fresh_reports[0])
+                    if 200 <= status < 300:
+                        window, parsed_count, reused_count = self.report_sync.merge(
+                            server_id, reports or []
+                        )
+                        parsed_list = window[: self.report_fetch_limit]
+                        reports_parsed += parsed_count
+                        reports_reused += reused_count
+                if not reports and not parsed_list:
+                    missing_reports.add(server_id)
+                parsed_reports[server_id] = parsed_list
+
+                if parsed_list:
+                    fresh_reports = filter_fresh_reports(parsed_list)
+                    if fresh_reports:
+                        aggregator.ingest(server_id, fresh_reports[0])
 
         normalized_scores, raw_totals = aggregator.compute()
-        return parsed_reports, normalized_scores, raw_totals, missing_reports
+        ordered_reports = {server_id: parsed_reports[server_id] for server_id in server_ids}
+        fetch_stats: Dict[str, Any] = {
+            "max_concurrency": self.report_fetch_concurrency,
+            "batched": use_batch,
+            "phase_elapsed": time.perf_counter() - phase_start,
+            "requests": len(groups),
+            "reports_parsed": reports_parsed,
+            "reports_reused": reports_reused,
+            "sum_elapsed": sum(request_timings),
+            "max_elapsed": max(request_timings, default=0.0),
+            "per_request": request_timings,
+        }
+        return ordered_reports, normalized_scores, raw_totals, missing_reports, fetch_stats
 
     def _cleanup_old_data(self) -> None:
         try:
@@ -284,6 +420,8 @@ class MinecraftMechanism(ValidatorMechanism):
             "hotkeys_cached": len(self.hotkey_to_server_ids),
             "cached_mappings": sum(len(ids) for ids in self.hotkey_to_server_ids.values()),
             "latest_scores": len(self.latest_scores),
+            "report_sync_servers": len(self.report_sync),
+            "votes_pending": len(self.vote_client.outbox) if self.vote_client.outbox else 0,
             "replay_protection_active": bool(self.replay_protection),
             "config": {"netuid": self.config.netuid},
             "scanner_last_run": self.scanner.last_scan_time or None,
@@ -294,6 +432,7 @@ class MinecraftMechanism(ValidatorMechanism):
             "scanner_last_error": self.scanner.last_error,
             "scanner_metrics": self.scanner.last_metrics,
             "scanner_disabled": sorted(self.scanner.disabled_scanners),
+            "collector": self._collector_stats(),
         })
         return status
 
@@ -0,0 +1,138 @@
+"""Incremental collector report sync for the Minecraft mechanism."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import bittensor as bt
+
+from level114.validator.mechanisms.minecraft.constants import MAX_REPORT_HISTORY
+from level114.validator.mechanisms.minecraft.report_schema import ServerReport
+
+
+def _report_key(report: Dict[str, Any]) -> Optional[str]:
+    report_id = report.get("id")
+    if report_id:
+        return f"id:{report_id}"
+    counter = report.get("counter")
+    timestamp = report.get("client_timestamp_ms")
+    if counter is None and timestamp is None:
+        return None
+    return f"c:{counter}:{timestamp}"
+
+
+class ReportSyncCache:
+    """Keeps a per-server window of parsed reports between scoring cycles.
+
+    Only reports that were not seen before are parsed; known reports reuse the
+    cached :class:`ServerReport`. The exception is a report whose timestamp
+    ``ServerReport`` clamped to the parse time (more than 24h off): it keeps its
+    raw dict and is parsed again on every merge, so it is scored exactly as when
+    every cycle re-parsed every report.
+
+    The cursor handed to the collector is the newest raw ``client_timestamp_ms``
+    seen for the server that is not in the future: miners set that field, and
+    one report stamped ahead of time would otherwise push the cursor past every
+    real report and stall the server's sync. The collector's ``since_ms`` filter
+    is not documented; a collector that ignores it returns the latest reports as
+    before and the duplicates are merged here, so the cursor only saves work.
+    """
+
+    def __init__(self, max_history: int = MAX_REPORT_HISTORY) -> None:
+        self.max_history = max(1, int(max_history))
+        # (key, parsed report, raw dict kept only when the timestamp was clamped)
+        self._windows: Dict[str, List[Tuple[str, ServerReport, Optional[Dict[str, Any]]]]] = {}
+        self._cursors: Dict[str, int] = {}
+
+    def cursor(self, server_id: str) -> Optional[int]:
+        return self._cursors.get(server_id)
+
+    def cursors(self, server_ids: Iterable[str]) -> Dict[str, int]:
+        return {sid: self._cursors[sid] for sid in server_ids if sid in self._cursors}
+
+    def merge(
+        self,
+        server_id: str,
+        report_dicts: List[Dict[str, Any]],
+        now_ms: Optional[int] = None,
+    ) -> Tuple[List[ServerReport], int, int]:
+        """Merge fetched reports into the window.
+
+        Returns ``(window, parsed, reused)`` where ``window`` is ordered newest first:
+        fetched reports in collector order, followed by older cached reports.
+        """
+        window = self._windows.get(server_id, [])
+        cached = {key: report for key, report, _raw in window}
+        clamped = {key for key, _report, raw in window if raw is not None}
+        merged: List[Tuple[str, ServerReport, Optional[Dict[str, Any]]]] = []
+        seen: set = set()
+        parsed = 0
+        reused = 0
+        cursor = self._cursors.get(server_id)
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+
+        for report_dict in report_dicts:
+            key = _report_key(report_dict)
+            if key is not None and key in seen:
+                continue
+            report = cached.get(key) if key is not None else None
+            raw: Optional[Dict[str, Any]] = None
+            if report is not None and key not in clamped:
+                reused += 1
+            else:
+                report = self._parse(server_id, report_dict)
+                if report is None:
+                    continue
+                parsed += 1
+                if key is None:
+                    key = f"c:{report.counter}:{report.client_timestamp_ms}"
+                if report.client_timestamp_ms != report_dict.get("client_timestamp_ms"):
+                    raw = report_dict
+            seen.add(key)
+            merged.append((key, report, raw))
+
+            raw_timestamp = report_dict.get("client_timestamp_ms")
+            if (
+                isinstance(raw_timestamp, int)
+                and raw_timestamp <= now_ms
+                and (cursor is None or raw_timestamp > cursor)
+            ):
+                cursor = raw_timestamp
+
+        for key, report, raw in window:
+            if key in seen:
+                continue
+            if raw is not None:
+                report = self._parse(server_id, raw)
+                if report is None:
+                    continue
+                parsed += 1
+            seen.add(key)
+            merged.append((key, report, raw))
+
+        merged = merged[: self.max_history]
+        self._windows[server_id] = merged
+        if cursor is not None:
+            self._cursors[server_id] = cursor
+        return [report for _, report, _raw in merged], parsed, reused
+
+    @staticmethod
+    def _parse(server_id: str, report_dict: Dict[str, Any]) -> Optional[ServerReport]:
+        try:
+            return ServerReport.from_dict(report_dict)
+        except Exception as parse_err:  # noqa: BLE001
+            bt.logging.debug(
+                f"[Minecraft] Failed to parse report for server {server_id}: {parse_err}"
+            )
+            return None
+
+    def retain(self, server_ids: Iterable[str]) -> None:
+        """Drop windows for servers that are no longer mapped."""
+        keep = set(server_ids)
+        for server_id in [sid for sid in self._windows if sid not in keep]:
+            self._windows.pop(server_id, None)
+            self._cursors.pop(server_id, None)
+
+    def __len__(self) -> int:
+        return len(self._windows)
@@ -343,6 +343,26 @@ def filter_fresh_reports(reports: List[ServerReport]) -> List[ServerReport]:
     return fresh_reports
 
 
+def report_expectations(
+    parsed_reports: Dict[str, List[ServerReport]],
+) -> Dict[str, Dict[str, Any]]:
+    """Player counts from each server's latest fresh report.
+
+    These are the values ``score_server`` checks scan results against, so a
+    scan can tell whether its result would zero the server's score.
+    """
+    expectations: Dict[str, Dict[str, Any]] = {}
+    for server_id, reports in parsed_reports.items():
+        fresh_reports = filter_fresh_reports(reports or [])
+        if fresh_reports:
+            payload = fresh_reports[0].payload
+            expectations[server_id] = {
+                "players": payload.player_count,
+                "max_players": payload.max_players,
+            }
+    return expectations
+
+
 def _downgrade_outdated_reports(mechanism, server_id: str) -> Dict[str, Any]:
     bt.logging.warning(
         f"[Minecraft] Collector reports for server {server_id} are older than 6h; downgrading score to 0"
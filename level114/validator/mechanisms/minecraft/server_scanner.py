@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import statistics
+import time
 from collections import defaultdict
+from email.utils import parsedate_to_datetime
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import requests
+import aiohttp
+
+from level114.validator.mechanisms.minecraft._hedging import HedgePolicy
+from level114.validator.mechanisms.minecraft._provider_scheduler import ProviderScheduler
+from level114.validator.mechanisms.minecraft._provider_throttle import ProviderThrottle
+from level114.validator.mechanisms.minecraft._slp_client import query_status
 
 SCANNER_TIMEOUT = 3.0
-SCANNERS = ("mcsrvstat", "mcstatus", "mcapi", "xdefcon", "minetools", "tickhosting")
+SCANNER_MAX_CONCURRENCY = 64
+SCANNER_PROVIDER_CONCURRENCY = 8
+# Slots for the direct SLP provider. Adaptive selection divides each provider's
+# queue by its slots, so this also sets SLP's share of the lookups.
+SCANNER_SLP_CONCURRENCY = SCANNER_PROVIDER_CONCURRENCY
+SCANNERS = ("mcsrvstat", "mcstatus", "mcapi", "xdefcon", "minetools", "tickhosting", "slp")
+# Providers we talk to directly rather than through a third-party API.
+DIRECT_SCANNERS = frozenset({"slp"})
+# Slack allowed between the collector's player count and the scanned one, as in
+# scoring's ``player_count_mismatch`` check.
+QUORUM_PLAYER_TOLERANCE = 5
+# Hedge lookups run on top of ``max_concurrency``, bounded to this share of it.
+HEDGE_CONCURRENCY_FRACTION = 0.1
 
 
 def _split_host_port(address: str) -> Tuple[str, Optional[int]]:
@@ -23,39 +44,51 @@ def _split_host_port(address: str) -> Tuple[str, Optional[int]]:
     return address, None
 
 
-def _fetch_json(url: str, *, params: Optional[Dict[str, Any]] = None, timeout: float, logger: logging.Logger) -> Dict[str, Any]:
-    logger.debug(f"scanner GET {url} params={params}")
-    response = requests.get(url, params=params, timeout=timeout)
-    response.raise_for_status()
-    data = response.json()
-    if not isinstance(data, dict):
-        raise ValueError(f"Unexpected payload type from {url}: {type(data)!r}")
-    return data
-
-
-def _fetch(name: str, address: str, host: str, port: Optional[int], timeout: float, logger: logging.Logger) -> Dict[str, Any]:
+def _provider_request(name: str, address: str, host: str, port: Optional[int]) -> Tuple[str, Optional[Dict[str, Any]]]:
     if name == "mcsrvstat":
-        return _fetch_json(f"https://api.mcsrvstat.us/3/{address}", timeout=timeout, logger=logger)
+        return f"https://api.mcsrvstat.us/3/{address}", None
     if name == "mcstatus":
-        return _fetch_json(f"https://api.mcstatus.io/v2/status/java/{address}", timeout=timeout, logger=logger)
+        return f"https://api.mcstatus.io/v2/status/java/{address}", None
     if name == "mcapi":
         params: Dict[str, Any] = {"ip": host}
         if port is not None:
             params["port"] = port
-        return _fetch_json("https://mcapi.us/server/status", params=params, timeout=timeout, logger=logger)
+        return "https://mcapi.us/server/status", params
     if name == "xdefcon":
-        return _fetch_json(f"https://mcapi.xdefcon.com/server/{address}/full/json", timeout=timeout, logger=logger)
+        return f"https://mcapi.xdefcon.com/server/{address}/full/json", None
     if name == "minetools":
         path = f"{host}/{port}" if port is not None else host
-        return _fetch_json(f"https://api.minetools.eu/ping/{path}", timeout=timeout, logger=logger)
+        return f"https://api.minetools.eu/ping/{path}", None
     if name == "tickhosting":
         params = {"ip": host, "type": "java"}
         if port is not None:
             params["port"] = port
-        return _fetch_json("https://mcstats.tickhosting.com/api/status", params=params, timeout=timeout, logger=logger)
+        return "https://mcstats.tickhosting.com/api/status", params
     raise ValueError(f"Unknown scanner {name}")
 
 
+async def _fetch(
+    session: aiohttp.ClientSession,
+    name: str,
+    address: str,
+    host: str,
+    port: Optional[int],
+    timeout: float,
+    logger: logging.Logger,
+) -> Dict[str, Any]:
+    if name == "slp":
+        logger.debug(f"scanner SLP {host}:{port}")
+        return await query_status(host, port, timeout)
+    url, params = _provider_request(name, address, host, port)
+    logger.debug(f"scanner GET {url} params={params}")
+    async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        response.raise_for_status()
+        data = await response.json(content_type=None)
+    if not isinstance(data, dict):
+        raise ValueError(f"Unexpected payload type from {url}: {type(data)!r}")
+    return data
+
+
 def _extract(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     players = None
     max_players = None
@@ -90,6 +123,16 @@ def _extract(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(raw_ping, (int, float)):
             ping = float(raw_ping)
 
+    elif name == "slp":
+        section = payload.get("players") if isinstance(payload.get("players"), dict) else {}
+        online = True
+        if isinstance(section.get("online"), int):
+            players = section["online"]
+        if isinstance(section.get("max"), int):
+            max_players = section["max"]
+        if isinstance(payload.get("latency"), (int, float)):
+            ping = float(payload["latency"])
+
     elif name in {"minetools", "tickhosting"}:
         section = payload.get("players") if isinstance(payload.get("players"), dict) else {}
         raw_latency = payload.get("latency")
@@ -114,7 +157,23 @@ def _extract(name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _attempt(
+def _retry_after_seconds(headers: Any) -> float:
+    """Seconds from a ``Retry-After`` header (delta or HTTP date); 0 when absent."""
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+async def _attempt(
+    session: aiohttp.ClientSession,
     name: str,
     address: str,
     host: str,
@@ -125,12 +184,14 @@ def _attempt(
     stat: List[float],
     index: Optional[int] = None,
     total: Optional[int] = None,
-) -> Tuple[bool, Any, bool]:
+) -> Tuple[bool, Any, Optional[float]]:
+    """Returns ``(ok, data_or_error, throttle)``; ``throttle`` is the Retry-After
+    delay in seconds (0 when unspecified) for a 429 answer and ``None`` otherwise."""
     start = perf_counter()
     label = f"[{index}/{total}][{name}]" if index is not None and total is not None else f"[{stage}][{name}]"
-    disable_scanner = False
+    throttle: Optional[float] = None
     try:
-        payload = _fetch(name, address, host, port, timeout, logger)
+        payload = await _fetch(session, name, address, host, port, timeout, logger)
         data = _extract(name, payload)
         elapsed = perf_counter() - start
         stat[0] += 1
@@ -138,31 +199,74 @@ def _attempt(
         players = data.get("players")
         observed = players if isinstance(players, int) else "UNK"
         logger.info(f"{label} {address} -> players={observed} in {elapsed:.3f}s")
-        return True, data, False
-    except requests.HTTPError as exc:
-        status_code = getattr(exc.response, "status_code", None)
-        if status_code == 429:
-            disable_scanner = True
-            logger.warning(
-                f"{label} {address} -> rate limited (HTTP 429); disabling scanner {name} for the remainder of this cycle"
-            )
+        return True, data, None
+    except aiohttp.ClientResponseError as exc:
+        if exc.status == 429:
+            throttle = _retry_after_seconds(exc.headers)
+            logger.warning(f"{label} {address} -> rate limited (HTTP 429)")
         elapsed = perf_counter() - start
         stat[0] += 1
         stat[1] += elapsed
         logger.error(f"{label} {address} -> ERROR after {elapsed:.3f}s: {exc}")
-        return False, str(exc), disable_scanner
-    except requests.RequestException as exc:
+        return False, str(exc), throttle
+    except asyncio.TimeoutError:
         elapsed = perf_counter() - start
         stat[0] += 1
         stat[1] += elapsed
-        logger.error(f"{label} {address} -> ERROR after {elapsed:.3f}s: {exc}")
-        return False, str(exc), False
+        logger.error(f"{label} {address} -> ERROR after {elapsed:.3f}s: timed out")
+        return False, "timeout", None
     except Exception as exc:  # noqa: BLE001
         elapsed = perf_counter() - start
         stat[0] += 1
         stat[1] += elapsed
         logger.error(f"{label} {address} -> ERROR after {elapsed:.3f}s: {exc}")
-        return False, str(exc), False
+        return False, str(exc), None
+
+
+def _would_zero(result: Dict[str, Any], expected: Optional[Dict[str, Any]]) -> bool:
+    """Whether ``result`` would zero the server's score, judged against its latest report."""
+    if result.get("online") is False:
+        return True
+    if not expected:
+        return False
+    max_players = result.get("max_players")
+    expected_max = expected.get("max_players")
+    if isinstance(max_players, int) and isinstance(expected_max, int) and max_players != expected_max:
+        return True
+    players = result.get("players")
+    expected_players = expected.get("players")
+    return (
+        isinstance(players, int)
+        and isinstance(expected_players, int)
+        and expected_players > players + QUORUM_PLAYER_TOLERANCE
+    )
+
+
+def _consensus(votes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Majority ``online`` and median numbers over provider ``votes``.
+
+    A tie counts as online, so a zero score always needs a majority.
+    """
+    online_count = sum(1 for vote in votes if vote.get("online") is not False)
+    online = online_count * 2 >= len(votes)
+    agreeing = [vote for vote in votes if (vote.get("online") is not False) == online]
+
+    def _median(key: str, kind: Any) -> Any:
+        values = sorted(vote[key] for vote in agreeing if isinstance(vote.get(key), kind))
+        return statistics.median_low(values) if values else None
+
+    return {
+        "online": online,
+        "players": _median("players", int),
+        "max_players": _median("max_players", int),
+        "ping": _median("ping", (int, float)),
+        "scanner": agreeing[0].get("scanner"),
+        "quorum": {
+            "votes": len(votes),
+            "online_votes": online_count,
+            "scanners": [vote.get("scanner") for vote in votes],
+        },
+    }
 
 
 def _pick_scanner(start_index: int, disabled: Set[str]) -> Optional[str]:
@@ -173,13 +277,48 @@ def _pick_scanner(start_index: int, disabled: Set[str]) -> Optional[str]:
     return None
 
 
-def scan_catalog(
+async def scan_catalog_async(
     catalog: Dict[str, Optional[int]],
     logger: logging.Logger,
     *,
     timeout: float = SCANNER_TIMEOUT,
     disabled_scanners: Optional[Set[str]] = None,
+    max_concurrency: int = SCANNER_MAX_CONCURRENCY,
+    provider_concurrency: int = SCANNER_PROVIDER_CONCURRENCY,
+    slp_concurrency: int = SCANNER_SLP_CONCURRENCY,
+    scheduler: Optional[ProviderScheduler] = None,
+    throttle: Optional[ProviderThrottle] = None,
+    quorum_size: int = 0,
+    quorum_budget: int = 0,
+    expected: Optional[Dict[str, Dict[str, Any]]] = None,
+    hedge: Optional[HedgePolicy] = None,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Set[str]]:
+    """Scan ``catalog`` concurrently, returning ``(results, metrics, newly_disabled)``.
+
+    The main pass assigns providers round-robin by catalog position and the
+    retry pass walks each failed address through its untried providers in
+    ``SCANNERS`` order. With a ``scheduler`` both passes instead prefer the
+    provider with the best expected completion time. Requests run concurrently,
+    bounded by ``max_concurrency`` overall and ``provider_concurrency`` per
+    third-party provider (``slp_concurrency`` for SLP). With a ``throttle`` each provider is paced by its own token bucket,
+    which slows down on 429 (honouring ``Retry-After``) and only disables the
+    provider after repeated 429s; without one the first 429 disables it. A
+    disabled provider is skipped for the rest of the call and addresses not yet
+    dispatched to it are routed to another enabled provider. Providers the
+    throttle already exhausted are skipped from the start; callers reset it with
+    ``throttle.start_cycle()`` once per scoring cycle.
+
+    With ``quorum_size`` K > 1, an address whose first answer would zero its
+    score (offline, or players/max players disagreeing with ``expected``, the
+    collector's ``{"players", "max_players"}`` per address) is asked of K - 1
+    more providers at once and gets the majority ``online`` and median counts.
+    At most ``quorum_budget`` such extra lookups are made per call.
+
+    With a ``hedge`` policy, a main-pass lookup still unanswered after its
+    provider's recent latency quantile is raced against a second provider when
+    one of the ``HEDGE_CONCURRENCY_FRACTION`` * ``max_concurrency`` hedge slots
+    is free; the first successful answer wins and the other lookup is cancelled.
+    """
     items = list(catalog.items())
     total = len(items)
     successes: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
@@ -196,49 +335,242 @@ def scan_catalog(
         return [], metrics, newly_disabled
 
     start_all = perf_counter()
+    global_slots = asyncio.Semaphore(max(1, int(max_concurrency)))
+    slot_counts = {
+        name: max(1, int(slp_concurrency if name == "slp" else provider_concurrency))
+        for name in SCANNERS
+    }
+    provider_slots = {name: asyncio.Semaphore(count) for name, count in slot_counts.items()}
+    hedge_slots = asyncio.Semaphore(max(1, int(max(1, int(max_concurrency)) * HEDGE_CONCURRENCY_FRACTION)))
+    expected = expected or {}
+    quorum_size = max(0, int(quorum_size))
+    quorum_stats = {
+        "size": quorum_size,
+        "budget": max(0, int(quorum_budget)),
+        "disputed": 0,
+        "checked": 0,
+        "extra_requests": 0,
+        "overturned": 0,
+        "over_budget": 0,
+        "no_providers": 0,
+    }
+    quorum_addresses: Set[str] = set()
+    hedge_stats = {"lookups": 0, "hedged": 0, "hedge_wins": 0, "primary_wins": 0, "saved_s": 0.0}
+    if scheduler is not None:
+        scheduler.set_slots(slot_counts)
+    if throttle is not None:
+        # Strikes persist across calls within a cycle; the caller resets them.
+        disabled |= throttle.exhausted()
 
-    for index, (address, _hint) in enumerate(items, 1):
-        name = _pick_scanner((index - 1) % len(SCANNERS), disabled)
-        if name is None:
-            logger.warning(f"No scanners available for {address}; all providers disabled this cycle")
-            pool.add(address)
-            continue
-        host, port = _split_host_port(address)
-        attempts[address].add(name)
-        ok, payload, disable = _attempt(name, address, host, port, timeout, logger, "main", stats[name], index, total)
-        if disable:
-            disabled.add(name)
-            newly_disabled.add(name)
+    async def _dispatch(
+        session: aiohttp.ClientSession,
+        name: str,
+        address: str,
+        stage: str,
+        index: Optional[int] = None,
+        sent: Optional[asyncio.Event] = None,
+    ) -> Optional[bool]:
+        """Run one lookup; ``None`` when ``name`` was disabled while waiting for a slot.
+
+        ``sent`` is set once the lookup leaves its provider's queue.
+        """
+        if scheduler is not None:
+            scheduler.begin(name)
+        elapsed: Optional[float] = None
+        ok = False
+        retry_after: Optional[float] = None
+        try:
+            async with provider_slots[name]:
+                sent_at = await throttle.wait(name) if throttle is not None else 0.0
+                if name in disabled:
+                    return None
+                host, port = _split_host_port(address)
+                attempts[address].add(name)
+                if sent is not None:
+                    sent.set()
+                started = perf_counter()
+                ok, payload, retry_after = await _attempt(
+                    session, name, address, host, port, timeout, logger, stage, stats[name], index, total
+                )
+                elapsed = perf_counter() - started
+                if hedge is not None:
+                    hedge.record(name, elapsed)
+        finally:
+            if scheduler is not None:
+                scheduler.end(name, elapsed, ok=ok, throttled=retry_after is not None)
+        if retry_after is not None:
+            exhausted = throttle is None or throttle.on_throttled(name, retry_after, sent_at)
+            if exhausted and name not in disabled:
+                logger.warning(f"Disabling scanner {name} for the remainder of this cycle after repeated HTTP 429")
+                disabled.add(name)
+                newly_disabled.add(name)
+        elif ok and throttle is not None:
+            throttle.on_success(name)
         if ok:
             payload["scanner"] = name
             successes[address].append(payload)
-        else:
-            pool.add(address)
+        return ok
 
-    for address in list(pool):
-        host, port = _split_host_port(address)
-        for name in SCANNERS:
-            if name in attempts[address]:
-                continue
+    def _choose(index: int) -> Optional[str]:
+        if scheduler is not None:
+            return scheduler.pick(disabled, delay_for=throttle.delay_for if throttle else None)
+        return _pick_scanner((index - 1) % len(SCANNERS), disabled)
+
+    def _backup(index: int, address: str, primary: str) -> Optional[str]:
+        skip = attempts[address] | {primary}
+        if scheduler is not None:
+            return scheduler.pick(disabled, exclude=skip, delay_for=throttle.delay_for if throttle else None)
+        return _pick_scanner(index % len(SCANNERS), disabled | skip)
+
+    async def _hedged(
+        session: aiohttp.ClientSession, name: str, address: str, index: int
+    ) -> Optional[bool]:
+        """Dispatch to ``name``, racing a second provider if it outlasts its hedge delay."""
+        hedge_stats["lookups"] += 1
+        delay = hedge.delay(name) if hedge is not None else None
+        if delay is None:
+            return await _dispatch(session, name, address, "main", index)
+        sent = asyncio.Event()
+        primary = asyncio.ensure_future(_dispatch(session, name, address, "main", index, sent))
+        # The hedge delay counts from when the lookup goes out, not from when it
+        # was queued behind the provider's concurrency and pacing limits.
+        sent_wait = asyncio.ensure_future(sent.wait())
+        await asyncio.wait({primary, sent_wait}, return_when=asyncio.FIRST_COMPLETED)
+        sent_wait.cancel()
+        started = perf_counter()
+        done, _pending = await asyncio.wait({primary}, timeout=delay)
+        backup_name = None if done or hedge_slots.locked() else _backup(index, address, name)
+        if backup_name is None:
+            return await primary
+
+        async def _race() -> Optional[bool]:
+            async with hedge_slots:
+                return await _dispatch(session, backup_name, address, "hedge", index)
+
+        hedge_stats["hedged"] += 1
+        backup = asyncio.ensure_future(_race())
+        pending = {primary, backup}
+        outcome: Optional[bool] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result:
+                    outcome = True
+                elif result is False and outcome is None:
+                    outcome = False
+            if outcome:
+                if backup in done and backup.result():
+                    hedge_stats["hedge_wins"] += 1
+                    tail = hedge.tail_mean(name) if hedge is not None else None
+                    if tail is not None and primary in pending:
+                        hedge_stats["saved_s"] += max(0.0, tail - (perf_counter() - started))
+                else:
+                    hedge_stats["primary_wins"] += 1
+                break
+        if primary in pending and hedge is not None:
+            # Keep the slow lookup in the window (as a lower bound) so cancelled
+            # primaries do not drag the quantile down.
+            hedge.record(name, perf_counter() - started)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return outcome
+
+    async def _main(session: aiohttp.ClientSession, index: int, address: str) -> None:
+        async with global_slots:
+            while True:
+                name = _choose(index)
+                if name is None:
+                    logger.warning(f"No scanners available for {address}; all providers disabled this cycle")
+                    pool.add(address)
+                    return
+                ok = await _hedged(session, name, address, index)
+                if ok is None:
+                    continue
+                if not ok:
+                    pool.add(address)
+                return
+
+    async def _retry(session: aiohttp.ClientSession, address: str) -> None:
+        untried = [name for name in SCANNERS if name not in attempts[address]]
+        ordered = (
+            scheduler.rank(untried, delay_for=throttle.delay_for if throttle else None)
+            if scheduler is not None
+            else untried
+        )
+        for name in ordered:
             if name in disabled:
                 continue
-            attempts[address].add(name)
-            ok, payload, disable = _attempt(name, address, host, port, timeout, logger, "retry", stats[name])
-            if disable:
-                disabled.add(name)
-                newly_disabled.add(name)
+            async with global_slots:
+                ok = await _dispatch(session, name, address, "retry")
             if ok:
-                payload["scanner"] = name
-                successes[address].append(payload)
                 retries[name] += 1
-                break
+                return
+
+    def _plan_quorum() -> List[Tuple[str, List[str]]]:
+        budget = quorum_stats["budget"]
+        plans: List[Tuple[str, List[str]]] = []
+        for address, _hint in items:
+            found = successes.get(address)
+            if not found or not _would_zero(found[0], expected.get(address)):
+                continue
+            quorum_stats["disputed"] += 1
+            untried = [name for name in SCANNERS if name not in attempts[address] and name not in disabled]
+            if scheduler is not None:
+                untried = scheduler.rank(untried, delay_for=throttle.delay_for if throttle else None)
+            if not untried:
+                # Every other provider was already tried or is disabled.
+                quorum_stats["no_providers"] += 1
+                continue
+            extra = untried[: min(quorum_size - 1, budget)]
+            if not extra:
+                quorum_stats["over_budget"] += 1
+                continue
+            budget -= len(extra)
+            plans.append((address, extra))
+        return plans
+
+    async def _quorum(session: aiohttp.ClientSession, address: str, names: List[str]) -> None:
+        async def _vote(name: str) -> None:
+            async with global_slots:
+                if await _dispatch(session, name, address, "quorum") is not None:
+                    quorum_stats["extra_requests"] += 1
+
+        await asyncio.gather(*(_vote(name) for name in names))
+        quorum_addresses.add(address)
+
+    connector = aiohttp.TCPConnector(limit=max(1, int(max_concurrency)))
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(
+            *(_main(session, index, address) for index, (address, _hint) in enumerate(items, 1))
+        )
+        await asyncio.gather(*(_retry(session, address) for address in list(pool)))
+        if quorum_size > 1:
+            await asyncio.gather(*(_quorum(session, address, names) for address, names in _plan_quorum()))
 
     total_elapsed = perf_counter() - start_all
     results: List[Dict[str, Any]] = []
     for address, _ in items:
         base = {"address": address, "online": False, "players": 0, "max_players": 0, "ping": 0.0, "scanner": None}
         success_list = successes.get(address, [])
-        if success_list:
+        if address in quorum_addresses:
+            agreed = _consensus(success_list)
+            quorum_stats["checked"] += 1
+            if not _would_zero(agreed, expected.get(address)):
+                quorum_stats["overturned"] += 1
+            base.update(
+                {
+                    "online": agreed["online"],
+                    "players": agreed["players"] or 0,
+                    "max_players": agreed["max_players"] or 0,
+                    "ping": agreed["ping"] or 0.0,
+                    "scanner": agreed["scanner"],
+                    "quorum": agreed["quorum"],
+                }
+            )
+        elif success_list:
             entry = success_list[0]
             base["online"] = bool(next((s.get("online") for s in success_list if s.get("online") is not None), True))
             base["players"] = next((s.get("players") for s in success_list if isinstance(s.get("players"), int)), 0)
@@ -253,8 +585,70 @@ def scan_catalog(
         "per_scanner": stats,
         "retries": retries,
         "disabled_scanners": sorted(newly_disabled),
+        "max_concurrency": max(1, int(max_concurrency)),
+        "provider_concurrency": max(1, int(provider_concurrency)),
+        "slp_concurrency": max(1, int(slp_concurrency)),
+        "selection": "adaptive" if scheduler is not None else "round_robin",
     }
+    if scheduler is not None:
+        metrics["provider_scheduler"] = scheduler.snapshot()
+    if throttle is not None:
+        metrics["provider_throttle"] = throttle.snapshot()
+    if quorum_size > 1:
+        metrics["quorum"] = quorum_stats
+    if hedge is not None:
+        lookups = hedge_stats["lookups"]
+        metrics["hedging"] = {
+            **hedge_stats,
+            "saved_s": round(hedge_stats["saved_s"], 3),
+            "hedge_rate": round(hedge_stats["hedged"] / lookups, 4) if lookups else 0.0,
+            "quantile": hedge.quantile,
+            "providers": hedge.snapshot(),
+        }
     return results, metrics, newly_disabled
 
 
-__all__ = ["SCANNER_TIMEOUT", "scan_catalog"]
+def scan_catalog(
+    catalog: Dict[str, Optional[int]],
+    logger: logging.Logger,
+    *,
+    timeout: float = SCANNER_TIMEOUT,
+    disabled_scanners: Optional[Set[str]] = None,
+    max_concurrency: int = SCANNER_MAX_CONCURRENCY,
+    provider_concurrency: int = SCANNER_PROVIDER_CONCURRENCY,
+    slp_concurrency: int = SCANNER_SLP_CONCURRENCY,
+    scheduler: Optional[ProviderScheduler] = None,
+    throttle: Optional[ProviderThrottle] = None,
+    quorum_size: int = 0,
+    quorum_budget: int = 0,
+    expected: Optional[Dict[str, Dict[str, Any]]] = None,
+    hedge: Optional[HedgePolicy] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Set[str]]:
+    """Blocking wrapper around :func:`scan_catalog_async` for callers without a loop."""
+    return asyncio.run(
+        scan_catalog_async(
+            catalog,
+            logger,
+            timeout=timeout,
+            disabled_scanners=disabled_scanners,
+            max_concurrency=max_concurrency,
+            provider_concurrency=provider_concurrency,
+            slp_concurrency=slp_concurrency,
+            scheduler=scheduler,
+            throttle=throttle,
+            quorum_size=quorum_size,
+            quorum_budget=quorum_budget,
+            expected=expected,
+            hedge=hedge,
+        )
+    )
+
+
+__all__ = [
+    "DIRECT_SCANNERS",
+    "SCANNER_MAX_CONCURRENCY",
+    "SCANNER_PROVIDER_CONCURRENCY",
+    "SCANNER_TIMEOUT",
+    "scan_catalog",
+    "scan_catalog_async",
+]
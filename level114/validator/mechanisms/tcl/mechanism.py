@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any, Dict, Optional
 
@@ -22,6 +23,10 @@ class TclMechanism(ValidatorMechanism):
         super().__init__(context)
         self.collector_api = context.collector_api
         self.metagraph = context.metagraph
+        collector_cfg = getattr(context.config, "collector", None)
+        self.fetch_concurrency: int = max(
+            1, int(getattr(collector_cfg, "max_concurrency", 16) or 16)
+        )
 
         self.last_metrics: Dict[str, Dict[str, Any]] = {}
         self.last_metrics_timestamp: float = 0.0
@@ -51,11 +56,24 @@ class TclMechanism(ValidatorMechanism):
             collected: Dict[str, Dict[str, Any]] = {}
             scoring_results: Dict[str, Dict[str, Any]] = {}
 
-            for hotkey in hotkeys:
+            semaphore = asyncio.Semaphore(self.fetch_concurrency)
+
+            async def _fetch(hotkey: str) -> Any:
+                async with semaphore:
+                    return await self._collector_call("get_tcl_metrics", hotkey)
+
+            responses = await asyncio.gather(
+                *(_fetch(hotkey) for hotkey in hotkeys),
+                return_exceptions=True,
+            )
+
+            for hotkey, response in zip(hotkeys, responses):
                 stats["hotkeys_processed"] += 1
                 stats["servers_processed"] += 1
                 try:
-                    status, payload = self.collector_api.get_tcl_metrics(hotkey)
+                    if isinstance(response, BaseException):
+                        raise response
+                    status, payload = response
                     if status != 200 or not isinstance(payload, dict):
                         continue
 
@@ -128,6 +146,7 @@ class TclMechanism(ValidatorMechanism):
                 "metrics_cached": len(self.last_metrics),
                 "last_metrics_timestamp": self.last_metrics_timestamp,
                 "cached_scores": len(self.score_cache),
+                "collector": self._collector_stats(),
             }
         )
         return status
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 
 import bittensor as bt
 
+from level114.api.async_collector_center_api import AsyncCollectorCenterAPI
 from level114.api.collector_center_api import CollectorCenterAPI
 from level114.validator.mechanisms import (
     MechanismContext,
@@ -27,12 +28,20 @@ class Level114ValidatorRunner:
         metagraph: Any,
         wallet: Any,
         collector_api: CollectorCenterAPI,
+        async_collector_api: Optional[AsyncCollectorCenterAPI] = None,
     ) -> None:
         self.config = config
         self.subtensor = subtensor
         self.metagraph = metagraph
         self.wallet = wallet
         self.collector_api = collector_api
+        # An async client built here is closed by :meth:`close`; one passed in
+        # belongs to the caller.
+        self._owns_async_collector_api = False
+        if async_collector_api is None and isinstance(collector_api, CollectorCenterAPI):
+            async_collector_api = AsyncCollectorCenterAPI(collector_api)
+            self._owns_async_collector_api = True
+        self.async_collector_api = async_collector_api
 
         self._mechanism_registry: Dict[int, type[ValidatorMechanism]] = {
             MinecraftMechanism.mechanism_id: MinecraftMechanism,
@@ -45,6 +54,7 @@ class Level114ValidatorRunner:
             metagraph=self.metagraph,
             wallet=self.wallet,
             collector_api=self.collector_api,
+            async_collector_api=self.async_collector_api,
         )
 
         self._mechanisms: Dict[int, ValidatorMechanism] = {}
@@ -131,6 +141,20 @@ class Level114ValidatorRunner:
             "errors": aggregate_errors,
         }
 
+    async def close(self) -> None:
+        """Stop every mechanism's background work and close the async collector
+        client's ``aiohttp`` session; call once when the validator exits."""
+        for mechanism_id, mechanism in self._mechanisms.items():
+            try:
+                await mechanism.close()
+            except Exception as exc:  # noqa: BLE001
+                bt.logging.warning(f"Failed to close mechanism {mechanism_id}: {exc}")
+        if self._owns_async_collector_api and self.async_collector_api is not None:
+            try:
+                await self.async_collector_api.close()
+            except Exception as exc:  # noqa: BLE001
+                bt.logging.warning(f"Failed to close async collector client: {exc}")
+
     def get_status(self) -> Dict[str, Any]:
         mechanism_status: Dict[int, Dict[str, Any]] = {}
         for mechanism_id, mechanism in self._mechanisms.items():
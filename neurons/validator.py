@@ -157,6 +157,13 @@ class Validator(BaseValidatorNeuron):
                 # Wait a bit longer if both systems fail
                 await asyncio.sleep(30)
     
+    async def shutdown(self):
+        """Stop the scoring system's background work before exiting"""
+        runner = getattr(self, 'scoring_runner', None)
+        if runner is not None:
+            await runner.close()
+        await super().shutdown()
+    
     def _update_legacy_scores(self):
         """
         Update legacy scoring system for compatibility with base validator class
@@ -0,0 +1,97 @@
+"""Local stand-in for the third-party status APIs the scanner queries.
+
+Every provider is served by one aiohttp app on localhost; the scanner is
+pointed at it by patching ``server_scanner._provider_request``. SLP lookups
+are refused, so tests only see the HTTP providers unless they enable SLP
+themselves.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from level114.validator.mechanisms.minecraft import server_scanner
+
+
+class FakeProviders:
+    def __init__(self) -> None:
+        self.behaviour: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    def set(
+        self,
+        name: str,
+        *,
+        online: bool = True,
+        players: int = 5,
+        max_players: int = 20,
+        delay: float = 0.0,
+        throttle_first: int = 0,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Configure ``name``; its first ``throttle_first`` requests answer 429."""
+        self.behaviour[name] = {
+            "online": online,
+            "players": players,
+            "max_players": max_players,
+            "delay": delay,
+            "throttle_first": throttle_first,
+            "retry_after": retry_after,
+        }
+
+    def _payload(self, name: str, spec: Dict[str, Any]) -> Dict[str, Any]:
+        if name == "xdefcon":
+            return {
+                "serverStatus": "online" if spec["online"] else "offline",
+                "players": spec["players"],
+                "maxplayers": spec["max_players"],
+            }
+        players = {"online": spec["players"], "now": spec["players"], "max": spec["max_players"]}
+        if name == "minetools" and not spec["online"]:
+            players = {}
+        return {"online": spec["online"], "players": players}
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        self.requests[name] += 1
+        spec = self.behaviour.get(name) or {}
+        if not spec:
+            self.set(name)
+            spec = self.behaviour[name]
+        if self.requests[name] <= spec["throttle_first"]:
+            headers = {}
+            if spec["retry_after"] is not None:
+                headers["Retry-After"] = str(spec["retry_after"])
+            return web.json_response({"error": "rate limited"}, status=429, headers=headers)
+        if spec["delay"]:
+            await asyncio.sleep(spec["delay"])
+        return web.json_response(self._payload(name, spec))
+
+    async def start(self, monkeypatch: Any) -> "FakeProviders":
+        app = web.Application()
+        app.router.add_get("/{name}/{address}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+        async def refuse(*_args: Any, **_kwargs: Any) -> Dict[str, Any]:
+            raise ConnectionRefusedError("SLP disabled in tests")
+
+        monkeypatch.setattr(
+            server_scanner,
+            "_provider_request",
+            lambda name, address, host, port: (f"{self.url}/{name}/{address}", None),
+        )
+        monkeypatch.setattr(server_scanner, "query_status", refuse)
+        return self
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
@@ -0,0 +1,25 @@
+"""Load single stdlib-only modules by file path.
+
+Importing anything through the ``level114`` package pulls in bittensor; tests
+for modules that do not need it load them directly so they run without it.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_module(relative_path: str) -> ModuleType:
+    path = ROOT / relative_path
+    name = f"_standalone_{path.stem}"
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered before execution so dataclasses can resolve the module.
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
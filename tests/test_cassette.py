@@ -0,0 +1,130 @@
+"""Recording collector traffic from the fake collector and replaying it offline."""
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from level114.api import CollectorCenterAPI  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorTransport,
+)
+
+
+def _recorder(fake: FakeCollector, path: str, **kwargs) -> CollectorCenterAPI:
+    return CollectorCenterAPI(
+        "http://fake",
+        api_key="k",
+        transport=FakeCollectorTransport(fake),
+        rate_limit=0,
+        cassette_mode="record",
+        cassette_path=path,
+        **kwargs,
+    )
+
+
+def _replayer(path: str, **kwargs) -> CollectorCenterAPI:
+    # A different base URL: cassettes are keyed by path and query only.
+    return CollectorCenterAPI(
+        "http://elsewhere", api_key="k", cassette_mode="replay", cassette_path=path, **kwargs
+    )
+
+
+def _cassette_stats(api: CollectorCenterAPI) -> dict:
+    return api.get_stats()["cassette"]
+
+
+def test_round_trip_replays_recorded_responses(tmp_path):
+    path = str(tmp_path / "cycle.jsonl.gz")
+    fake = FakeCollector(FakeCollectorConfig(servers=5))
+    recorder = _recorder(fake, path)
+    servers = recorder.get_active_servers()
+    reports = [recorder.get_server_reports(sid, limit=3) for sid in fake.server_ids]
+    vote_status = recorder.post_server_vote(fake.server_ids[0], {"score": 1})
+    assert _cassette_stats(recorder)["recorded"] == 7
+    recorder.close()
+
+    replay = _replayer(path)
+    assert replay.get_active_servers() == servers
+    assert [replay.get_server_reports(sid, limit=3) for sid in fake.server_ids] == reports
+    assert replay.post_server_vote(fake.server_ids[0], {"score": 1}) == vote_status
+    stats = _cassette_stats(replay)
+    assert stats["replayed"] == 7
+    assert (stats["misses"], stats["over_reads"], stats["truncated"]) == (0, 0, False)
+
+
+def test_replay_keeps_recorded_order_and_counts_over_reads(tmp_path):
+    path = str(tmp_path / "cycle.jsonl.gz")
+    fake = FakeCollector(FakeCollectorConfig(servers=1))
+    recorder = _recorder(fake, path, breaker_threshold=0)
+    fake.config.error_rate = 1.0
+    recorder.get_active_servers()
+    fake.config.error_rate = 0.0
+    recorder.get_active_servers()
+    recorder.close()
+
+    replay = _replayer(path, breaker_threshold=0)
+    assert replay.get_active_servers()[0] == 503
+    assert replay.get_active_servers()[0] == 200
+    assert _cassette_stats(replay)["over_reads"] == 0
+
+    assert replay.get_active_servers()[0] == 200
+    assert _cassette_stats(replay)["over_reads"] == 1
+
+
+def test_unrecorded_request_is_a_miss(tmp_path):
+    path = str(tmp_path / "cycle.jsonl.gz")
+    fake = FakeCollector(FakeCollectorConfig(servers=2))
+    recorder = _recorder(fake, path)
+    recorder.get_server_reports(fake.server_ids[0])
+    recorder.close()
+
+    replay = _replayer(path)
+    assert replay.get_server_reports(fake.server_ids[1]) == (599, [])
+    assert _cassette_stats(replay)["misses"] == 1
+
+
+def test_recorded_timeouts_replay_as_timeouts(tmp_path):
+    path = str(tmp_path / "cycle.jsonl.gz")
+    fake = FakeCollector(FakeCollectorConfig(servers=1, latency_ms=300))
+    recorder = _recorder(fake, path, timeout_seconds=0.05, breaker_threshold=0)
+    assert recorder.get_active_servers() == (599, [])
+    recorder.close()
+
+    replay = _replayer(path, breaker_threshold=0)
+    assert replay.get_active_servers() == (599, [])
+    assert _cassette_stats(replay)["replayed"] == 1
+
+
+def test_unclosed_recording_is_readable(tmp_path):
+    path = str(tmp_path / "cycle.jsonl.gz")
+    fake = FakeCollector(FakeCollectorConfig(servers=10))
+    recorder = _recorder(fake, path)
+    expected = [recorder.get_server_reports(sid) for sid in fake.server_ids]
+
+    # Read while the recorder still holds the file open, as after a crash.
+    replay = _replayer(path)
+    assert [replay.get_server_reports(sid) for sid in fake.server_ids] == expected
+    assert _cassette_stats(replay)["truncated"] is True
+    recorder.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_into_the_same_cassette(tmp_path):
+    from level114.api import AsyncCollectorCenterAPI
+
+    path = str(tmp_path / "cycle.jsonl.gz")
+    fake = FakeCollector(FakeCollectorConfig(servers=2))
+    recorder = _recorder(fake, path)
+    async_recorder = AsyncCollectorCenterAPI(recorder)
+    expected = await async_recorder.get_server_reports(fake.server_ids[0])
+    recorder.get_server_reports(fake.server_ids[1])
+    await async_recorder.close()
+    recorder.close()
+
+    replay = _replayer(path)
+    async_replay = AsyncCollectorCenterAPI(replay)
+    assert await async_replay.get_server_reports(fake.server_ids[0]) == expected
+    assert _cassette_stats(replay)["replayed"] == 1
+    await async_replay.close()
@@ -0,0 +1,88 @@
+"""Conditional GETs against the in-process fake collector."""
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from level114.api import AsyncCollectorCenterAPI, CollectorCenterAPI  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorTransport,
+)
+
+
+def _client(**config) -> CollectorCenterAPI:
+    fake = FakeCollector(FakeCollectorConfig(servers=5, **config))
+    return CollectorCenterAPI(
+        "http://fake", api_key="k", transport=FakeCollectorTransport(fake), rate_limit=0
+    )
+
+
+def _servers_stats(api: CollectorCenterAPI) -> dict:
+    return api.get_stats()["conditional"]["endpoints"]["servers"]
+
+
+def test_unchanged_response_is_served_from_cache():
+    api = _client()
+    status, servers = api.get_active_servers()
+    again_status, again = api.get_active_servers()
+
+    assert (status, again_status) == (200, 200)
+    assert again == servers
+    stats = _servers_stats(api)
+    assert stats["misses"] == 1 and stats["hits"] == 1
+    assert stats["bytes_saved"] > 0
+
+
+def test_cache_hits_are_independent_copies():
+    api = _client()
+    _, servers = api.get_active_servers()
+    servers[0]["id"] = "mutated"
+    servers.append({"id": "extra"})
+
+    _, first_hit = api.get_active_servers()
+    first_hit[0]["id"] = "mutated again"
+    _, second_hit = api.get_active_servers()
+
+    assert len(second_hit) == 5
+    assert second_hit[0]["id"] != "mutated" and second_hit[0]["id"] != "mutated again"
+
+
+def test_not_modified_for_evicted_entry_refetches(monkeypatch):
+    api = _client()
+    cache = api._conditional_cache
+    api.get_active_servers()
+    stale_validators = cache.validators(f"{api.base_url}/servers")
+    assert stale_validators
+
+    # The entry is evicted after its validators went out, so the 304 has nothing to serve.
+    cache._entries.clear()
+    monkeypatch.setattr(cache, "validators", lambda url: dict(stale_validators))
+    status, servers = api.get_active_servers()
+
+    assert status == 200 and len(servers) == 5
+    assert _servers_stats(api)["refetches"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_collector_without_validators_is_not_cached():
+    api = _client(etags=False)
+    api.get_active_servers()
+    api.get_active_servers()
+
+    stats = _servers_stats(api)
+    assert stats["hits"] == 0 and stats["misses"] == 2
+    assert api.get_stats()["conditional"]["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_the_cache():
+    api = _client()
+    async_api = AsyncCollectorCenterAPI(api)
+    _, servers = api.get_active_servers()
+    status, again = await async_api.get_active_servers()
+
+    assert status == 200 and again == servers
+    assert _servers_stats(api)["hits"] == 1
+    await async_api.close()
@@ -0,0 +1,119 @@
+"""The local stand-in collector, in process and over HTTP."""
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from level114.api import CollectorCenterAPI  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorServer,
+    FakeCollectorTransport,
+)
+
+
+def _client(fake: FakeCollector, **kwargs) -> CollectorCenterAPI:
+    return CollectorCenterAPI(
+        "http://fake",
+        api_key="k",
+        transport=FakeCollectorTransport(fake),
+        rate_limit=0,
+        **kwargs,
+    )
+
+
+def test_synthetic_data_is_a_function_of_the_seed():
+    first = FakeCollector(FakeCollectorConfig(servers=3))
+    second = FakeCollector(FakeCollectorConfig(servers=3))
+    other = FakeCollector(FakeCollectorConfig(servers=3, seed=7))
+    # Report timestamps count from each fake's start; align them.
+    second.started_ms = other.started_ms = now_ms = first.started_ms
+
+    assert first.report("srv-00001", 0, now_ms) == second.report("srv-00001", 0, now_ms)
+    assert first.report("srv-00001", 0, now_ms) != other.report("srv-00001", 0, now_ms)
+    assert first.tcl_metrics("hk-00001") == second.tcl_metrics("hk-00001")
+
+
+def test_client_reads_every_endpoint():
+    fake = FakeCollector(FakeCollectorConfig(servers=4, servers_per_hotkey=2))
+    api = _client(fake)
+
+    status, servers = api.get_active_servers()
+    assert status == 200 and [item["id"] for item in servers] == fake.server_ids
+
+    status, mapping = api.get_validator_server_ids_map(fake.hotkeys)
+    assert status == 200
+    assert {hotkey: len(items) for hotkey, items in mapping.items()} == {
+        hotkey: 2 for hotkey in fake.hotkeys
+    }
+
+    status, reports = api.get_server_reports(fake.server_ids[0], limit=5)
+    assert status == 200 and len(reports) == 5
+    assert [report["counter"] for report in reports] == sorted(
+        (report["counter"] for report in reports), reverse=True
+    )
+
+    status, metrics = api.get_tcl_metrics(fake.hotkeys[0])
+    assert status == 200 and "online_players_count" in metrics
+    assert api.get_tcl_metrics("unknown-hotkey")[0] == 404
+
+
+def test_since_ms_returns_only_newer_reports():
+    fake = FakeCollector(FakeCollectorConfig(servers=1, reports_per_server=10))
+    server_id = fake.server_ids[0]
+    reports = fake.reports(server_id, 10, None)
+
+    newer = fake.reports(server_id, 10, reports[3]["client_timestamp_ms"])
+    assert newer == reports[:3]
+
+
+def test_batch_route_and_fallback():
+    fake = FakeCollector(FakeCollectorConfig(servers=6))
+    results = _client(fake, reports_batch_size=3).get_server_reports_batch(fake.server_ids, limit=2)
+    assert {sid: (status, len(items)) for sid, (status, items) in results.items()} == {
+        sid: (200, 2) for sid in fake.server_ids
+    }
+    assert fake.request_counts == {"reports_batch": 2}
+
+    legacy = FakeCollector(FakeCollectorConfig(servers=6, batch_route=False))
+    results = _client(legacy, reports_batch_size=3).get_server_reports_batch(legacy.server_ids, limit=2)
+    assert all(status == 200 for status, _ in results.values())
+    assert legacy.request_counts["reports"] == 6
+
+
+def test_votes_are_deduplicated_by_idempotency_key():
+    fake = FakeCollector(FakeCollectorConfig(servers=1))
+    api = _client(fake)
+    server_id = fake.server_ids[0]
+
+    assert api.post_server_vote(server_id, {"score": 1}, idempotency_key="key-1") == 201
+    assert api.post_server_vote(server_id, {"score": 0}, idempotency_key="key-1") == 200
+    assert fake.votes[server_id] == {"score": 1}
+
+
+def test_injected_faults():
+    throttled = FakeCollector(FakeCollectorConfig(servers=1, throttle_rate=1.0))
+    assert _client(throttled, breaker_threshold=0).get_active_servers()[0] == 429
+
+    failing = FakeCollector(FakeCollectorConfig(servers=1, error_rate=1.0))
+    assert _client(failing, breaker_threshold=0).get_active_servers()[0] == 503
+
+    slow = FakeCollector(FakeCollectorConfig(servers=1, latency_ms=500))
+    status, servers = _client(slow, timeout_seconds=0.05).get_active_servers()
+    assert (status, servers) == (599, [])
+
+    assert throttled.handle("GET", "/validators/tcl/metrics?hotkey=x", {}).status == 401
+
+
+def test_http_server_serves_the_same_fleet():
+    fake = FakeCollector(FakeCollectorConfig(servers=300))
+    with FakeCollectorServer(fake) as server:
+        api = CollectorCenterAPI(server.url, api_key="k", rate_limit=0)
+        status, servers = api.get_active_servers()
+        again_status, _ = api.get_active_servers()
+        api.close()
+
+    assert status == 200 and len(servers) == 300
+    assert again_status == 200
+    assert api.get_stats()["conditional"]["endpoints"]["servers"]["hits"] == 1
@@ -0,0 +1,100 @@
+"""Hedged scanner lookups racing a slow provider against a second one."""
+
+import logging
+import time
+
+import pytest
+
+from _modules import load_module
+
+_hedging = load_module("level114/validator/mechanisms/minecraft/_hedging.py")
+HedgePolicy = _hedging.HedgePolicy
+MIN_SAMPLES = _hedging.MIN_SAMPLES
+MIN_HEDGE_DELAY_SECONDS = _hedging.MIN_HEDGE_DELAY_SECONDS
+
+
+def _policy(samples, name="a", **kwargs) -> HedgePolicy:
+    policy = HedgePolicy([name, "b"], **kwargs)
+    for sample in samples:
+        policy.record(name, sample)
+    return policy
+
+
+def test_no_delay_until_enough_samples():
+    policy = _policy([0.1] * (MIN_SAMPLES - 1))
+    assert policy.delay("a") is None and policy.tail_mean("a") is None
+    policy.record("a", 0.1)
+    assert policy.delay("a") == 0.1
+    assert policy.delay("unknown") is None
+
+
+def test_delay_is_the_latency_quantile_with_a_floor():
+    samples = [index / 100 for index in range(1, 21)]
+    policy = _policy(samples, quantile=0.9)
+    assert policy.delay("a") == 0.19
+    assert policy.tail_mean("a") == pytest.approx(0.195)
+
+    fast = _policy([0.001] * MIN_SAMPLES)
+    assert fast.delay("a") == MIN_HEDGE_DELAY_SECONDS
+
+
+def test_window_keeps_only_recent_samples():
+    policy = _policy([5.0] * 20 + [0.1] * 20, window=20)
+    assert policy.delay("a") == 0.1
+    assert policy.snapshot()["a"] == {"samples": 20, "delay_s": 0.1}
+    assert policy.snapshot()["b"] == {"samples": 0, "delay_s": None}
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_backup_wins(monkeypatch):
+    pytest.importorskip("bittensor")
+    from _fake_providers import FakeProviders
+    from level114.validator.mechanisms.minecraft import server_scanner
+
+    providers = await FakeProviders().start(monkeypatch)
+    providers.set("mcsrvstat", delay=1.0)
+    hedge = HedgePolicy(server_scanner.SCANNERS)
+    for _ in range(MIN_SAMPLES):
+        hedge.record("mcsrvstat", 0.05)
+    only_two = set(server_scanner.SCANNERS) - {"mcsrvstat", "mcstatus"}
+    try:
+        started = time.monotonic()
+        results, metrics, _ = await server_scanner.scan_catalog_async(
+            {"10.0.0.1:25565": None}, logging.getLogger(__name__), disabled_scanners=only_two, hedge=hedge
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        await providers.close()
+
+    assert elapsed < 0.5
+    assert results[0]["online"] and results[0]["scanner"] == "mcstatus"
+    hedging = metrics["hedging"]
+    assert (hedging["lookups"], hedging["hedged"], hedging["hedge_wins"]) == (1, 1, 1)
+    assert hedging["hedge_rate"] == 1.0
+    # The cancelled primary is kept in the window as a lower bound.
+    assert hedge.snapshot()["mcsrvstat"]["samples"] == MIN_SAMPLES + 1
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged(monkeypatch):
+    pytest.importorskip("bittensor")
+    from _fake_providers import FakeProviders
+    from level114.validator.mechanisms.minecraft import server_scanner
+
+    providers = await FakeProviders().start(monkeypatch)
+    hedge = HedgePolicy(server_scanner.SCANNERS)
+    for _ in range(MIN_SAMPLES):
+        hedge.record("mcsrvstat", 0.5)
+    try:
+        results, metrics, _ = await server_scanner.scan_catalog_async(
+            {"10.0.0.1:25565": None},
+            logging.getLogger(__name__),
+            disabled_scanners={"slp"},
+            hedge=hedge,
+        )
+    finally:
+        await providers.close()
+
+    assert results[0]["scanner"] == "mcsrvstat"
+    assert metrics["hedging"]["hedged"] == 0
+    assert sum(providers.requests.values()) == 1
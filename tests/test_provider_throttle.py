@@ -0,0 +1,154 @@
+"""Per-provider pacing that backs off on 429 instead of disabling the provider."""
+
+import logging
+import time
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("bittensor")
+
+from _fake_providers import FakeProviders  # noqa: E402
+from level114.validator.mechanisms.minecraft import server_scanner  # noqa: E402
+from level114.validator.mechanisms.minecraft._provider_throttle import (  # noqa: E402
+    DEFAULT_PROVIDER_RATE,
+    MIN_RATE,
+    ProviderThrottle,
+    parse_rate_overrides,
+)
+
+LOGGER = logging.getLogger(__name__)
+ONLY_TWO = set(server_scanner.SCANNERS) - {"mcsrvstat", "mcstatus"}
+
+
+@pytest_asyncio.fixture
+async def providers(monkeypatch):
+    fake = await FakeProviders().start(monkeypatch)
+    yield fake
+    await fake.close()
+
+
+def _rate(throttle: ProviderThrottle, name: str) -> float:
+    return throttle.snapshot()[name]["rate"]
+
+
+def test_parse_rate_overrides_skips_malformed_entries():
+    assert parse_rate_overrides("mcsrvstat=2, mcapi = 0.5,bad,=3,x=y") == {
+        "mcsrvstat": 2.0,
+        "mcapi": 0.5,
+    }
+    assert parse_rate_overrides(None) == {}
+
+
+def test_throttle_backs_off_and_pauses_for_retry_after():
+    throttle = ProviderThrottle(["a", "b"], default_rate=8.0)
+    assert throttle.on_throttled("a", retry_after=2.0, sent_at=time.monotonic()) is False
+
+    assert _rate(throttle, "a") == 4.0
+    assert 1.9 < throttle.delay_for("a") <= 2.0
+    assert _rate(throttle, "b") == 8.0 and throttle.delay_for("b") < 0.2
+
+
+def test_429s_from_one_episode_count_one_strike():
+    throttle = ProviderThrottle(["a"], default_rate=8.0, max_strikes=2)
+    sent_at = time.monotonic()
+    throttle.on_throttled("a", retry_after=0.01, sent_at=sent_at)
+    throttle.on_throttled("a", retry_after=0.01, sent_at=sent_at)
+
+    snapshot = throttle.snapshot()["a"]
+    assert (snapshot["strikes"], snapshot["throttled"], snapshot["rate"]) == (1, 2, 4.0)
+
+
+def test_max_strikes_exhausts_provider_until_next_cycle():
+    throttle = ProviderThrottle(["a", "b"], default_rate=8.0, max_strikes=2)
+    assert throttle.on_throttled("a", 0.01, time.monotonic()) is False
+    assert throttle.on_throttled("a", 0.01, time.monotonic()) is True
+    assert throttle.exhausted() == {"a"}
+
+    throttle.start_cycle()
+    assert throttle.exhausted() == set()
+    assert _rate(throttle, "a") == 2.0
+
+
+def test_success_resets_strikes_and_recovers_rate_gradually():
+    throttle = ProviderThrottle(["a"], default_rate=10.0, recovery_fraction=0.25)
+    throttle.on_throttled("a", 0.01, time.monotonic())
+    assert _rate(throttle, "a") == 5.0
+
+    throttle.on_success("a")
+    assert _rate(throttle, "a") == 7.5 and throttle.snapshot()["a"]["strikes"] == 0
+    for _ in range(5):
+        throttle.on_success("a")
+    assert _rate(throttle, "a") == 10.0
+
+
+def test_unpaced_provider_is_paced_only_after_429():
+    throttle = ProviderThrottle(["slp"], rates={"slp": 0.0}, recovery_fraction=1.0)
+    assert _rate(throttle, "slp") == 0.0
+
+    throttle.on_throttled("slp", 0.01, time.monotonic())
+    assert _rate(throttle, "slp") == DEFAULT_PROVIDER_RATE / 2
+    throttle.on_success("slp")
+    assert _rate(throttle, "slp") == 0.0
+
+
+def test_rate_never_drops_below_minimum():
+    throttle = ProviderThrottle(["a"], default_rate=1.0, max_strikes=100)
+    for _ in range(20):
+        throttle.on_throttled("a", 0.001, time.monotonic())
+    assert _rate(throttle, "a") == MIN_RATE
+
+
+@pytest.mark.asyncio
+async def test_wait_paces_lookups_to_the_rate():
+    throttle = ProviderThrottle(["a"], default_rate=20.0)
+    started = time.monotonic()
+    for _ in range(3):
+        await throttle.wait("a")
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_scanner_refresh_starts_a_new_throttle_cycle():
+    from level114.validator.mechanisms.minecraft._scanner_controller import MinecraftScanner
+
+    scanner = MinecraftScanner(None, None, interval_seconds=60.0)
+    throttle = scanner.provider_throttle
+    name = next(iter(throttle.snapshot()))
+    for _ in range(throttle.max_strikes):
+        throttle.on_throttled(name, 0.01, time.monotonic())
+    assert throttle.exhausted() == {name}
+
+    assert (await scanner.refresh([]))["status"] == "no_servers"
+    assert throttle.exhausted() == set()
+
+
+@pytest.mark.asyncio
+async def test_scan_keeps_throttled_provider_and_finishes_every_address(providers):
+    providers.set("mcsrvstat", throttle_first=2, retry_after=0.05)
+    throttle = ProviderThrottle(server_scanner.SCANNERS, default_rate=0.0)
+    catalog = {f"10.0.0.{index}:25565": None for index in range(12)}
+
+    results, metrics, newly_disabled = await server_scanner.scan_catalog_async(
+        catalog, LOGGER, disabled_scanners=ONLY_TWO, throttle=throttle
+    )
+
+    assert newly_disabled == set()
+    assert all(result["online"] and result["players"] == 5 for result in results)
+    snapshot = metrics["provider_throttle"]["mcsrvstat"]
+    assert snapshot["throttled"] == 2 and snapshot["strikes"] == 0
+    assert providers.requests["mcsrvstat"] > 2
+
+
+@pytest.mark.asyncio
+async def test_scan_without_throttle_disables_provider_on_first_429(providers):
+    providers.set("mcsrvstat", throttle_first=1)
+    catalog = {f"10.0.0.{index}:25565": None for index in range(6)}
+
+    results, _metrics, newly_disabled = await server_scanner.scan_catalog_async(
+        catalog, LOGGER, disabled_scanners=ONLY_TWO, provider_concurrency=1
+    )
+
+    assert newly_disabled == {"mcsrvstat"}
+    assert all(result["online"] for result in results)
+    assert providers.requests["mcsrvstat"] == 1
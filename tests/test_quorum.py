@@ -0,0 +1,153 @@
+"""Quorum checks for scan results that would zero a server's score."""
+
+import logging
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("bittensor")
+
+from _fake_providers import FakeProviders  # noqa: E402
+from level114.validator.mechanisms.minecraft.server_scanner import (  # noqa: E402
+    QUORUM_PLAYER_TOLERANCE,
+    SCANNERS,
+    _consensus,
+    _would_zero,
+    scan_catalog_async,
+)
+
+LOGGER = logging.getLogger(__name__)
+ADDRESS = "10.0.0.1:25565"
+
+
+def _only(*names: str) -> set:
+    return set(SCANNERS) - set(names)
+
+
+@pytest_asyncio.fixture
+async def providers(monkeypatch):
+    fake = await FakeProviders().start(monkeypatch)
+    yield fake
+    await fake.close()
+
+
+def test_would_zero_offline_and_report_mismatches():
+    assert _would_zero({"online": False}, None)
+    assert not _would_zero({"online": True, "players": 0}, None)
+
+    expected = {"players": 20, "max_players": 50}
+    assert not _would_zero({"online": True, "players": 20, "max_players": 50}, expected)
+    assert _would_zero({"online": True, "players": 20, "max_players": 40}, expected)
+    low = 20 - QUORUM_PLAYER_TOLERANCE
+    assert not _would_zero({"online": True, "players": low, "max_players": 50}, expected)
+    assert _would_zero({"online": True, "players": low - 1, "max_players": 50}, expected)
+    assert not _would_zero({"online": True, "players": None}, expected)
+
+
+def test_consensus_needs_a_majority_to_go_offline():
+    tie = _consensus(
+        [
+            {"online": False, "scanner": "a"},
+            {"online": True, "players": 4, "max_players": 10, "scanner": "b"},
+        ]
+    )
+    assert tie["online"] is True and tie["players"] == 4 and tie["scanner"] == "b"
+
+    offline = _consensus(
+        [
+            {"online": False, "scanner": "a"},
+            {"online": False, "scanner": "b"},
+            {"online": True, "players": 4, "scanner": "c"},
+        ]
+    )
+    assert offline["online"] is False and offline["players"] is None
+    assert offline["quorum"] == {"votes": 3, "online_votes": 1, "scanners": ["a", "b", "c"]}
+
+
+def test_consensus_takes_median_of_agreeing_votes():
+    agreed = _consensus(
+        [
+            {"online": True, "players": 2, "max_players": 50, "ping": 30.0, "scanner": "a"},
+            {"online": True, "players": 20, "max_players": 50, "ping": 10.0, "scanner": "b"},
+            {"online": True, "players": 21, "max_players": 40, "ping": 20.0, "scanner": "c"},
+        ]
+    )
+    assert (agreed["players"], agreed["max_players"], agreed["ping"]) == (20, 50, 20.0)
+
+
+@pytest.mark.asyncio
+async def test_single_offline_answer_is_overturned_by_quorum(providers):
+    providers.set("mcsrvstat", online=False)
+
+    results, metrics, _ = await scan_catalog_async(
+        {ADDRESS: None},
+        LOGGER,
+        disabled_scanners={"slp"},
+        quorum_size=3,
+        quorum_budget=10,
+    )
+
+    assert results[0]["online"] is True and results[0]["players"] == 5
+    assert results[0]["quorum"]["scanners"] == ["mcsrvstat", "mcstatus", "mcapi"]
+    quorum = metrics["quorum"]
+    assert (quorum["disputed"], quorum["checked"], quorum["overturned"]) == (1, 1, 1)
+    assert quorum["extra_requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_player_count_below_report_is_disputed(providers):
+    providers.set("mcsrvstat", players=1)
+    providers.set("mcstatus", players=20)
+    providers.set("mcapi", players=19)
+
+    results, metrics, _ = await scan_catalog_async(
+        {ADDRESS: None},
+        LOGGER,
+        disabled_scanners={"slp"},
+        quorum_size=3,
+        quorum_budget=10,
+        expected={ADDRESS: {"players": 20, "max_players": 20}},
+    )
+
+    assert results[0]["players"] == 19
+    assert metrics["quorum"]["overturned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_and_missing_providers_are_counted_apart(providers):
+    for name in ("mcsrvstat", "mcstatus", "mcapi"):
+        providers.set(name, online=False)
+
+    results, metrics, _ = await scan_catalog_async(
+        {ADDRESS: None, "10.0.0.2:25565": None},
+        LOGGER,
+        disabled_scanners=_only("mcsrvstat", "mcstatus", "mcapi"),
+        quorum_size=3,
+        quorum_budget=1,
+    )
+    assert [result["online"] for result in results] == [False, False]
+    quorum = metrics["quorum"]
+    assert (quorum["disputed"], quorum["checked"], quorum["over_budget"]) == (2, 1, 1)
+    assert quorum["no_providers"] == 0 and quorum["extra_requests"] == 1
+
+    _, metrics, _ = await scan_catalog_async(
+        {ADDRESS: None},
+        LOGGER,
+        disabled_scanners=_only("mcsrvstat"),
+        quorum_size=3,
+        quorum_budget=10,
+    )
+    quorum = metrics["quorum"]
+    assert (quorum["disputed"], quorum["no_providers"], quorum["over_budget"]) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_quorum_off_keeps_first_answer(providers):
+    providers.set("mcsrvstat", online=False)
+
+    results, metrics, _ = await scan_catalog_async(
+        {ADDRESS: None}, LOGGER, disabled_scanners={"slp"}
+    )
+    assert results[0]["online"] is False
+    assert "quorum" not in metrics
+    assert sum(providers.requests.values()) == 1
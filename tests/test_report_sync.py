@@ -0,0 +1,101 @@
+"""Incremental report sync against the in-process fake collector."""
+
+import time
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from level114.api import CollectorCenterAPI  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorTransport,
+)
+from level114.validator.mechanisms.minecraft.report_sync import ReportSyncCache  # noqa: E402
+
+DAY_MS = 86_400_000
+
+
+def _client(fake: FakeCollector) -> CollectorCenterAPI:
+    return CollectorCenterAPI(
+        "http://fake", api_key="k", transport=FakeCollectorTransport(fake), rate_limit=0
+    )
+
+
+def test_sync_reuses_known_reports_and_parses_only_new_ones():
+    fake = FakeCollector(FakeCollectorConfig(servers=1, reports_per_server=10, report_interval_ms=200))
+    api = _client(fake)
+    server_id = fake.server_ids[0]
+    cache = ReportSyncCache(max_history=10)
+
+    status, reports = api.get_server_reports(server_id, limit=10, since_ms=cache.cursor(server_id))
+    assert status == 200
+    window, parsed, reused = cache.merge(server_id, reports)
+    assert (parsed, reused) == (10, 0)
+    assert cache.cursor(server_id) == reports[0]["client_timestamp_ms"]
+
+    time.sleep(0.45)
+    status, reports = api.get_server_reports(server_id, limit=10, since_ms=cache.cursor(server_id))
+    assert status == 200 and 1 <= len(reports) < 10
+    window, parsed, reused = cache.merge(server_id, reports)
+    assert (parsed, reused) == (len(reports), 0)
+    assert len(window) == 10
+    assert [report.counter for report in window] == sorted(
+        (report.counter for report in window), reverse=True
+    )
+    assert cache.cursor(server_id) == reports[0]["client_timestamp_ms"]
+
+
+def test_sync_dedupes_when_collector_ignores_cursor():
+    fake = FakeCollector(FakeCollectorConfig(servers=1, reports_per_server=5))
+    server_id = fake.server_ids[0]
+    reports = fake.reports(server_id, 5, None)
+    cache = ReportSyncCache()
+    cache.merge(server_id, reports)
+
+    window, parsed, reused = cache.merge(server_id, reports + reports[:2])
+    assert (parsed, reused) == (0, 5)
+    assert len(window) == 5
+
+
+def test_future_timestamp_does_not_advance_cursor():
+    fake = FakeCollector(FakeCollectorConfig(servers=1, reports_per_server=3))
+    server_id = fake.server_ids[0]
+    reports = fake.reports(server_id, 3, None)
+    now_ms = int(time.time() * 1000)
+    ahead = dict(reports[0], id="ahead", counter=10_000, client_timestamp_ms=now_ms + 3_600_000)
+    cache = ReportSyncCache()
+
+    cache.merge(server_id, [ahead] + reports, now_ms=now_ms)
+    assert cache.cursor(server_id) == reports[0]["client_timestamp_ms"]
+
+
+def test_clamped_reports_are_reparsed_on_every_merge():
+    fake = FakeCollector(FakeCollectorConfig(servers=1, reports_per_server=2))
+    server_id = fake.server_ids[0]
+    fresh, stale = fake.reports(server_id, 2, None)
+    stale = dict(stale, client_timestamp_ms=stale["client_timestamp_ms"] - 3 * DAY_MS)
+    cache = ReportSyncCache()
+
+    first, parsed, _ = cache.merge(server_id, [fresh, stale])
+    assert parsed == 2
+    time.sleep(0.01)
+    carried, parsed, reused = cache.merge(server_id, [])
+    assert (parsed, reused) == (1, 0)
+    assert carried[0] is first[0]
+    assert carried[1].client_timestamp_ms > first[1].client_timestamp_ms
+
+    _, parsed, reused = cache.merge(server_id, [fresh, stale])
+    assert (parsed, reused) == (1, 1)
+
+
+def test_retain_drops_unmapped_servers():
+    fake = FakeCollector(FakeCollectorConfig(servers=2, reports_per_server=1))
+    cache = ReportSyncCache()
+    for server_id in fake.server_ids:
+        cache.merge(server_id, fake.reports(server_id, 1, None))
+
+    cache.retain(fake.server_ids[:1])
+    assert len(cache) == 1
+    assert cache.cursor(fake.server_ids[1]) is None
@@ -0,0 +1,117 @@
+"""Client-side request scheduler shared by the collector clients."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("bittensor")
+
+from level114.api import AsyncCollectorCenterAPI, CollectorCenterAPI  # noqa: E402
+from level114.api._collector_center_scheduler import _RequestScheduler  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorTransport,
+)
+
+
+def test_zero_rate_disables_scheduling():
+    scheduler = _RequestScheduler(rate=0)
+    for _ in range(100):
+        scheduler.acquire("reports")
+    assert not scheduler.enabled
+    assert scheduler.stats()["endpoints"] == {}
+
+
+def test_burst_is_granted_then_requests_are_paced():
+    scheduler = _RequestScheduler(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(4):
+        scheduler.acquire("reports")
+    elapsed = time.monotonic() - started
+    scheduler.close()
+
+    assert elapsed >= 0.08
+    counters = scheduler.stats()["endpoints"]["reports"]
+    assert counters["granted"] == 4 and counters["delayed"] == 2
+
+
+async def _served_order(scheduler: _RequestScheduler, endpoints: list) -> list:
+    order = []
+
+    async def take(endpoint: str) -> None:
+        await scheduler.acquire_async(endpoint)
+        order.append(endpoint)
+
+    scheduler.acquire("ids")  # empty the bucket so everything below queues
+    await asyncio.gather(*(take(endpoint) for endpoint in endpoints))
+    scheduler.close()
+    return order
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_endpoints_are_served_first():
+    scheduler = _RequestScheduler(rate=50, burst=1)
+    order = await _served_order(scheduler, ["vote", "vote", "reports", "ids"])
+    assert order == ["ids", "reports", "vote", "vote"]
+
+
+@pytest.mark.asyncio
+async def test_endpoints_of_one_class_are_served_round_robin():
+    scheduler = _RequestScheduler(rate=50, burst=1)
+    order = await _served_order(scheduler, ["reports"] * 3 + ["servers"] * 3)
+    assert order == ["reports", "servers"] * 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_async_waiter_does_not_use_a_token():
+    scheduler = _RequestScheduler(rate=20, burst=1)
+    scheduler.acquire("reports")
+    abandoned = asyncio.ensure_future(scheduler.acquire_async("reports"))
+    await asyncio.sleep(0)
+    abandoned.cancel()
+
+    started = time.monotonic()
+    await scheduler.acquire_async("servers")
+    assert time.monotonic() - started < 0.09
+    assert scheduler.stats()["queued"] == 0
+    scheduler.close()
+
+
+def test_close_releases_blocked_callers():
+    scheduler = _RequestScheduler(rate=0.1, burst=1)
+    scheduler.acquire("reports")
+    waiter = threading.Thread(target=scheduler.acquire, args=("reports",))
+    waiter.start()
+    time.sleep(0.05)
+
+    scheduler.close()
+    waiter.join(timeout=1.0)
+    assert not waiter.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_clients_share_one_budget():
+    fake = FakeCollector(FakeCollectorConfig(servers=4))
+    api = CollectorCenterAPI(
+        "http://fake",
+        api_key="k",
+        transport=FakeCollectorTransport(fake),
+        rate_limit=40,
+        rate_burst=2,
+    )
+    async_api = AsyncCollectorCenterAPI(api)
+    started = time.monotonic()
+    await asyncio.gather(
+        asyncio.to_thread(lambda: [api.get_server_reports(sid) for sid in fake.server_ids]),
+        *(async_api.get_server_reports(sid) for sid in fake.server_ids),
+    )
+    elapsed = time.monotonic() - started
+
+    # 8 requests, 2 from the burst, 6 paced at 40/s.
+    assert elapsed >= 0.14
+    assert api.get_stats()["scheduler"]["endpoints"]["reports"]["granted"] == 8
+    await async_api.close()
+    api.close()
@@ -0,0 +1,127 @@
+"""Adaptive timeouts and the per-endpoint circuit breaker."""
+
+import time
+
+import pytest
+
+from _modules import load_module
+
+_resilience = load_module("level114/api/_collector_center_resilience.py")
+CollectorCircuitOpenError = _resilience.CollectorCircuitOpenError
+_CircuitBreaker = _resilience._CircuitBreaker
+_LatencyTracker = _resilience._LatencyTracker
+
+
+def test_timeout_uses_ceiling_until_enough_samples():
+    tracker = _LatencyTracker(min_samples=3, factor=3.0, floor=0.5)
+    tracker.record("reports", 0.2)
+    tracker.record("reports", 0.2)
+    assert tracker.timeout_for("reports", 10.0) == 10.0
+
+    tracker.record("reports", 0.4)
+    assert tracker.timeout_for("reports", 10.0) == pytest.approx(1.2)
+    assert tracker.timeout_for("reports", 1.0) == 1.0
+    assert tracker.timeout_for("servers", 10.0) == 10.0
+
+
+def test_timeout_respects_floor_and_disabled_tracker():
+    tracker = _LatencyTracker(min_samples=1, floor=2.0)
+    tracker.record("reports", 0.01)
+    assert tracker.timeout_for("reports", 10.0) == 2.0
+
+    disabled = _LatencyTracker(min_samples=1, enabled=False)
+    disabled.record("reports", 0.01)
+    assert disabled.timeout_for("reports", 10.0) == 10.0
+
+
+def test_breaker_opens_fails_fast_and_recovers_through_probe():
+    breaker = _CircuitBreaker(threshold=3, cooldown=0.05)
+    for _ in range(3):
+        breaker.before_request("servers")
+        breaker.record_failure("servers")
+
+    with pytest.raises(CollectorCircuitOpenError):
+        breaker.before_request("servers")
+    breaker.before_request("reports")
+
+    time.sleep(0.06)
+    breaker.before_request("servers")  # the half-open probe
+    with pytest.raises(CollectorCircuitOpenError):
+        breaker.before_request("servers")
+    breaker.record_success("servers")
+    breaker.before_request("servers")
+
+    stats = breaker.stats()["servers"]
+    assert stats["state"] == "closed" and stats["trips"] == 1 and stats["rejected"] == 2
+
+
+def test_failed_probe_reopens_breaker():
+    breaker = _CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.record_failure("servers")
+    time.sleep(0.06)
+    breaker.before_request("servers")
+    breaker.record_failure("servers")
+
+    assert breaker.stats()["servers"]["state"] == "open"
+    assert breaker.stats()["servers"]["trips"] == 2
+
+
+def test_breaker_counts_each_failing_resource_once():
+    breaker = _CircuitBreaker(threshold=3)
+    for _ in range(10):
+        breaker.record_failure("reports", "srv-1")
+        breaker.record_failure("reports", "srv-2")
+    assert breaker.stats()["reports"]["state"] == "closed"
+
+    breaker.record_failure("reports", "srv-3")
+    assert breaker.stats()["reports"]["state"] == "open"
+
+
+def test_success_clears_failing_resources():
+    breaker = _CircuitBreaker(threshold=2)
+    breaker.record_failure("reports", "srv-1")
+    breaker.record_success("reports")
+    breaker.record_failure("reports", "srv-2")
+
+    stats = breaker.stats()["reports"]
+    assert stats["state"] == "closed" and stats["failing_resources"] == 1
+
+
+def test_zero_threshold_disables_breaker():
+    breaker = _CircuitBreaker(threshold=0)
+    for _ in range(50):
+        breaker.record_failure("servers")
+    breaker.before_request("servers")
+    assert breaker.stats() == {}
+
+
+def test_client_breaker_against_failing_collector():
+    pytest.importorskip("bittensor")
+    from level114.api import CollectorCenterAPI
+    from level114.api.fake_collector import (
+        FakeCollector,
+        FakeCollectorConfig,
+        FakeCollectorTransport,
+    )
+
+    fake = FakeCollector(FakeCollectorConfig(servers=10, error_rate=1.0))
+    api = CollectorCenterAPI(
+        "http://fake",
+        api_key="k",
+        transport=FakeCollectorTransport(fake),
+        rate_limit=0,
+        breaker_threshold=3,
+    )
+    for _ in range(5):
+        status, _ = api.get_server_reports(fake.server_ids[0])
+        assert status >= 500
+    assert api.get_stats()["breakers"]["reports"]["state"] == "closed"
+
+    for server_id in fake.server_ids[1:3]:
+        api.get_server_reports(server_id)
+    assert api.get_stats()["breakers"]["reports"]["state"] == "open"
+
+    sent = sum(fake.request_counts.values())
+    status, reports = api.get_server_reports(fake.server_ids[5])
+    assert (status, reports) == (599, [])
+    assert sum(fake.request_counts.values()) == sent
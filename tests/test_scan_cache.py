@@ -0,0 +1,103 @@
+"""Per-address scan cache and incremental rescans."""
+
+import logging
+import random
+
+import pytest
+
+from _modules import load_module
+
+_scan_cache = load_module("level114/validator/mechanisms/minecraft/_scan_cache.py")
+ScanCache = _scan_cache.ScanCache
+FAILURE_TTL_FRACTION = _scan_cache.FAILURE_TTL_FRACTION
+
+GOOD = {"online": True, "players": 3, "scanner": "mcsrvstat"}
+FAILED = {"online": False, "players": 0, "scanner": None}
+
+
+def test_entries_expire_within_their_jittered_ttl():
+    cache = ScanCache(100.0, jitter_fraction=0.2, rng=random.Random(1))
+    for index in range(50):
+        cache.put(f"10.0.0.{index}:25565", GOOD, now=0.0)
+    expiries = [cache.expires_at(f"10.0.0.{index}:25565") for index in range(50)]
+
+    assert all(80.0 <= expiry <= 120.0 for expiry in expiries)
+    assert len(set(expiries)) == 50
+    assert cache.get("10.0.0.0:25565", now=expiries[0] - 0.01) is GOOD
+    assert cache.get("10.0.0.0:25565", now=expiries[0]) is None
+
+
+def test_failed_lookups_expire_sooner():
+    cache = ScanCache(100.0, jitter_fraction=0.0)
+    cache.put("a:1", GOOD, now=0.0)
+    cache.put("b:1", FAILED, now=0.0)
+
+    assert cache.expires_at("a:1") == 100.0
+    assert cache.expires_at("b:1") == 100.0 * FAILURE_TTL_FRACTION
+
+
+def test_split_partitions_and_counts():
+    cache = ScanCache(10.0, jitter_fraction=0.0)
+    cache.put("a:1", GOOD, now=0.0)
+    cache.put("b:1", GOOD, now=-20.0)
+
+    fresh, due = cache.split(["a:1", "b:1", "c:1"], now=5.0)
+    assert fresh == {"a:1": GOOD} and due == ["b:1", "c:1"]
+    stats = cache.stats(now=5.0)
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["next_expiry_s"]) == (1, 2, 1, 5.0)
+
+
+def test_retain_drops_addresses_left_the_catalog():
+    cache = ScanCache(10.0)
+    cache.put("a:1", GOOD)
+    cache.put("b:1", GOOD)
+    cache.retain(["b:1"])
+
+    assert len(cache) == 1 and cache.get("a:1") is None
+
+
+@pytest.mark.asyncio
+async def test_perform_scan_only_rescans_expired_addresses(monkeypatch):
+    pytest.importorskip("bittensor")
+    from _fake_providers import FakeProviders
+    from level114.api import AsyncCollectorCenterAPI, CollectorCenterAPI
+    from level114.api.fake_collector import (
+        FakeCollector,
+        FakeCollectorConfig,
+        FakeCollectorTransport,
+    )
+    from level114.validator.mechanisms.minecraft._scanner_runner import perform_scan
+
+    fake = FakeCollector(FakeCollectorConfig(servers=8))
+    api = CollectorCenterAPI(
+        "http://fake", api_key="k", transport=FakeCollectorTransport(fake), rate_limit=0
+    )
+    async_api = AsyncCollectorCenterAPI(api)
+    cache = ScanCache(600.0)
+    server_ids = set(fake.server_ids)
+    providers = await FakeProviders().start(monkeypatch)
+    try:
+        first = await perform_scan(
+            api, logging.getLogger(__name__), server_ids, cache=cache, async_collector_api=async_api
+        )
+        scanned = sum(providers.requests.values())
+        assert first["metrics"]["cache"]["scanned"] == 8
+        assert all(first["results"][sid]["online"] for sid in server_ids)
+
+        # Age one address past its TTL; only it is looked up again.
+        stale_address = first["results"][fake.server_ids[0]]["address"]
+        cache.put(stale_address, first["results"][fake.server_ids[0]], now=0.0)
+        second = await perform_scan(
+            api, logging.getLogger(__name__), server_ids, cache=cache, async_collector_api=async_api
+        )
+    finally:
+        await providers.close()
+        await async_api.close()
+
+    assert sum(providers.requests.values()) == scanned + 1
+    assert second["metrics"]["cache"]["scanned"] == 1
+    assert second["metrics"]["cache"]["hits"] == 7
+    assert {sid: second["results"][sid]["players"] for sid in server_ids} == {
+        sid: 5 for sid in server_ids
+    }
+    assert fake.request_counts["servers"] == 2
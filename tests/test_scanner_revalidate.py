@@ -0,0 +1,116 @@
+"""Stale-while-revalidate mode for ``MinecraftScanner.refresh``."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("bittensor")
+
+from _fake_providers import FakeProviders  # noqa: E402
+from level114.api import AsyncCollectorCenterAPI, CollectorCenterAPI  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorTransport,
+)
+from level114.validator.mechanisms.minecraft._scanner_controller import MinecraftScanner  # noqa: E402
+
+INTERVAL = 1.0
+SERVERS = 10
+
+
+@pytest_asyncio.fixture
+async def setup(monkeypatch):
+    providers = await FakeProviders().start(monkeypatch)
+    fake = FakeCollector(FakeCollectorConfig(servers=SERVERS))
+    api = CollectorCenterAPI(
+        "http://fake", api_key="k", transport=FakeCollectorTransport(fake), rate_limit=0
+    )
+    async_api = AsyncCollectorCenterAPI(api)
+    scanner = MinecraftScanner(
+        api,
+        logging.getLogger(__name__),
+        INTERVAL,
+        mode="revalidate",
+        max_staleness_seconds=10.0,
+        ttl_jitter=0.0,
+        provider_rate=0.0,
+        async_collector_api=async_api,
+    )
+    yield scanner, fake, providers
+    await scanner.close()
+    await async_api.close()
+    await providers.close()
+
+
+def _lookups(providers: FakeProviders) -> int:
+    return sum(providers.requests.values())
+
+
+@pytest.mark.asyncio
+async def test_due_refresh_serves_stale_results_and_rescans_in_background(setup):
+    scanner, fake, providers = setup
+    assert (await scanner.refresh(fake.server_ids))["status"] == "performed"
+    first_scan = scanner.last_scan_time
+    await asyncio.sleep(INTERVAL + 0.05)
+
+    providers.set("mcsrvstat", players=9, delay=0.2)
+    providers.set("mcstatus", players=9, delay=0.2)
+    started = time.monotonic()
+    status = await scanner.refresh(fake.server_ids)
+    assert time.monotonic() - started < 0.1
+    assert status["status"] == "stale" and status["revalidation_started"] is True
+    assert status["age_seconds"] >= INTERVAL
+    assert scanner.results[fake.server_ids[0]]["players"] == 5
+
+    again = await scanner.refresh(fake.server_ids)
+    assert again["status"] == "stale" and again["revalidation_started"] is False
+
+    await scanner._revalidation
+    assert scanner.last_scan_time > first_scan
+    assert (await scanner.refresh(fake.server_ids))["status"] == "cached"
+
+
+@pytest.mark.asyncio
+async def test_results_older_than_max_staleness_are_rescanned_inline(setup):
+    scanner, fake, providers = setup
+    scanner.max_staleness_seconds = 0.5
+    await scanner.refresh(fake.server_ids)
+    await asyncio.sleep(INTERVAL + 0.05)
+    lookups = _lookups(providers)
+
+    status = await scanner.refresh(fake.server_ids)
+    assert status["status"] == "performed"
+    assert _lookups(providers) == lookups + SERVERS
+
+
+@pytest.mark.asyncio
+async def test_blocking_refresh_waits_for_inflight_revalidation(setup):
+    scanner, fake, providers = setup
+    await scanner.refresh(fake.server_ids)
+    await asyncio.sleep(INTERVAL + 0.05)
+    lookups = _lookups(providers)
+
+    for name in ("mcsrvstat", "mcstatus", "mcapi", "xdefcon", "minetools", "tickhosting"):
+        providers.set(name, delay=0.3)
+    assert (await scanner.refresh(fake.server_ids))["status"] == "stale"
+    scanner.max_staleness_seconds = 0.0
+    status = await scanner.refresh(fake.server_ids)
+
+    assert scanner._revalidation.done()
+    assert status["status"] == "cached"
+    assert _lookups(providers) == lookups + SERVERS
+
+
+@pytest.mark.asyncio
+async def test_servers_never_scanned_are_scanned_before_returning(setup):
+    scanner, fake, _providers = setup
+    await scanner.refresh(fake.server_ids[:5])
+    await asyncio.sleep(INTERVAL + 0.05)
+
+    status = await scanner.refresh(fake.server_ids)
+    assert status["status"] == "performed"
+    assert all(scanner.results[sid]["online"] for sid in fake.server_ids)
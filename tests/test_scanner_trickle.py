@@ -0,0 +1,90 @@
+"""Trickle mode: the scanner rescans a slice of the catalog every tick."""
+
+import asyncio
+import logging
+import time
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("bittensor")
+
+from _fake_providers import FakeProviders  # noqa: E402
+from level114.api import AsyncCollectorCenterAPI, CollectorCenterAPI  # noqa: E402
+from level114.api.fake_collector import (  # noqa: E402
+    FakeCollector,
+    FakeCollectorConfig,
+    FakeCollectorTransport,
+)
+from level114.validator.mechanisms.minecraft._scanner_controller import MinecraftScanner  # noqa: E402
+
+INTERVAL = 1.0
+TICK = 0.05
+
+
+@pytest_asyncio.fixture
+async def setup(monkeypatch):
+    providers = await FakeProviders().start(monkeypatch)
+    fake = FakeCollector(FakeCollectorConfig(servers=20))
+    api = CollectorCenterAPI(
+        "http://fake", api_key="k", transport=FakeCollectorTransport(fake), rate_limit=0
+    )
+    async_api = AsyncCollectorCenterAPI(api)
+    scanner = MinecraftScanner(
+        api,
+        logging.getLogger(__name__),
+        INTERVAL,
+        mode="trickle",
+        provider_rate=0.0,
+        async_collector_api=async_api,
+    )
+    scanner.trickle_tick_seconds = TICK
+    yield scanner, fake, providers
+    await scanner.close()
+    await async_api.close()
+    await providers.close()
+
+
+@pytest.mark.asyncio
+async def test_new_servers_are_warmed_before_refresh_returns(setup):
+    scanner, fake, providers = setup
+    status = await scanner.refresh(fake.server_ids)
+
+    assert status["status"] == "warmup" and status["warmed"] == 20
+    assert all(scanner.results[sid]["online"] for sid in fake.server_ids)
+    assert sum(providers.requests.values()) >= 20
+
+    started = time.monotonic()
+    status = await scanner.refresh(fake.server_ids)
+    assert status["status"] == "snapshot"
+    assert time.monotonic() - started < TICK
+
+
+@pytest.mark.asyncio
+async def test_background_ticks_keep_every_server_within_its_interval(setup):
+    scanner, fake, _providers = setup
+    priority = set(fake.server_ids[:4])
+    await scanner.refresh(fake.server_ids, priority_ids=priority)
+    await asyncio.sleep(2.5 * INTERVAL)
+
+    now = time.time()
+    ages = {sid: now - scanner._scanned_at[sid] for sid in fake.server_ids}
+    assert max(ages.values()) < INTERVAL + 0.4
+    assert max(ages[sid] for sid in priority) < INTERVAL * 0.5 + 0.4
+
+    counters = scanner.last_metrics["trickle"]
+    assert counters["ticks"] > 10 and counters["scanned"] > 20
+    assert counters["errors"] == 0
+    # One forced fetch for the warm-up, then at most one per interval.
+    assert fake.request_counts["servers"] <= 4
+
+
+@pytest.mark.asyncio
+async def test_close_stops_background_scans(setup):
+    scanner, fake, providers = setup
+    await scanner.refresh(fake.server_ids)
+    await scanner.close()
+    requests = sum(providers.requests.values())
+
+    await asyncio.sleep(5 * TICK)
+    assert sum(providers.requests.values()) == requests
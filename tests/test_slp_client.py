@@ -0,0 +1,115 @@
+"""Server List Ping client and scanner provider against a local fake responder."""
+
+import asyncio
+import functools
+import json
+import logging
+
+import pytest
+
+from _modules import load_module
+
+_slp = load_module("level114/validator/mechanisms/minecraft/_slp_client.py")
+_pack_varint = _slp._pack_varint
+_read_varint = _slp._read_varint
+query_status = _slp.query_status
+
+STATUS = {
+    "version": {"name": "1.21", "protocol": 767},
+    "players": {"online": 7, "max": 50},
+    "description": "fake",
+}
+
+
+async def _read_packet(reader: asyncio.StreamReader) -> bytes:
+    return await reader.readexactly(await _read_varint(reader))
+
+
+def _packet(body: bytes) -> bytes:
+    return _pack_varint(len(body)) + body
+
+
+async def _start_responder(*, pong: bool = True, status_packet_id: int = 0x00):
+    """Serve one status exchange per connection, echoing the ping unless ``pong`` is off."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await _read_packet(reader)  # handshake
+            await _read_packet(reader)  # status request
+            body = json.dumps(STATUS).encode()
+            writer.write(_packet(_pack_varint(status_packet_id) + _pack_varint(len(body)) + body))
+            await writer.drain()
+            if pong:
+                writer.write(_packet(await _read_packet(reader)))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_query_status_returns_status_and_latency():
+    server, port = await _start_responder()
+    async with server:
+        status = await query_status("127.0.0.1", port, timeout=2.0, allow_private=True)
+    assert status["players"] == {"online": 7, "max": 50}
+    assert status["latency"] >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_query_status_keeps_status_when_server_skips_pong():
+    server, port = await _start_responder(pong=False)
+    async with server:
+        status = await query_status("127.0.0.1", port, timeout=2.0, allow_private=True)
+    assert status["players"]["online"] == 7
+    assert "latency" not in status
+
+
+@pytest.mark.asyncio
+async def test_query_status_rejects_unexpected_packet():
+    server, port = await _start_responder(status_packet_id=0x05)
+    async with server:
+        with pytest.raises(ValueError):
+            await query_status("127.0.0.1", port, timeout=2.0, allow_private=True)
+
+
+@pytest.mark.asyncio
+async def test_query_status_refuses_private_addresses():
+    server, port = await _start_responder()
+    async with server:
+        for host in ("127.0.0.1", "localhost"):
+            with pytest.raises(ValueError, match="non-public"):
+                await query_status(host, port, timeout=2.0)
+
+
+@pytest.mark.asyncio
+async def test_scan_catalog_uses_slp_provider(monkeypatch):
+    pytest.importorskip("bittensor")
+    from level114.validator.mechanisms.minecraft import server_scanner
+
+    monkeypatch.setattr(
+        server_scanner, "query_status", functools.partial(query_status, allow_private=True)
+    )
+    server, port = await _start_responder()
+    address = f"127.0.0.1:{port}"
+    async with server:
+        results, metrics, _disabled = await server_scanner.scan_catalog_async(
+            {address: None},
+            logging.getLogger(__name__),
+            disabled_scanners=set(server_scanner.SCANNERS) - {"slp"},
+        )
+    assert results == [
+        {
+            "address": address,
+            "online": True,
+            "players": 7,
+            "max_players": 50,
+            "ping": results[0]["ping"],
+            "scanner": "slp",
+        }
+    ]
+    assert metrics["per_scanner"]["slp"][0] == 1
@@ -0,0 +1,114 @@
+"""Durable vote outbox and its delivery through the vote client."""
+
+import asyncio
+import time
+
+import pytest
+
+from _modules import load_module
+
+_outbox = load_module("level114/validator/mechanisms/minecraft/_vote_outbox.py")
+VoteOutbox = _outbox.VoteOutbox
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    box = VoteOutbox(str(tmp_path / "outbox" / "votes.sqlite3"))
+    yield box
+    box.close()
+
+
+def test_same_verdict_keeps_pending_vote(outbox):
+    key = outbox.enqueue("srv-1", {"score": 0}, fingerprint="zero")
+    assert key is not None
+    assert outbox.enqueue("srv-1", {"score": 0}, fingerprint="zero") is None
+
+    replacement = outbox.enqueue("srv-1", {"score": 1}, fingerprint="one")
+    assert replacement not in (None, key)
+    [vote] = outbox.due(10)
+    assert (vote.idempotency_key, vote.payload, vote.fingerprint) == (replacement, {"score": 1}, "one")
+
+
+def test_reschedule_defers_vote_and_counts_attempts(outbox):
+    key = outbox.enqueue("srv-1", {"score": 0})
+    outbox.reschedule(key, 60.0)
+
+    assert outbox.due(10) == []
+    assert 59.0 < outbox.next_due_in() <= 60.0
+    [vote] = outbox.due(10, now=time.time() + 61.0)
+    assert vote.attempts == 1
+
+
+def test_remove_keeps_newer_verdict_for_same_server(outbox):
+    in_flight = outbox.enqueue("srv-1", {"score": 0}, fingerprint="zero")
+    newer = outbox.enqueue("srv-1", {"score": 1}, fingerprint="one")
+
+    outbox.remove(in_flight)
+    assert [vote.idempotency_key for vote in outbox.due(10)] == [newer]
+
+
+def test_outbox_is_bounded_by_rows_and_age(tmp_path):
+    box = VoteOutbox(str(tmp_path / "votes.sqlite3"), max_rows=3, max_age_seconds=60.0)
+    for index in range(5):
+        box.enqueue(f"srv-{index}", {"score": index})
+    assert len(box) == 3
+    assert {vote.server_id for vote in box.due(10)} == {"srv-2", "srv-3", "srv-4"}
+
+    assert box.expire(now=box.due(1)[0].created_at + 61.0) == 3
+    assert len(box) == 0
+    assert box.next_due_in() is None
+    box.close()
+
+
+def test_pending_votes_survive_reopen(tmp_path):
+    path = str(tmp_path / "votes.sqlite3")
+    box = VoteOutbox(path)
+    key = box.enqueue("srv-1", {"score": 0}, fingerprint="zero")
+    box.close()
+
+    reopened = VoteOutbox(path)
+    assert [vote.idempotency_key for vote in reopened.due(10)] == [key]
+    assert reopened.enqueue("srv-1", {"score": 0}, fingerprint="zero") is None
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_vote_client_delivers_outbox_to_fake_collector(tmp_path):
+    pytest.importorskip("bittensor")
+    from level114.api import AsyncCollectorCenterAPI, CollectorCenterAPI
+    from level114.api.fake_collector import (
+        FakeCollector,
+        FakeCollectorConfig,
+        FakeCollectorTransport,
+    )
+    from level114.validator.mechanisms.minecraft._voting_client import VoteClient
+
+    fake = FakeCollector(FakeCollectorConfig(servers=10))
+    api = CollectorCenterAPI(
+        "http://fake", api_key="k", transport=FakeCollectorTransport(fake), rate_limit=0
+    )
+    client = VoteClient(
+        api,
+        "validator-test/1.0",
+        async_collector_api=AsyncCollectorCenterAPI(api),
+        rate_limit=0,
+        outbox=VoteOutbox(str(tmp_path / "votes.sqlite3")),
+    )
+    votes = [
+        (server_id, {"score": 0, "zero_reason": "scanner_offline", "scanner": {"online": False}})
+        for server_id in fake.server_ids
+    ]
+
+    summary = await client.submit_votes(votes)
+    assert (summary["submitted"], summary["queued"], summary["errors"]) == (10, 10, 0)
+    for _ in range(100):
+        if not len(client.outbox):
+            break
+        await asyncio.sleep(0.02)
+    assert len(client.outbox) == 0
+    assert set(fake.votes) == set(fake.server_ids)
+
+    summary = await client.submit_votes(votes)
+    assert summary["suppressed"] == 10 and summary["submitted"] == 0
+    assert summary["outbox_delivered"] == 10 and summary["outbox_failed"] == 0
+    await client.close()